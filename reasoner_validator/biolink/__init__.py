@@ -1,9 +1,12 @@
 """
 Version-specific Biolink Model semantic validation of knowledge graph components.
 """
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Dict, List, Tuple, FrozenSet, Callable
 from numbers import Number
 from functools import lru_cache
+from json import dumps
+from concurrent.futures import ProcessPoolExecutor, Future
+from threading import Lock
 import re
 from urllib.error import HTTPError
 from pprint import PrettyPrinter
@@ -13,8 +16,10 @@ from bmt import Toolkit, utils
 from linkml_runtime.linkml_model import ClassDefinition, Element
 
 from reasoner_validator.versioning import SemVer, SemVerError
+from reasoner_validator.biolink.index import BiolinkIndex, BiolinkElementInfo, QualifierVerdict, get_biolink_index
+from reasoner_validator.biolink import parallel
 from reasoner_validator.message import MESSAGES_BY_TARGET
-from reasoner_validator.trapi import TRAPISchemaValidator
+from reasoner_validator.trapi import TRAPISchemaValidator, DEFAULT_MAX_SCHEMA_ERRORS
 from reasoner_validator.report import TRAPIGraphType
 
 import logging
@@ -25,6 +30,11 @@ pp = PrettyPrinter(indent=4)
 
 CURIE_PATTERN = re.compile(r"^[^ <()>:]*:[^/ :]+$")
 
+# Placeholders of the identifier and provenance 'source trail'
+# of the current edge, in memoized edge validation messages
+_EDGE_ID = object()
+_SOURCE_TRAIL = object()
+
 
 def is_curie(s: str) -> bool:
     """
@@ -90,9 +100,11 @@ def _get_biolink_model_schema(biolink_version: Optional[str] = None) -> Optional
         return None
 
 
-# At any given time, only a modest number of Biolink Model versions
-# are expected to be active targets for SRI Test validations?
-@lru_cache(maxsize=3)
+# Concurrent (threaded) validators of a given Biolink Model release rather
+# wait for, then share, the (costly) Toolkit loaded by the first of them
+_toolkit_lock = Lock()
+
+
 def get_biolink_model_toolkit(biolink_version: Optional[str] = None) -> Toolkit:
     """
     Return Biolink Model Toolkit corresponding to specified version of the model (Default: current 'latest' version).
@@ -103,6 +115,14 @@ def get_biolink_model_toolkit(biolink_version: Optional[str] = None) -> Toolkit:
     :rtype: Toolkit
 
     """
+    with _toolkit_lock:
+        return _get_biolink_model_toolkit(biolink_version)
+
+
+# At any given time, only a modest number of Biolink Model versions
+# are expected to be active targets for SRI Test validations?
+@lru_cache(maxsize=3)
+def _get_biolink_model_toolkit(biolink_version: Optional[str] = None) -> Toolkit:
     if biolink_version:
         # If errors occur while instantiating non-default Toolkit;
         # then log the error but just use default as a workaround?
@@ -121,6 +141,7 @@ def get_biolink_model_toolkit(biolink_version: Optional[str] = None) -> Toolkit:
 class BMTWrapper:
     def __init__(self, biolink_version: Optional[str] = None):
         self.bmt: Optional[Toolkit] = None
+        self.bmi: Optional[BiolinkIndex] = None
         self.default_biolink: bool = False
         if biolink_version != "suppress":
             # Here, the Biolink Model version is validated, and the relevant Toolkit pulled.
@@ -149,10 +170,20 @@ class BMTWrapper:
         self.biolink_version = version
         if self.biolink_version != "suppress":
             self.bmt = get_biolink_model_toolkit(biolink_version=version)
+            self.bmi = None
 
     def get_bmt(self) -> Optional[Toolkit]:
         return self.bmt
 
+    def get_bmi(self) -> Optional[BiolinkIndex]:
+        """
+        :return: Optional[BiolinkIndex], precomputed lookup index of the Biolink
+                 Model version of the Toolkit; None if Biolink validation is suppressed
+        """
+        if self.bmi is None and self.bmt is not None:
+            self.bmi = get_biolink_index(self.bmt)
+        return self.bmi
+
     def is_symmetric(self, name: str) -> bool:
         """
         Checks if a given element identified by name, is a symmetric (predicate) slot.
@@ -162,7 +193,7 @@ class BMTWrapper:
         # TODO: perhaps this method ought to be in the Biolink Model Toolkit?
         if not name:
             return False
-        element: Optional[Element] = self.bmt.get_element(name)
+        element: Optional[Element] = self.get_bmi().get_element(name)
         if element is not None and element['symmetric']:
             return True
         else:
@@ -175,9 +206,9 @@ class BMTWrapper:
         :return: CURIE string of inverse predicate, if it exists; None otherwise
         """
         # TODO: perhaps this method ought to be in the Biolink Model Toolkit?
-        if predicate and self.bmt.is_predicate(predicate):
+        if predicate and self.get_bmi().is_predicate(predicate):
             predicate_name = utils.parse_name(predicate)
-            inverse_predicate_name = self.bmt.get_inverse(predicate_name)
+            inverse_predicate_name = self.get_bmi().get_inverse(predicate_name)
             if not inverse_predicate_name:
                 if self.is_symmetric(predicate_name):
                     inverse_predicate_name = predicate_name
@@ -185,7 +216,7 @@ class BMTWrapper:
                     inverse_predicate_name = None
 
             if inverse_predicate_name:
-                ip = self.bmt.get_element(inverse_predicate_name)
+                ip = self.get_bmi().get_element(inverse_predicate_name)
                 return utils.format_element(ip)
         return None
 
@@ -201,7 +232,15 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         trapi_version: Optional[str] = None,
         biolink_version: Optional[str] = None,
         target_provenance: Optional[Dict[str, str]] = None,
-        strict_validation: Optional[bool] = None
+        strict_validation: Optional[bool] = None,
+        all_schema_errors: bool = False,
+        max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS,
+        schema_backend: str = "jsonschema",
+        biolink_workers: int = 0,
+        message_store: str = "nested",
+        max_code_messages: int = 0,
+        max_identifier_messages: int = 0,
+        counts_only: bool = False
     ):
         """
         Biolink Validator constructor.
@@ -215,6 +254,22 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         :param target_provenance: Optional[Dict[str,str]], Dictionary of context ARA and KP for provenance validation
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error';  False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
+        :param all_schema_errors: bool = False, if True, report all the TRAPI schema validation errors of a
+                                  TRAPI component, grouped by schema path, rather than only the most relevant one.
+        :param max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS, maximum number of schema validation errors
+                                  traversed per TRAPI component when 'all_schema_errors' is True (zero: no limit).
+        :param schema_backend: str = "jsonschema", TRAPI schema validation backend, "jsonschema" or "compiled"
+                               (faster validation functions compiled from the TRAPI schemata).
+        :param biolink_workers: int = 0, if greater than one, the number of worker processes sharing the
+                                Biolink Model validation of the nodes and edges of large Knowledge Graphs,
+                                with the same outcome as their (default) serial validation.
+        :param message_store: str = "nested", storage of the validation messages, "nested" or "columnar"
+                              (compact storage of very large numbers of messages, see ValidationReporter).
+        :param max_code_messages: int = 0, maximum number of identified messages recorded per code, beyond which
+                                  they are only counted (Default: 0, no limit; see ValidationReporter).
+        :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier,
+                                        beyond which they are only counted (Default: 0, no limit).
+        :param counts_only: bool = False, if True, identified messages are only counted, by code.
 
         """
         BMTWrapper.__init__(self, biolink_version=biolink_version)
@@ -223,9 +278,17 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             default_test=default_test,
             default_target=default_target if default_target else f"Biolink Validation",
             trapi_version=trapi_version,
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            all_schema_errors=all_schema_errors,
+            max_schema_errors=max_schema_errors,
+            schema_backend=schema_backend,
+            message_store=message_store,
+            max_code_messages=max_code_messages,
+            max_identifier_messages=max_identifier_messages,
+            counts_only=counts_only
         )
         self.target_provenance: Optional[Dict] = target_provenance
+        self.biolink_workers: int = biolink_workers
 
         # the internal 'nodes' dictionary, indexed by 'node_id' key, tracks
         # the associated Biolink Model node categories, plus a usage count for the node_id key
@@ -234,6 +297,14 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         # predicate flag assessing completeness of individual TRAPI Responses
         self._has_valid_qnode_information: bool = False
 
+        # Outcomes of Biolink Model validations of edges, indexed by the edge 'signature' of their
+        # inputs, with validation messages to be replayed (see memoized_edge_validation())
+        self._edge_memo: Dict[str, Tuple[Any, List[Tuple[str, Optional[str], Optional[str], Any, Dict]]]] = dict()
+        self._edge_recordings: List[List[Tuple[str, Optional[str], Optional[str], Any, Dict]]] = list()
+        self._edge_memo_recording: Optional[List[Tuple[str, Optional[str], Optional[str], Any, Dict]]] = None
+
+        self._resolve_biolink_features()
+
     def get_biolink_version(self) -> str:
         """
         :return: Biolink Model version currently tracked by the TRAPISchemaValidator.
@@ -248,6 +319,40 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         :return: None
         """
         BMTWrapper.reset_biolink_version(self, version)
+        self._resolve_biolink_features()
+        self._edge_memo.clear()
+
+    def _resolve_biolink_features(self):
+        """
+        Resolve the Biolink Model features which depend on the current Biolink Model version, once per
+        (re)setting of the version, rather than comparing SemVers each time that the features are checked
+        during validation. All features are unset when Biolink Model validation is suppressed.
+        :return: None
+        """
+        validate_biolink: bool = self.validate_biolink()
+
+        # Translator canonical predicates, from Biolink Model release 2.2.0 onwards
+        self.biolink_has_canonical_predicates: bool = \
+            validate_biolink and self.minimum_required_biolink_version("2.2.0")
+
+        # Mandatory 'knowledge_level' and 'agent_type' edge attributes, from Biolink Model release 4.2.0 onwards
+        self.biolink_requires_knowledge_level: bool = \
+            validate_biolink and self.minimum_required_biolink_version("4.2.0")
+
+        # PREDICATE_INCLUSIONS only apply prior to Biolink Model release 4.2.1
+        self.biolink_predicate_inclusions_active: bool = \
+            not (validate_biolink and self.minimum_required_biolink_version("4.2.1"))
+
+        if self.biolink_requires_knowledge_level:
+            self._attribute_type_exclusions: List[str] = list()
+        else:
+            # 13-July-2023: Certain attribute_type_id's are slated for future implementation in the Biolink Model
+            #               but not in the current model release; however, some teams have started to use the terms.
+            #               We therefore put them on a special "inclusion list" (like the CATEGORY_INCLUSIONS below)
+            #               to permit them to pass through the validation without any complaints.
+            # Still not defined in Biolink releases prior to "4.2.0'
+            # but sometimes implemented: ignore in validation
+            self._attribute_type_exclusions: List[str] = ["biolink:knowledge_level", "biolink:agent_type"]
 
     def validate_biolink(self) -> bool:
         """
@@ -333,7 +438,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                             # since only they will have associated namespaces
                             if concrete_category:
                                 concrete_category_found: bool = True
-                                possible_subject_categories = self.bmt.get_element_by_prefix(node_id)
+                                possible_subject_categories = self.get_bmi().get_element_by_prefix(node_id)
                                 if possible_subject_categories and \
                                         concrete_category.name in possible_subject_categories:
                                     node_prefix_mapped = True
@@ -422,7 +527,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                                 # actually don't care if Query Graphs don't have at least one concrete category...
                                 if category:
                                     for identifier in node_ids:  # may be empty list if not provided...
-                                        possible_subject_categories = self.bmt.get_element_by_prefix(identifier)
+                                        possible_subject_categories = self.get_bmi().get_element_by_prefix(identifier)
                                         if category.name in possible_subject_categories:
                                             id_prefix_mapped[identifier] = True
 
@@ -473,6 +578,13 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         """
         return list(self.nodes.keys())
 
+    def has_node(self, node_id: str) -> bool:
+        """
+        :param node_id: str, node identifier
+        :return: True if node_id is currently registered
+        """
+        return node_id in self.nodes
+
     def get_node_categories(self, node_id: str) -> Optional[List[str]]:
         """
         Categories by 'node_id'.
@@ -503,8 +615,8 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                only apply graph-type-differential strict validation if 'ignore_graph_type' is False
         :return: Optional[Element], Biolink Element resolved to 'name' if element no validation error; None otherwise.
         """
-        element: Optional[Element] = self.bmt.get_element(identifier)
-        if not element:
+        info: Optional[BiolinkElementInfo] = self.get_bmi().get_info(identifier)
+        if not info:
             self.report(
                 code=f"error.{context}.unknown",
                 source_trail=source_trail,
@@ -513,7 +625,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             )
             return None
 
-        if element.deprecated:
+        if info.deprecated:
             # We won't index the instances where the deprecated element is seen, since we assume that
             # component developers learning about the issue will globally fix it in their graphs
             self.report(
@@ -523,7 +635,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             )
             # return None - a deprecated term is not treated as a failure but just as a warning
 
-        if element.abstract:
+        if info.abstract:
             if self.is_strict_validation(graph_type):
                 self.report(
                     code=f"error.{context}.abstract",
@@ -540,7 +652,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     edge_id=edge_id
                 )
 
-        elif self.bmt.is_mixin(identifier):
+        elif info.mixin:
             # A mixin cannot be instantiated ...
             # but can be used in QueryGraphs
             # or when explicitly permitted
@@ -560,7 +672,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     edge_id=edge_id
                 )
 
-        return element
+        return info.element
 
     def get_target_provenance(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
@@ -671,7 +783,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             # that the first slot value was acceptable.
             return True
 
-        slot_element = self.bmt.get_element(f"biolink:{slot_name}")
+        slot_element = self.get_bmi().get_element(f"biolink:{slot_name}")
         assert slot_element, f"No such slot {slot_name} element in Biolink Model release {self.biolink_version}"
 
         # Note: we don't need to check for empty attribute.values
@@ -680,9 +792,9 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         # Validate slot value here against the specified slot range Enum
         if "range" in slot_element and slot_element.range:
             value_range = slot_element.range
-            if value_range and self.bmt.is_enum(value_range):
-                enum = self.bmt.view.get_enum(value_range)
-                if not self.bmt.is_permissible_value_of_enum(enum.name, value):
+            permissible_values: Optional[FrozenSet[str]] = self.get_bmi().get_permissible_values(value_range)
+            if permissible_values is not None:
+                if not (isinstance(value, str) and value in permissible_values):
                     self.report(
                         code=f"error.knowledge_graph.edge.{slot_name}.invalid",
                         identifier=str(value),
@@ -735,16 +847,78 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         return self.validate_slot_value(slot_name="agent_type", context=edge_id, found=found, value=value)
 
     def get_attribute_type_exclusions(self) -> List[str]:
-        if self.minimum_required_biolink_version("4.2.0"):
-            return list()
-        else:
-            # 13-July-2023: Certain attribute_type_id's are slated for future implementation in the Biolink Model
-            #               but not in the current model release; however, some teams have started to use the terms.
-            #               We therefore put them on a special "inclusion list" (like the CATEGORY_INCLUSIONS below)
-            #               to permit them to pass through the validation without any complaints.
-            # Still not defined in Biolink releases prior to "4.2.0'
-            # but sometimes implemented: ignore in validation
-            return ["biolink:knowledge_level", "biolink:agent_type"]
+        return self._attribute_type_exclusions
+
+    def validate_attribute_type_id(
+            self,
+            graph_type: TRAPIGraphType,
+            edge_id: str,
+            attribute_type_id: str,
+            source_trail: Optional[str] = None
+    ) -> bool:
+        """
+        Validate the Biolink Model 'attribute_type_id' CURIE of a Knowledge Edge Attribute.
+
+        :param graph_type: TRAPIGraphType, type of TRAPI graph component being validated
+        :param edge_id: str, string identifier for the edge (for reporting purposes)
+        :param attribute_type_id: str, CURIE of the attribute type
+        :param source_trail: Optional[str], audit trail of knowledge source provenance for a given Edge, as a string.
+        :return: bool, True if the attribute type is a Biolink Model 'association_slot', to be validated further
+        """
+        # 'attribute_type_id' is a CURIE, but how well does it map?
+        prefix = attribute_type_id.split(":", 1)[0]
+        if prefix == 'biolink':
+            # We will skip further validation of terms
+            # in the ATTRIBUTE_TYPE_ID_INCLUSIONS list...
+            if attribute_type_id not in self.get_attribute_type_exclusions():
+
+                # ... but further validate everything else...
+                biolink_class = self.validate_element_status(
+                    graph_type=graph_type,
+                    context="knowledge_graph.edge.attribute.type_id",
+                    identifier=attribute_type_id,
+                    edge_id=edge_id,
+                    source_trail=source_trail
+                )
+                if biolink_class:
+                    if self.get_bmi().is_category(biolink_class.name):
+                        self.report(
+                            code="warning.knowledge_graph.edge.attribute.type_id.is_category",
+                            identifier=attribute_type_id,
+                            edge_id=edge_id,
+                            source_trail=source_trail
+                        )
+                    elif self.get_bmi().is_predicate(biolink_class.name):
+                        self.report(
+                            code="warning.knowledge_graph.edge.attribute.type_id.is_predicate",
+                            identifier=attribute_type_id,
+                            edge_id=edge_id,
+                            source_trail=source_trail
+                        )
+                    elif not self.get_bmi().is_association_slot(attribute_type_id):
+                        self.report(
+                            code="warning.knowledge_graph.edge." +
+                                 "attribute.type_id.not_association_slot",
+                            identifier=attribute_type_id,
+                            edge_id=edge_id,
+                            source_trail=source_trail
+                        )
+                    else:
+                        # attribute_type_id is a Biolink 'association_slot': validate further...
+                        return True
+
+        # if not a Biolink model defined attribute term, at least, check if
+        # the 'attribute_type_id' has a namespace (prefix) known to Biolink.
+        # We won't call it a hard error, but issue a warning
+        elif not self.get_bmi().get_element_by_prefix(attribute_type_id):
+            self.report(
+                code="warning.knowledge_graph.edge." +
+                     "attribute.type_id.non_biolink_prefix",
+                identifier=attribute_type_id,
+                edge_id=edge_id,
+                source_trail=source_trail
+            )
+        return False
 
     def validate_attributes(
             self,
@@ -781,7 +955,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         # if TRAPI 1.3.0 is the validation standard, the 'source_trail' would
         # be undefined here, since we can't figure it out without attributes!
         if 'attributes' not in edge:
-            if self.validate_biolink() and not self.minimum_required_trapi_version("1.4.0-beta"):
+            if self.validate_biolink() and not self.trapi_has_sources:
                 # Note: Only an error for earlier TRAPI versions
                 # since attributes are 'nullable: True' for TRAPI 1.4.0
                 self.report(
@@ -790,7 +964,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     source_trail=source_trail
                 )
         elif not edge['attributes']:
-            if self.validate_biolink() and not self.minimum_required_trapi_version("1.4.0-beta"):
+            if self.validate_biolink() and not self.trapi_has_sources:
                 # Note: Only an error for earlier TRAPI versions
                 # since attributes are 'nullable: True' for TRAPI 1.4.0
                 self.report(
@@ -886,134 +1060,92 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                                     edge_id=edge_id,
                                     source_trail=source_trail
                                 )
-                            elif self.validate_biolink():
-                                # 'attribute_type_id' is a CURIE, but how well does it map?
-                                prefix = attribute_type_id.split(":", 1)[0]
-                                if prefix == 'biolink':
-                                    # We will skip further validation of terms
-                                    # in the ATTRIBUTE_TYPE_ID_INCLUSIONS list...
-                                    if attribute_type_id not in self.get_attribute_type_exclusions():
-
-                                        # ... but further validate everything else...
-                                        biolink_class = self.validate_element_status(
-                                            graph_type=graph_type,
-                                            context="knowledge_graph.edge.attribute.type_id",
-                                            identifier=attribute_type_id,
-                                            edge_id=edge_id,
-                                            source_trail=source_trail
-                                        )
-                                        if biolink_class:
-                                            if self.bmt.is_category(name=biolink_class.name):
-                                                self.report(
-                                                    code="warning.knowledge_graph.edge.attribute.type_id.is_category",
-                                                    identifier=attribute_type_id,
-                                                    edge_id=edge_id,
-                                                    source_trail=source_trail
-                                                )
-                                            elif self.bmt.is_predicate(name=biolink_class.name):
-                                                self.report(
-                                                    code="warning.knowledge_graph.edge.attribute.type_id.is_predicate",
-                                                    identifier=attribute_type_id,
-                                                    edge_id=edge_id,
-                                                    source_trail=source_trail
-                                                )
-                                            elif not self.bmt.is_association_slot(attribute_type_id):
+                            elif self.validate_biolink() and self.memoized_edge_validation(
+                                signature=self.edge_signature("attribute_type_id", graph_type.name, attribute_type_id),
+                                edge_id=edge_id,
+                                source_trail=source_trail,
+                                validation=lambda edge_id, source_trail: self.validate_attribute_type_id(
+                                    graph_type=graph_type,
+                                    edge_id=edge_id,
+                                    attribute_type_id=attribute_type_id,
+                                    source_trail=source_trail
+                                )
+                            ):
+                                # TODO: only check knowledge_source provenance here for now. Are there
+                                #       other association_slots to be validated here too? For example,
+                                #       once new terms with defined value ranges are published in the
+                                #       Biolink Model, then perhaps 'value' validation will be feasible.
+
+                                # Edge provenance tags only recorded in
+                                # Edge attributes prior to TRAPI 1.4.0-beta
+                                if not self.trapi_has_sources:
+
+                                    if attribute_type_id in \
+                                            [
+                                                "biolink:aggregator_knowledge_source",
+                                                "biolink:primary_knowledge_source",
+
+                                                # Note: deprecated since Biolink release 3.0.2
+                                                #       but this is probably caught above in the
+                                                #       'validate_element_status' method predicate
+                                                "biolink:original_knowledge_source"
+                                            ]:
+
+                                        # ... now, check the infores values against various expectations
+                                        for infores in value:
+                                            if not infores.startswith("infores:"):
                                                 self.report(
-                                                    code="warning.knowledge_graph.edge." +
-                                                         "attribute.type_id.not_association_slot",
-                                                    identifier=attribute_type_id,
-                                                    edge_id=edge_id,
-                                                    source_trail=source_trail
+                                                   code="error.knowledge_graph.edge." +
+                                                        "provenance.infores.missing",
+                                                   identifier=str(infores),
+                                                   edge_id=edge_id,
+                                                   source_trail=source_trail
                                                 )
                                             else:
-                                                # attribute_type_id is a Biolink 'association_slot': validate further...
-
-                                                # TODO: only check knowledge_source provenance here for now. Are there
-                                                #       other association_slots to be validated here too? For example,
-                                                #       once new terms with defined value ranges are published in the
-                                                #       Biolink Model, then perhaps 'value' validation will be feasible.
-
-                                                # Edge provenance tags only recorded in
-                                                # Edge attributes prior to TRAPI 1.4.0-beta
-                                                if not self.minimum_required_trapi_version("1.4.0-beta"):
-
-                                                    if attribute_type_id in \
-                                                            [
-                                                                "biolink:aggregator_knowledge_source",
-                                                                "biolink:primary_knowledge_source",
-
-                                                                # Note: deprecated since Biolink release 3.0.2
-                                                                #       but this is probably caught above in the
-                                                                #       'validate_element_status' method predicate
-                                                                "biolink:original_knowledge_source"
-                                                            ]:
-
-                                                        # ... now, check the infores values against various expectations
-                                                        for infores in value:
-                                                            if not infores.startswith("infores:"):
-                                                                self.report(
-                                                                   code="error.knowledge_graph.edge." +
-                                                                        "provenance.infores.missing",
-                                                                   identifier=str(infores),
-                                                                   edge_id=edge_id,
-                                                                   source_trail=source_trail
-                                                                )
-                                                            else:
-                                                                if attribute_type_id == \
-                                                                        "biolink:primary_knowledge_source":
-                                                                    found_primary_knowledge_source.append(infores)
-
-                                                                if ara_source and \
-                                                                   attribute_type_id == \
-                                                                        "biolink:aggregator_knowledge_source" \
-                                                                        and infores == ara_source:
-                                                                    found_ara_knowledge_source = True
-                                                                elif kp_source and \
-                                                                        attribute_type_id == kp_source_type and \
-                                                                        infores == kp_source:
-                                                                    found_kp_knowledge_source = True
-
-                                                # TODO: Defer tracking of the presence of 'biolink:support_graphs'
-                                                #       for specified predicates like 'treats' or its descendants
-                                                # if attribute_type_id == "biolink:support_graphs":
-                                                #     found_support_graphs = False
-
-                                                # We expect at this point that, if 'attribute_type_id' is a
-                                                # 'knowledge_level' or 'agent_type', then the value is a scalar
-                                                value = value[0]
-
-                                                # We won't likely care if 'knowledge_level' or 'agent_type'
-                                                # show up in graphs compliant with Biolink earlier than 4.2.0,
-                                                # but we validate their values anyhow...
-                                                if attribute_type_id == "biolink:knowledge_level":
-                                                    found_knowledge_level = \
-                                                        self.validate_knowledge_level(
-                                                            edge_id=edge_id,
-                                                            found=found_knowledge_level,
-                                                            value=value
-                                                        )
-                                                elif attribute_type_id == "biolink:agent_type":
-                                                    found_agent_type = \
-                                                        self.validate_agent_type(
-                                                            edge_id=edge_id,
-                                                            found=found_agent_type,
-                                                            value=value
-                                                        )
-
-                                # if not a Biolink model defined attribute term, at least, check if
-                                # the 'attribute_type_id' has a namespace (prefix) known to Biolink.
-                                # We won't call it a hard error, but issue a warning
-                                elif not self.bmt.get_element_by_prefix(attribute_type_id):
-                                    self.report(
-                                        code="warning.knowledge_graph.edge." +
-                                             "attribute.type_id.non_biolink_prefix",
-                                        identifier=attribute_type_id,
-                                        edge_id=edge_id,
-                                        source_trail=source_trail
-                                    )
+                                                if attribute_type_id == \
+                                                        "biolink:primary_knowledge_source":
+                                                    found_primary_knowledge_source.append(infores)
+
+                                                if ara_source and \
+                                                   attribute_type_id == \
+                                                        "biolink:aggregator_knowledge_source" \
+                                                        and infores == ara_source:
+                                                    found_ara_knowledge_source = True
+                                                elif kp_source and \
+                                                        attribute_type_id == kp_source_type and \
+                                                        infores == kp_source:
+                                                    found_kp_knowledge_source = True
+
+                                # TODO: Defer tracking of the presence of 'biolink:support_graphs'
+                                #       for specified predicates like 'treats' or its descendants
+                                # if attribute_type_id == "biolink:support_graphs":
+                                #     found_support_graphs = False
+
+                                # We expect at this point that, if 'attribute_type_id' is a
+                                # 'knowledge_level' or 'agent_type', then the value is a scalar
+                                value = value[0]
+
+                                # We won't likely care if 'knowledge_level' or 'agent_type'
+                                # show up in graphs compliant with Biolink earlier than 4.2.0,
+                                # but we validate their values anyhow...
+                                if attribute_type_id == "biolink:knowledge_level":
+                                    found_knowledge_level = \
+                                        self.validate_knowledge_level(
+                                            edge_id=edge_id,
+                                            found=found_knowledge_level,
+                                            value=value
+                                        )
+                                elif attribute_type_id == "biolink:agent_type":
+                                    found_agent_type = \
+                                        self.validate_agent_type(
+                                            edge_id=edge_id,
+                                            found=found_agent_type,
+                                            value=value
+                                        )
+
 
             # Edge provenance tags only recorded in Edge attributes prior to TRAPI 1.4.0-beta
-            if not self.minimum_required_trapi_version("1.4.0-beta") and self.validate_biolink():
+            if not self.trapi_has_sources and self.validate_biolink():
                 # After all the attributes have been scanned,
                 # check for provenance. Treat as warnings for now.
                 # Note that provenance checking is only done when Biolink validation is done
@@ -1029,10 +1161,10 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             # Mandatory 'knowledge_level' and 'agent_type'
             # attributes required in all Biolink Model edges
             # from Biolink Model release 4.2.0 onwards
-            if self.minimum_required_biolink_version("4.2.0"):
+            if self.biolink_requires_knowledge_level:
                 if not found_knowledge_level:
                     # Currently projected to be mandatory only in TRAPI 1.6.0
-                    if self.minimum_required_trapi_version("1.6.0"):
+                    if self.trapi_requires_knowledge_level:
                         self.report(
                             code="error.knowledge_graph.edge.knowledge_level.missing",
                             identifier=edge_id
@@ -1045,7 +1177,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
 
                 if not found_agent_type:
                     # Currently projected to be mandatory only in TRAPI 1.6.0
-                    if self.minimum_required_trapi_version("1.6.0"):
+                    if self.trapi_requires_knowledge_level:
                         self.report(
                             code="error.knowledge_graph.edge.agent_type.missing",
                             identifier=edge_id
@@ -1111,45 +1243,40 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         for qualifier in qualifiers:
             qualifier_type_id: str = qualifier['qualifier_type_id']
             qualifier_value: str = qualifier['qualifier_value']
-            try:
-                if not self.bmt.is_qualifier(name=str(qualifier_type_id)):
-                    self.report(
-                        code=f"error.{context}.qualifier.type_id.unknown",
-                        source_trail=source_trail,
-                        identifier=str(qualifier_type_id),
-                        edge_id=edge_id
-                    )
-                elif qualifier_type_id == "biolink:qualified_predicate":
-                    if not self.bmt.is_predicate(str(qualifier_value)):
-                        # special case of qualifier must have Biolink predicates as values
-                        self.report(
-                            code=f"error.{context}.qualifier.value.not_a_predicate",
-                            source_trail=source_trail,
-                            identifier=str(qualifier_value),
-                            edge_id=edge_id
-                        )
-
-                # A Query Graph miss on qualifier_value is less an issue since there may not be enough
-                # context to resolve the 'qualifier_value'; whereas a Knowledge Graph miss is more severe
-                elif context.startswith("knowledge_graph") and \
-                        not self.bmt.validate_qualifier(
-                            qualifier_type_id=qualifier_type_id,
-                            qualifier_value=str(qualifier_value),
-                            associations=associations
-                        ):
-                    # TODO: to review (as of release  3.8.9) we demoted this validation message to a 'warning',
-                    #       since in most components (Sept 2023), the KP asserted qualifier values are likely
-                    #       reasonable, but the qualifier value curation of the Biolink Model is as yet incomplete
-                    self.report(
-                        code=f"warning.{context}.qualifier.value.unresolved",
-                        source_trail=source_trail,
-                        identifier=str(qualifier_value),
-                        edge_id=edge_id,
-                        qualifier_type_id=str(qualifier_type_id)
-                    )
-            except Exception as e:
-                # broad spectrum exception to trap anticipated short term issues with BMT validation
-                logger.error(f"BMT validate_qualifier Exception: {str(e)}")
+            # A Query Graph miss on qualifier_value is less an issue since there may not be enough
+            # context to resolve the 'qualifier_value'; whereas a Knowledge Graph miss is more severe
+            verdict: QualifierVerdict = self.get_bmi().get_qualifier_verdict(
+                qualifier_type_id=str(qualifier_type_id),
+                qualifier_value=str(qualifier_value),
+                associations=associations,
+                resolve_value=context.startswith("knowledge_graph")
+            )
+            if verdict.outcome == "type_id.unknown":
+                self.report(
+                    code=f"error.{context}.qualifier.type_id.unknown",
+                    source_trail=source_trail,
+                    identifier=str(qualifier_type_id),
+                    edge_id=edge_id
+                )
+            elif verdict.outcome == "value.not_a_predicate":
+                self.report(
+                    code=f"error.{context}.qualifier.value.not_a_predicate",
+                    source_trail=source_trail,
+                    identifier=str(qualifier_value),
+                    edge_id=edge_id
+                )
+            elif verdict.outcome == "value.unresolved":
+                # TODO: to review (as of release  3.8.9) we demoted this validation message to a 'warning',
+                #       since in most components (Sept 2023), the KP asserted qualifier values are likely
+                #       reasonable, but the qualifier value curation of the Biolink Model is as yet incomplete
+                self.report(
+                    code=f"warning.{context}.qualifier.value.unresolved",
+                    source_trail=source_trail,
+                    identifier=str(qualifier_value),
+                    edge_id=edge_id,
+                    qualifier_type_id=str(qualifier_type_id)
+                )
+            elif verdict.outcome == "invalid":
                 self.report(
                     code=f"error.{context}.qualifier.invalid",
                     source_trail=source_trail,
@@ -1158,7 +1285,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     # we coerce qualifier values to strings here, in case
                     # the value is not already a simple string scalar
                     qualifier_value=str(qualifier_value),
-                    reason=str(e)
+                    reason=verdict.reason
                 )
 
     def validate_qualifiers(
@@ -1476,7 +1603,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         """
         # PREDICATE_INCLUSIONS provides for selective override of
         # validation of particular predicates prior to Biolink 4.2.1
-        if self.minimum_required_biolink_version("4.2.1") or \
+        if not self.biolink_predicate_inclusions_active or \
                 predicate not in self.PREDICATE_INCLUSIONS:
 
             graph_type_context: str = graph_type.name.lower()
@@ -1499,15 +1626,15 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 ignore_graph_type=True
             )
             if biolink_class:
-                if not self.bmt.is_predicate(predicate):
+                if not self.get_bmi().is_predicate(predicate):
                     self.report(
                         code=f"error.{context}.invalid",
                         source_trail=source_trail,
                         identifier=predicate,
                         edge_id=edge_id
                     )
-                elif self.minimum_required_biolink_version("2.2.0") and \
-                        not self.bmt.is_translator_canonical_predicate(predicate):
+                elif self.biolink_has_canonical_predicates and \
+                        not self.get_bmi().is_translator_canonical_predicate(predicate):
                     self.report(
                         code=f"warning.{context}.non_canonical",
                         source_trail=source_trail,
@@ -1579,10 +1706,77 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         else:
             return None
 
+    def report(
+            self,
+            code: str,
+            test: Optional[str] = None,
+            target: Optional[str] = None,
+            source_trail: Optional[str] = None,
+            **message
+    ):
+        # messages of a memoized edge validation are only recorded, to be replayed (see memoized_edge_validation())
+        if self._edge_memo_recording is not None:
+            self._edge_memo_recording.append((code, test, target, source_trail, message))
+            return
+        # messages are also recorded for replay, e.g. of validation shards (see reasoner_validator.biolink.parallel)
+        for recording in self._edge_recordings:
+            recording.append((code, test, target, source_trail, message))
+        TRAPISchemaValidator.report(self, code, test=test, target=target, source_trail=source_trail, **message)
+
+    @staticmethod
+    def edge_signature(*values) -> str:
+        """
+        :param values: JSON-like (parts of) edge data, on which some edge validation outcome depends
+        :return: str, hashable signature of the values
+        """
+        return dumps(values, default=str)
+
+    def memoized_edge_validation(
+            self,
+            signature: str,
+            edge_id: str,
+            source_trail: Optional[str],
+            validation: Callable[[Any, Any], Any]
+    ) -> Any:
+        """
+        Memoized Biolink Model validation of a part of an edge. Real knowledge graphs repeat the same few
+        (categories, predicate, qualifiers, attribute types) patterns across thousands of edges, so the validation
+        of a given signature is only run (and its messages recorded) once, with placeholder 'edge_id' and
+        'source_trail' arguments, then replayed for every edge having the same signature, with the
+        'edge_id' and 'source_trail' of the edge substituted for the placeholders.
+
+        :param signature: str, signature of all the inputs of the validation, besides 'edge_id' and 'source_trail'
+        :param edge_id: str, identifier of the edge being validated
+        :param source_trail: Optional[str], audit trail of knowledge source provenance of the edge being validated
+        :param validation: Callable[[Any, Any], Any], validation of the edge, given its 'edge_id' and
+                           'source_trail', reporting messages and returning some result
+        :return: Any, the result of the validation
+        """
+        if signature not in self._edge_memo:
+            recording: List[Tuple[str, Optional[str], Optional[str], Any, Dict]] = list()
+            outer_recording = self._edge_memo_recording
+            self._edge_memo_recording = recording
+            try:
+                result = validation(_EDGE_ID, _SOURCE_TRAIL)
+            finally:
+                self._edge_memo_recording = outer_recording
+            self._edge_memo[signature] = (result, recording)
+
+        result, recording = self._edge_memo[signature]
+        for code, test, target, trail, message in recording:
+            self.report(
+                code,
+                test=test,
+                target=target,
+                source_trail=source_trail if trail is _SOURCE_TRAIL else trail,
+                **{key: edge_id if value is _EDGE_ID else value for key, value in message.items()}
+            )
+        return result
+
     def is_treats(self, predicate: Optional[str]) -> bool:
         if not predicate:
             return False
-        return predicate in self.bmt.get_descendants("treats", formatted=True)
+        return predicate in self.get_bmi().get_descendants("treats")
 
     def validate_graph_edge(self, edge: Dict, graph_type: TRAPIGraphType):
         """
@@ -1629,7 +1823,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
 
             # Edge provenance "sources" field is only recorded
             # as an Edge property, from TRAPI 1.4.0-beta onwards
-            if self.minimum_required_trapi_version("1.4.0-beta"):
+            if self.trapi_has_sources:
                 # For TRAPI 1.4.0, the 'source_trail' is parsed in by 'validate_sources'...
                 source_trail = self.validate_sources(edge_id=edge_id, edge=edge)
 
@@ -1652,21 +1846,25 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 # matching the subject and object categories of the edge.
                 # We don't here filter for empty *_categories, so in some
                 # fringe cases, misleading downstream validation may occur.
-                associations = self.bmt.get_associations(
+                associations = self.get_bmi().get_associations(
                     subject_categories=subject_categories,
                     predicates=predicates,
-                    object_categories=object_categories,
-                    formatted=True
+                    object_categories=object_categories
                 )
 
             # Edge "qualifiers" field is only recorded as an
             # Edge property, from TRAPI 1.3.0-beta onwards
-            if self.minimum_required_trapi_version("1.3.0-beta"):
-                self.validate_qualifiers(
+            if self.trapi_has_qualifiers:
+                self.memoized_edge_validation(
+                    signature=self.edge_signature("qualifiers", edge.get("qualifiers", None), associations),
                     edge_id=edge_id,
-                    edge=edge,
-                    associations=associations,
-                    source_trail=source_trail
+                    source_trail=source_trail,
+                    validation=lambda edge_id, source_trail: self.validate_qualifiers(
+                        edge_id=edge_id,
+                        edge=edge,
+                        associations=associations,
+                        source_trail=source_trail
+                    )
                 )
 
         else:
@@ -1676,7 +1874,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             # Edge "qualifiers" field is only recorded as an
             # Edge property, from TRAPI 1.3.0-beta onwards
             # We don't care about 'source_trail' here, for the Query Graph edges
-            if self.minimum_required_trapi_version("1.3.0-beta"):
+            if self.trapi_has_qualifiers:
                 self.validate_qualifier_constraints(edge_id=edge_id, edge=edge)
 
         # Validate Subject node
@@ -1690,7 +1888,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 identifier=edge_id
             )
 
-        elif subject_id not in self.get_node_identifiers():
+        elif not self.has_node(subject_id):
             self.report(
                 code=f"error.{context}.edge.subject.missing_from_nodes",
                 source_trail=source_trail,
@@ -1710,11 +1908,16 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                     identifier=edge_id
                 )
             elif self.validate_biolink():
-                self.validate_predicate(
+                self.memoized_edge_validation(
+                    signature=self.edge_signature("predicate", graph_type.name, predicate),
                     edge_id=edge_id,
-                    predicate=predicate,
-                    graph_type=graph_type,
-                    source_trail=source_trail
+                    source_trail=source_trail,
+                    validation=lambda edge_id, source_trail: self.validate_predicate(
+                        edge_id=edge_id,
+                        predicate=predicate,
+                        graph_type=graph_type,
+                        source_trail=source_trail
+                    )
                 )
 
         else:  # is a Query Graph...
@@ -1756,7 +1959,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 source_trail=source_trail,
                 identifier=edge_id
             )
-        elif object_id not in self.get_node_identifiers():
+        elif not self.has_node(object_id):
             self.report(
                 code=f"error.{context}.edge.object.missing_from_nodes",
                 source_trail=source_trail,
@@ -1792,18 +1995,19 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
         """
         biolink_class: Optional[ClassDefinition] = None
         if category:
-            biolink_class = self.bmt.get_element(category)
-            if biolink_class:
+            info: Optional[BiolinkElementInfo] = self.get_bmi().get_info(category)
+            if info:
                 # 'category' is known to Biolink... good start!
-                if biolink_class.deprecated:
+                biolink_class = info.element
+                if info.deprecated:
                     self.report(
                         code=f"warning.{context}.node.category.deprecated",
                         identifier=category,
                         node_id=node_id
                     )
-                if biolink_class.abstract or self.bmt.is_mixin(category):
+                if info.abstract or info.mixin:
                     biolink_class = None
-                elif not self.bmt.is_category(category):
+                elif not info.category:
                     self.report(
                         code=f"error.{context}.node.category.not_a_category",
                         identifier=category,
@@ -1832,7 +2036,7 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
                 # Since input edges are used in Query Graphs, we ought not to actually
                 # care if they don't have at least one concrete category...However, it
                 # is unlikely for non-concrete classes to resolve to a TRAPI response containing them!
-                possible_subject_categories = self.bmt.get_element_by_prefix(node_id)
+                possible_subject_categories = self.get_bmi().get_element_by_prefix(node_id)
                 if category.name not in possible_subject_categories:
                     self.report(
                         code="warning.input_edge.node.id.unmapped_to_category",
@@ -1907,14 +2111,103 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             category_name=object_category_curie
         )
 
-    def check_biolink_model_compliance(self, graph: Dict, graph_type: TRAPIGraphType):
+    # Minimum number of nodes or edges per shard of a parallel Knowledge Graph
+    # validation, below which the overhead of the worker processes dominates
+    MIN_SHARD_SIZE: int = 1000
+
+    # Shards per worker process, to balance the worker loads
+    SHARDS_PER_WORKER: int = 4
+
+    def get_worker_settings(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], constructor arguments of the BiolinkValidator
+                 of each worker process of a parallel Knowledge Graph validation
+        """
+        return {
+            "default_test": self.get_default_test(),
+            "default_target": self.get_default_target(),
+            "trapi_version": self.get_trapi_version(),
+            "biolink_version": self.get_biolink_version(),
+            "target_provenance": self.target_provenance,
+            "strict_validation": self.strict_validation,
+            "all_schema_errors": self.all_schema_errors,
+            "max_schema_errors": self.max_schema_errors,
+            "schema_backend": self.schema_backend,
+            "message_store": self.message_store,
+            "max_code_messages": self.max_code_messages,
+            "max_identifier_messages": self.max_identifier_messages,
+            "counts_only": self.counts_only
+        }
+
+    def check_graph_elements_in_parallel(
+            self,
+            nodes: Dict,
+            edges: Optional[Dict],
+            graph_type: TRAPIGraphType,
+            validate_schema: bool
+    ):
+        """
+        Validate the nodes, then the edges, of a Knowledge Graph, sharded across a pool of 'biolink_workers'
+        worker processes. The validation messages of the shards are reported in graph order, and node usage
+        counts merged, such that the outcome is the same as the serial validation of the Knowledge Graph.
+
+        :param nodes: Dict, (non-empty) nodes of the graph to be validated
+        :param edges: Optional[Dict], edges of the graph to be validated
+        :param graph_type: TRAPIGraphType, component type of TRAPI graph to be validated
+        :param validate_schema: bool, if True, each node and edge is also validated against the TRAPI schema
+        """
+        # node validation doesn't depend on the recorded nodes,
+        # which are rather needed by the workers for edge validation
+        self.set_nodes(nodes)
+
+        number_of_elements: int = max(len(nodes), len(edges) if edges else 0)
+        shard_size: int = max(
+            self.MIN_SHARD_SIZE,
+            -(-number_of_elements // (self.biolink_workers * self.SHARDS_PER_WORKER))
+        )
+        with ProcessPoolExecutor(
+            max_workers=self.biolink_workers,
+            initializer=parallel.init_worker,
+            initargs=(
+                BiolinkValidator,
+                self.get_worker_settings(),
+                {node_id: entry[0] for node_id, entry in self.nodes.items()}
+            )
+        ) as executor:
+            shards: List[Future] = [
+                executor.submit(parallel.validate_shard, graph_type, "Node", elements, validate_schema)
+                for elements in parallel.shard(nodes, shard_size)
+            ]
+            if edges:
+                shards.extend(
+                    executor.submit(parallel.validate_shard, graph_type, "Edge", elements, validate_schema)
+                    for elements in parallel.shard(edges, shard_size)
+                )
+            for future in shards:
+                recording, node_usage = future.result()
+                for code, test, target, source_trail, message in recording:
+                    self.report(code, test=test, target=target, source_trail=source_trail, **message)
+                for node_id, count in node_usage.items():
+                    self.nodes[node_id][1] += count
+
+    def check_biolink_model_compliance(self, graph: Dict, graph_type: TRAPIGraphType, validate_schema: bool = False):
         """
         Validate a TRAPI-schema compliant Message graph-like data structure
         against the currently active Biolink Model Toolkit model version.
 
         :param graph: Dict, knowledge graph to be validated
         :param graph_type: TRAPIGraphType, component type of TRAPI graph to be validated
+        :param validate_schema: bool, if True, each Knowledge Graph node and edge is also validated against
+                                the TRAPI schema, in the same pass as its Biolink Model validation (Default: False)
         """
+        # individual TRAPI schema validation of nodes and edges is only done for Knowledge Graphs
+        validate_schema = validate_schema and graph_type is TRAPIGraphType.Knowledge_Graph
+        if validate_schema:
+            self.is_valid_trapi_graph_skeleton(graph=graph, component="KnowledgeGraph")
+
+        # memoized edge validations are only reused within a given graph
+        self._edge_memo.clear()
+
         if not graph:
             self.report(code="warning.graph.empty", identifier=graph_type.value)
             return  # nothing really more to do here!
@@ -1940,19 +2233,39 @@ class BiolinkValidator(TRAPISchemaValidator, BMTWrapper):
             edges = None
 
         self.reset_node_info(graph_type=graph_type)
-        if nodes:
-            for node_id, details in nodes.items():
-                self.validate_graph_node(node_id, details, graph_type=graph_type)
-
-            # A dictionary of instances of 'node_id', associated 'categories' plus an
-            # internal counter, are needed for the subsequent edge validation processes
-            self.set_nodes(nodes)
-
-            if edges:
-                for edge in edges.values():
+        if self.biolink_workers > 1 and graph_type is TRAPIGraphType.Knowledge_Graph and nodes and \
+                max(len(nodes), len(edges) if edges else 0) > self.MIN_SHARD_SIZE:
+            self.check_graph_elements_in_parallel(nodes, edges, graph_type=graph_type, validate_schema=validate_schema)
+        else:
+            if nodes:
+                for node_id, details in nodes.items():
+                    if validate_schema:
+                        self.is_valid_trapi_graph_element(node_id, details, element_type="Node")
+                        if not isinstance(details, Dict):
+                            continue
+                    self.validate_graph_node(node_id, details, graph_type=graph_type)
+
+                # A dictionary of instances of 'node_id', associated 'categories' plus an
+                # internal counter, are needed for the subsequent edge validation processes
+                self.set_nodes(nodes)
+
+            if edges and (nodes or validate_schema):
+                for edge_id, edge in edges.items():
+                    if validate_schema:
+                        self.is_valid_trapi_graph_element(edge_id, edge, element_type="Edge")
+                        if not (nodes and isinstance(edge, Dict)):
+                            continue
                     # print(f"{str(edge)}", flush=True)
                     self.validate_graph_edge(edge, graph_type=graph_type)
 
+        self.report_node_usage(graph_type=graph_type)
+
+    def report_node_usage(self, graph_type: TRAPIGraphType):
+        """
+        Report uninformative and dangling nodes of a graph, once all its nodes and edges are validated.
+
+        :param graph_type: TRAPIGraphType, component type of TRAPI graph validated
+        """
         if not self.has_valid_node_information(graph_type=graph_type):
             self.report(code=f"error.{graph_type.label()}.nodes.uninformative")
 
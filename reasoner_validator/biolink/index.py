@@ -0,0 +1,373 @@
+"""
+Precomputed lookup index of a Biolink Model release.
+
+The Biolink Model Toolkit resolves each query (e.g. 'is_category' or 'get_element_by_prefix')
+through the linkml SchemaView, caching results only per exact query argument. Since validation
+asks the same handful of questions about every node, edge and attribute of a TRAPI message, and
+node identifiers are mostly distinct, all answers needed by the validator are rather compiled
+once per Biolink Model release into plain dictionaries and (frozen) sets, for constant time lookup.
+"""
+from typing import Optional, Dict, List, Tuple, FrozenSet, NamedTuple
+from functools import lru_cache
+from threading import Lock, RLock
+
+from bmt import Toolkit, utils
+from bmt.toolkit import NAMED_THING, RELATED_TO, ASSOCIATION_SLOT
+from linkml_runtime.linkml_model import ClassDefinition, SlotDefinition, Definition, Element
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class BiolinkElementInfo(NamedTuple):
+    """
+    Precomputed properties of one Biolink Model element.
+    Ancestor and descendant sets are of (reflexive) element CURIEs.
+    """
+    element: Element
+    curie: str
+    abstract: bool
+    mixin: bool
+    deprecated: bool
+    category: bool
+    predicate: bool
+    association_slot: bool
+    canonical_predicate: bool
+    ancestors: FrozenSet[str]
+    is_a_ancestors: FrozenSet[str]
+    descendants: FrozenSet[str]
+
+
+class QualifierVerdict(NamedTuple):
+    """
+    Outcome of the validation of an edge qualifier: None if valid, otherwise
+    "type_id.unknown", "value.not_a_predicate", "value.unresolved" or, if the
+    Toolkit raised an exception while validating the qualifier, "invalid".
+    """
+    outcome: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class BiolinkIndex:
+    """
+    Immutable index of the elements, identifier prefixes and enumerations of a Biolink Model release.
+    Lookups are safe for concurrent (threaded) validators sharing the index: the (shared) Toolkit is
+    only queried, and its answers memoized, while holding the lock of the index, whereas precomputed
+    or already memoized answers are simply read, memoized answers being only ever added.
+    """
+    # Bound on the number of (non-canonical) names memoized from
+    # the Toolkit, since such names come from validated data
+    MAX_ALIASES: int = 100000
+
+    # Bound on the number of memoized association lookups, i.e. of distinct
+    # (subject categories, predicates, object categories) combinations
+    ASSOCIATIONS_CACHE_SIZE: int = 4096
+
+    # Bound on the number of memoized verdicts of distinct
+    # (qualifier_type_id, qualifier_value, associations) combinations
+    QUALIFIER_CACHE_SIZE: int = 16384
+
+    def __init__(self, bmt: Toolkit):
+        """
+        :param bmt: Toolkit, Biolink Model Toolkit of the release to be indexed
+        """
+        self.bmt: Toolkit = bmt
+        self.biolink_version: str = bmt.get_model_version()
+
+        # serializes the Toolkit queries of concurrent validators (reentrant, since a
+        # qualifier validation may itself resolve names of elements, see get_info())
+        self._lock = RLock()
+
+        self._elements: Dict[str, BiolinkElementInfo] = dict()
+        for name, element in bmt.view.all_elements().items():
+            self._elements[name] = self._describe(element)
+
+        # names, CURIEs and any other names of elements, as resolved by the Toolkit
+        self._aliases: Dict[str, Optional[BiolinkElementInfo]] = dict()
+        for name, info in self._elements.items():
+            if utils.parse_name(name) == name:
+                self._aliases[name] = info
+            if isinstance(info.element, (ClassDefinition, SlotDefinition)):
+                self._aliases[info.curie] = info
+
+        prefixes: Dict[str, List[str]] = dict()
+        for name in bmt.get_all_elements():
+            element: Optional[Element] = bmt.get_element(name)
+            for prefix in getattr(element, "id_prefixes", None) or list():
+                prefixes.setdefault(prefix, list()).append(element.name)
+        self._categories_by_prefix: Dict[str, Tuple[str, ...]] = {
+            prefix: tuple(names) for prefix, names in prefixes.items()
+        }
+
+        self._enums: Dict[str, FrozenSet[str]] = {
+            name: frozenset(enum.permissible_values.keys()) for name, enum in bmt.view.all_enums().items()
+        }
+
+        # Association lookups walk all the Association classes of the model, hence are
+        # memoized, on demand, since there are too many argument combinations to precompute
+        self._get_associations = lru_cache(maxsize=self.ASSOCIATIONS_CACHE_SIZE)(self._lookup_associations)
+
+        # Likewise, for qualifier verdicts, which may resolve enum ranges and ontology subtrees
+        self._get_qualifier_verdict = lru_cache(maxsize=self.QUALIFIER_CACHE_SIZE)(self._validate_qualifier)
+
+    def _describe(self, element: Element) -> BiolinkElementInfo:
+        ancestors: List[str] = list()
+        is_a_ancestors: List[str] = list()
+        descendants: List[str] = list()
+        if isinstance(element, (ClassDefinition, SlotDefinition)):
+            ancestors = self.bmt.get_ancestors(element.name, mixin=True)
+            is_a_ancestors = self.bmt.get_ancestors(element.name, formatted=True, mixin=False)
+            descendants = self.bmt.get_descendants(element.name, formatted=True)
+        predicate: bool = RELATED_TO in ancestors
+        return BiolinkElementInfo(
+            element=element,
+            curie=utils.format_element(element),
+            abstract=bool(getattr(element, "abstract", False)),
+            mixin=bool(element.mixin) if isinstance(element, Definition) else False,
+            deprecated=bool(element.deprecated),
+            category=NAMED_THING in ancestors,
+            predicate=predicate,
+            association_slot=ASSOCIATION_SLOT in ancestors,
+            canonical_predicate=predicate and "canonical_predicate" in element.annotations,
+            ancestors=frozenset(self.bmt.get_ancestors(element.name, formatted=True, mixin=True)),
+            is_a_ancestors=frozenset(is_a_ancestors),
+            descendants=frozenset(descendants)
+        )
+
+    def get_info(self, name: str) -> Optional[BiolinkElementInfo]:
+        """
+        :param name: str, name, CURIE or alias of a Biolink Model element
+        :return: Optional[BiolinkElementInfo], precomputed properties of the element; None if unknown
+        """
+        if name in self._aliases:
+            return self._aliases[name]
+
+        # Any other name of an element is resolved (once) by the Toolkit
+        with self._lock:
+            if name in self._aliases:
+                return self._aliases[name]
+            info: Optional[BiolinkElementInfo] = None
+            element: Optional[Element] = self.bmt.get_element(name)
+            if element is not None:
+                info = self._elements.get(element.name, None) or self._describe(element)
+            if len(self._aliases) < self.MAX_ALIASES:
+                self._aliases[name] = info
+            return info
+
+    def get_element(self, name: str) -> Optional[Element]:
+        """
+        :param name: str, name, CURIE or alias of a Biolink Model element
+        :return: Optional[Element], the Biolink Model element; None if unknown
+        """
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info.element if info is not None else None
+
+    def is_mixin(self, name: str) -> bool:
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info is not None and info.mixin
+
+    def is_category(self, name: str) -> bool:
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info is not None and info.category
+
+    def is_predicate(self, name: str) -> bool:
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info is not None and info.predicate
+
+    def is_translator_canonical_predicate(self, name: str) -> bool:
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info is not None and info.canonical_predicate
+
+    def is_association_slot(self, name: str) -> bool:
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        return info is not None and info.association_slot
+
+    def get_ancestors(self, name: str, mixin: bool = True) -> FrozenSet[str]:
+        """
+        :param name: str, name, CURIE or alias of a Biolink Model element
+        :param mixin: bool, if True (default), then mixin ancestors are included, in addition to 'is_a' ancestors
+        :return: FrozenSet[str], CURIEs of the (reflexive) ancestors of the element; empty if the element is unknown
+        """
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        if info is None:
+            return frozenset()
+        return info.ancestors if mixin else info.is_a_ancestors
+
+    def get_descendants(self, name: str) -> FrozenSet[str]:
+        """
+        :param name: str, name, CURIE or alias of a Biolink Model element
+        :return: FrozenSet[str], CURIEs of the (reflexive) descendants of the element, including mixin descendants
+        :raises ValueError: if the element is unknown (like Toolkit.get_descendants())
+        """
+        info: Optional[BiolinkElementInfo] = self.get_info(name)
+        if info is None:
+            raise ValueError("not a valid biolink component")
+        return info.descendants
+
+    def get_inverse(self, name: str) -> Optional[str]:
+        """
+        :param name: str, name of a Biolink Model predicate
+        :return: Optional[str], name of the inverse of the predicate, as given by the Toolkit; None if none
+        """
+        with self._lock:
+            return self.bmt.get_inverse(name)
+
+    def get_element_by_prefix(self, identifier: str) -> Tuple[str, ...]:
+        """
+        :param identifier: str, CURIE of a concept
+        :return: Tuple[str, ...], names of the Biolink Model elements having
+                 the namespace prefix of the identifier among their 'id_prefixes'
+        """
+        if ":" not in identifier:
+            return tuple()
+        return self._categories_by_prefix.get(identifier.split(":", 1)[0], tuple())
+
+    def get_permissible_values(self, enum_name: str) -> Optional[FrozenSet[str]]:
+        """
+        :param enum_name: str, name (or CURIE) of a Biolink Model enumeration
+        :return: Optional[FrozenSet[str]], permissible values of the enumeration; None if not an enumeration
+        """
+        if ":" in enum_name:
+            enum_name = enum_name.split(":")[1]
+        return self._enums.get(enum_name, None)
+
+    def _lookup_associations(
+            self,
+            subject_categories: Optional[Tuple[str, ...]],
+            predicates: Optional[Tuple[str, ...]],
+            object_categories: Optional[Tuple[str, ...]]
+    ) -> Tuple[str, ...]:
+        with self._lock:
+            return tuple(
+                self.bmt.get_associations(
+                    subject_categories=list(subject_categories) if subject_categories is not None else None,
+                    predicates=list(predicates) if predicates is not None else None,
+                    object_categories=list(object_categories) if object_categories is not None else None,
+                    formatted=True
+                )
+            )
+
+    def get_associations(
+            self,
+            subject_categories: Optional[List[str]] = None,
+            predicates: Optional[List[str]] = None,
+            object_categories: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Memoized Toolkit.get_associations(), shared by all validators of the Biolink Model release.
+
+        :param subject_categories: Optional[List[str]], node categories (CURIEs) of the subject node
+        :param predicates: Optional[List[str]], edge predicates (CURIEs)
+        :param object_categories: Optional[List[str]], node categories (CURIEs) of the object node
+        :return: List[str], CURIEs of the matching biolink:Association subclasses
+        """
+        try:
+            return list(
+                self._get_associations(
+                    tuple(subject_categories) if subject_categories is not None else None,
+                    tuple(predicates) if predicates is not None else None,
+                    tuple(object_categories) if object_categories is not None else None
+                )
+            )
+        except TypeError:
+            # unhashable (i.e. malformed) categories or predicates are simply not memoized
+            with self._lock:
+                return self.bmt.get_associations(
+                    subject_categories=subject_categories,
+                    predicates=predicates,
+                    object_categories=object_categories,
+                    formatted=True
+                )
+
+    def get_associations_cache_info(self) -> NamedTuple:
+        """
+        :return: NamedTuple, (functools.lru_cache) statistics of the association cache:
+                 'hits', 'misses', 'maxsize' and 'currsize'
+        """
+        return self._get_associations.cache_info()
+
+    def _validate_qualifier(
+            self,
+            qualifier_type_id: str,
+            qualifier_value: str,
+            associations: Optional[Tuple[str, ...]],
+            resolve_value: bool
+    ) -> QualifierVerdict:
+        with self._lock:
+            try:
+                if not self.bmt.is_qualifier(name=qualifier_type_id):
+                    return QualifierVerdict(outcome="type_id.unknown")
+                elif qualifier_type_id == "biolink:qualified_predicate":
+                    # special case of qualifier must have Biolink predicates as values
+                    if not self.is_predicate(qualifier_value):
+                        return QualifierVerdict(outcome="value.not_a_predicate")
+                elif resolve_value and \
+                        not self.bmt.validate_qualifier(
+                            qualifier_type_id=qualifier_type_id,
+                            qualifier_value=qualifier_value,
+                            associations=list(associations) if associations is not None else None
+                        ):
+                    return QualifierVerdict(outcome="value.unresolved")
+            except Exception as e:
+                # broad spectrum exception to trap anticipated short term issues with BMT validation,
+                # cached like any other verdict, such that a failing qualifier is not retried
+                logger.error(f"BMT validate_qualifier Exception: {str(e)}")
+                return QualifierVerdict(outcome="invalid", reason=str(e))
+            return QualifierVerdict()
+
+    def get_qualifier_verdict(
+            self,
+            qualifier_type_id: str,
+            qualifier_value: str,
+            associations: Optional[List[str]] = None,
+            resolve_value: bool = True
+    ) -> QualifierVerdict:
+        """
+        Memoized validation of an edge qualifier, shared by all validators of the Biolink Model release.
+
+        :param qualifier_type_id: str, CURIE of the qualifier type
+        :param qualifier_value: str, value of the qualifier
+        :param associations: Optional[List[str]], Biolink association subclasses possibly related to the edge
+        :param resolve_value: bool, if True (default), qualifier values other than predicates are resolved
+                              against their value range (e.g. for knowledge graph edges)
+        :return: QualifierVerdict, outcome of the validation
+        """
+        return self._get_qualifier_verdict(
+            qualifier_type_id,
+            qualifier_value,
+            tuple(associations) if associations is not None else None,
+            resolve_value
+        )
+
+    def get_qualifier_cache_info(self) -> NamedTuple:
+        """
+        :return: NamedTuple, (functools.lru_cache) statistics of the qualifier verdict cache:
+                 'hits', 'misses', 'maxsize' and 'currsize'
+        """
+        return self._get_qualifier_verdict.cache_info()
+
+
+# Indices of the (few) Biolink Model versions cached by
+# get_biolink_model_toolkit(), shared by all validators
+MAX_BIOLINK_INDICES: int = 3
+_biolink_indices: Dict[str, BiolinkIndex] = dict()
+_biolink_indices_lock = Lock()
+
+
+def get_biolink_index(bmt: Toolkit) -> BiolinkIndex:
+    """
+    :param bmt: Toolkit, Biolink Model Toolkit of a given Biolink Model release
+    :return: BiolinkIndex, the precomputed lookup index of the Biolink Model release, built once per model version
+    """
+    biolink_version: str = bmt.get_model_version()
+    bmi: Optional[BiolinkIndex] = _biolink_indices.get(biolink_version, None)
+    if bmi is None:
+        with _biolink_indices_lock:
+            bmi = _biolink_indices.get(biolink_version, None)
+            if bmi is None:
+                bmi = BiolinkIndex(bmt)
+                if len(_biolink_indices) >= MAX_BIOLINK_INDICES:
+                    # evict the oldest index
+                    del _biolink_indices[next(iter(_biolink_indices))]
+                _biolink_indices[biolink_version] = bmi
+    return bmi
@@ -0,0 +1,89 @@
+"""
+Parallel Biolink Model validation of (large) knowledge graphs, sharded across a pool of worker processes.
+
+Each worker process holds its own validator, hence Biolink Model Toolkit, for the Biolink Model release
+pinned by the calling validator. The nodes and edges of the knowledge graph are partitioned into shards
+of consecutive graph elements, validated independently by the workers, which simply record (rather than
+report) their validation messages. Replaying the recorded messages of all the shards, in graph order,
+then reproduces exactly the validation report of a serial validation of the knowledge graph, since
+(besides node usage counts, also returned per shard) no validation outcome depends on another element.
+"""
+from typing import Optional, Any, Dict, List, Tuple, Iterable
+
+from reasoner_validator.report import TRAPIGraphType
+
+# A recorded validation message: code, test, target, source trail and message parameters
+RecordedMessage = Tuple[str, Optional[str], Optional[str], Optional[str], Dict]
+
+# Validator of the current worker process, set by init_worker()
+_validator = None
+
+
+def init_worker(validator_class, settings: Dict, node_categories: Dict[str, Optional[List[str]]]):
+    """
+    Initializer of a worker process, loading the Biolink Model Toolkit
+    of the worker validator once, for all the shards validated by the worker.
+
+    :param validator_class: class of the worker validator (i.e. BiolinkValidator)
+    :param settings: Dict, validator constructor keyword arguments
+    :param node_categories: Dict[str, Optional[List[str]]], categories of all the (known) nodes, by node identifier
+    """
+    global _validator
+    _validator = validator_class(**settings)
+    _validator.nodes = {node_id: [categories, 0] for node_id, categories in node_categories.items()}
+
+
+def validate_shard(
+        graph_type: TRAPIGraphType,
+        element_type: str,
+        elements: List[Tuple[str, Any]],
+        validate_schema: bool
+) -> Tuple[List[RecordedMessage], Dict[str, int]]:
+    """
+    Validate a shard of nodes or edges of a graph, in a worker process.
+
+    :param graph_type: TRAPIGraphType, component type of TRAPI graph being validated
+    :param element_type: str, type of graph elements of the shard, either 'Node' or 'Edge'
+    :param elements: List[Tuple[str, Any]], (identifier, details) of consecutive graph nodes or edges
+    :param validate_schema: bool, if True, the elements are also validated against the TRAPI schema
+    :return: Tuple[List[RecordedMessage], Dict[str, int]], validation messages of the shard, in reporting
+             order, and the number of edges of the shard using each node, by node identifier
+    """
+    recording: List[RecordedMessage] = list()
+    _validator.messages = dict()
+    _validator._edge_recordings.append(recording)
+    try:
+        for element_id, details in elements:
+            if validate_schema:
+                _validator.is_valid_trapi_graph_element(element_id, details, element_type=element_type)
+                if not isinstance(details, Dict):
+                    continue
+            if element_type == "Node":
+                _validator.validate_graph_node(element_id, details, graph_type=graph_type)
+            else:
+                _validator.validate_graph_edge(details, graph_type=graph_type)
+    finally:
+        _validator._edge_recordings.pop()
+
+    node_usage: Dict[str, int] = dict()
+    if element_type == "Edge":
+        for _, edge in elements:
+            if not isinstance(edge, Dict):
+                continue
+            for node_id in (edge.get("subject", None), edge.get("object", None)):
+                if isinstance(node_id, str) and node_id in _validator.nodes and _validator.nodes[node_id][1]:
+                    node_usage[node_id] = _validator.nodes[node_id][1]
+                    _validator.nodes[node_id][1] = 0
+
+    return recording, node_usage
+
+
+def shard(elements: Dict[str, Any], shard_size: int) -> Iterable[List[Tuple[str, Any]]]:
+    """
+    :param elements: Dict[str, Any], graph nodes or edges, by identifier
+    :param shard_size: int, maximum number of graph elements per shard
+    :return: Iterable[List[Tuple[str, Any]]], shards of consecutive graph elements, in graph order
+    """
+    items: List[Tuple[str, Any]] = list(elements.items())
+    for start in range(0, len(items), shard_size):
+        yield items[start:start + shard_size]
@@ -3,7 +3,7 @@ This module provides standalone global reasoner-validator validation Message typ
 to avoid load order conflicts for other modules using these data types.
 """
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, NamedTuple
 
 #
 # The MESSAGE_CATALOG data structure is something like the following:
@@ -114,3 +114,28 @@ MESSAGES_BY_TARGET = Dict[
     str,  # target identifier: endpoint URL, URI or CURIE
     MESSAGES_BY_TEST
 ]
+
+# MESSAGE_COUNTS are numbers of messages by code, indexed by target and test,
+# e.g. of the messages only counted (beyond the caps) by a ValidationReporter
+MESSAGE_COUNTS = Dict[
+    str,  # target identifier: endpoint URL, URI or CURIE
+    Dict[
+        str,  # unique identifiers for each test
+        Dict[str, int]  # number of messages, by message 'code'
+    ]
+]
+
+
+class MessageRecord(NamedTuple):
+    """
+    Flat record of a validation message (see ValidationReporter.iter_messages()). Codes without scoped
+    messages are recorded with a None 'scope', scopes without identified messages with a None 'identifier'
+    and identified messages without parameters with None 'parameters'.
+    """
+    target: str
+    test: str
+    type: str  # message type (critical/error/warning/skipped/info)
+    code: str
+    scope: Optional[str]
+    identifier: Optional[str]
+    parameters: Optional[MESSAGE_PARAMETERS]
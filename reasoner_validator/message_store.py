@@ -0,0 +1,371 @@
+"""
+Compact, columnar storage of the messages of a ValidationReporter.
+
+The default ("nested") message store of a ValidationReporter is the MESSAGES_BY_TARGET nested dictionary
+itself (target -> test -> message type -> code -> scope -> identifier -> list of message parameters), with
+a dictionary of parameters per message. The "columnar" message store rather records each message as a row
+of columns: the (target, test) context, code, scope (source trail) and parameter names of the message, all
+interned as integers (i.e. each distinct value, or tuple of parameter names, is only stored once), in arrays,
+with the message identifier and parameter values, which mostly differ from one message to the next, simply
+referenced in lists, such that a message takes a few dozen bytes, rather than a few hundred.
+
+The MESSAGES_BY_TARGET of a ColumnarMessages store are only materialized on demand, e.g. to be dumped or
+exported, by replaying its rows in reporting order, with exactly the same outcome as the nested message store.
+The materialized messages are kept, and only the rows recorded since their last access are replayed on the
+next one, the message containers shared with a snapshot of the messages being copied before being modified.
+"""
+from typing import Optional, Any, Dict, List, Tuple, Set, Hashable, Iterator
+from array import array
+from itertools import islice
+
+from reasoner_validator.message import (
+    MessageType,
+    MESSAGE_CATALOG,
+    MESSAGE_PARAMETERS,
+    MESSAGES_BY_TARGET,
+    MessageRecord
+)
+
+MESSAGE_STORES: List[str] = ["nested", "columnar"]
+
+# Kinds of message rows, i.e. of updates of the (materialized) messages
+_CODE = 0          # only records a message code
+_SCOPE = 1         # records a message scope (empty, if new)
+_NULL_SCOPE = 2    # records a message scope (None, if new)
+_IDENTIFIER = 3    # sets an identified message, without parameters
+_PARAMETERS = 4    # adds the parameters of an identified message
+
+
+class _Interned:
+    """
+    Interning table of (hashable) values, by integer identifier.
+    """
+    __slots__ = ("ids", "values")
+
+    def __init__(self):
+        self.ids: Dict[Hashable, int] = dict()
+        self.values: List[Hashable] = list()
+
+    def get_id(self, value: Hashable) -> int:
+        """
+        :param value: Hashable, value to be interned
+        :return: int, identifier of the value
+        """
+        index: Optional[int] = self.ids.get(value, None)
+        if index is None:
+            index = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+class ColumnarMessages:
+    """
+    Columnar message store of a ValidationReporter.
+    """
+    def __init__(self):
+        # (target, test) contexts of the messages, in order of creation
+        self.contexts: _Interned = _Interned()
+        self.codes: _Interned = _Interned()
+        self.scopes: _Interned = _Interned()
+        # tuples of message parameter names (the first one, empty)
+        self.parameter_names: _Interned = _Interned()
+        self.parameter_names.get_id(())
+
+        # message type (name) of each code
+        self.code_types: List[str] = list()
+
+        # (context, message type) of the messages recorded, e.g. for ValidationReporter.has_errors()
+        self.context_types: Set[Tuple[int, str]] = set()
+
+        # message rows
+        self.kinds: array = array("B")
+        self.context_ids: array = array("I")
+        self.code_ids: array = array("I")
+        self.scope_ids: array = array("I")
+        self.parameter_names_ids: array = array("I")
+        self.identifiers: List[Optional[str]] = list()
+
+        # parameter values of all the messages, in row order
+        self.parameter_values: List[Any] = list()
+
+        # messages materialized from the first contexts and rows (and parameter values)
+        self._materialized: MESSAGES_BY_TARGET = dict()
+        self._materialized_contexts: int = 0
+        self._materialized_rows: int = 0
+        self._materialized_values: int = 0
+        # writable message catalog of each materialized context (None, if not yet looked up)
+        self._catalogs: List[Optional[MESSAGE_CATALOG]] = list()
+        # materialized message containers shared with snapshots of the messages, copied on write,
+        # referenced by identity (and kept alive) until copied (see ValidationReporter._foreign)
+        self._foreign: Dict[int, Any] = dict()
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def get_context(self, target: str, test: Optional[str]) -> int:
+        """
+        :param target: str, target of the messages
+        :param test: Optional[str], test of the messages (None for the target only)
+        :return: int, identifier of the (target, test) context, created if new
+        """
+        return self.contexts.get_id((target, test))
+
+    def has_message_type(self, context: int, message_type: MessageType) -> bool:
+        """
+        :param context: int, identifier of the (target, test) context
+        :param message_type: MessageType, type of message whose presence is to be detected.
+        :return: bool, True if any message of type 'message_type' was recorded in the context
+        """
+        return (context, message_type.name) in self.context_types
+
+    def _append(
+            self,
+            kind: int,
+            context: int,
+            code: str,
+            scope: Optional[str] = None,
+            identifier: Optional[str] = None,
+            parameters: Optional[MESSAGE_PARAMETERS] = None
+    ):
+        code_id: Optional[int] = self.codes.ids.get(code, None)
+        if code_id is None:
+            code_id = self.codes.get_id(code)
+            self.code_types.append(code.split(".")[0])
+        self.context_types.add((context, self.code_types[code_id]))
+        self.kinds.append(kind)
+        self.context_ids.append(context)
+        self.code_ids.append(code_id)
+        if scope is None:
+            self.scope_ids.append(0)
+        else:
+            scope_id: Optional[int] = self.scopes.ids.get(scope, None)
+            self.scope_ids.append(scope_id if scope_id is not None else self.scopes.get_id(scope))
+        self.identifiers.append(identifier)
+        if parameters:
+            self.parameter_names_ids.append(self.parameter_names.get_id(tuple(parameters)))
+            self.parameter_values.extend(parameters.values())
+        else:
+            self.parameter_names_ids.append(0)
+
+    def report(self, context: int, code: str, source_trail: str, message: Dict[str, Any]):
+        """
+        Record a single validation message (see ValidationReporter.report()).
+
+        :param context: int, identifier of the (target, test) context of the message
+        :param code: str, dot delimited validation path code
+        :param source_trail: str, scope of the message
+        :param message: Dict[str, Any], message parameters, including any message 'identifier'
+        """
+        if "identifier" not in message:
+            self._append(_SCOPE, context, code, source_trail)
+        else:
+            identifier: str = message.pop("identifier")
+            if not message:
+                self._append(_IDENTIFIER, context, code, source_trail, identifier)
+            else:
+                self._append(_PARAMETERS, context, code, source_trail, identifier, message)
+
+    def add_messages(self, context: int, new_message_catalog: MESSAGE_CATALOG):
+        """
+        Batch addition of the messages of a MESSAGE_CATALOG (see ValidationReporter.add_messages()).
+
+        :param context: int, identifier of the (target, test) context of the messages
+        :param new_message_catalog: MESSAGE_CATALOG, messages indexed by message type and code
+        """
+        for message_type in MessageType.__members__:
+            for code, new_scoped_messages in (new_message_catalog.get(message_type, None) or dict()).items():
+                if not new_scoped_messages:
+                    self._append(_CODE, context, code)
+                for source, content in new_scoped_messages.items():
+                    if not content:
+                        self._append(_NULL_SCOPE, context, code, source)
+                        continue
+                    for identifier, parameters in content.items():
+                        if not parameters:
+                            self._append(_IDENTIFIER, context, code, source, identifier)
+                        for message in parameters or []:
+                            self._append(_PARAMETERS, context, code, source, identifier, message)
+
+    def _copy(self, container: Any) -> Any:
+        # shallow copy of a foreign message container, sharing (hence, making foreign) any grandchildren
+        del self._foreign[id(container)]
+        if isinstance(container, dict):
+            self._foreign.update((id(child), child) for child in container.values() if child is not None)
+            return dict(container)
+        return list(container)
+
+    def _writable(self, parent: Dict, key: str, container: type = dict) -> Any:
+        # child container of a writable message container, created if missing or None, or copied if foreign
+        child = parent.get(key, None)
+        if child is None:
+            child = parent[key] = container()
+        elif self._foreign and id(child) in self._foreign:
+            child = parent[key] = self._copy(child)
+        return child
+
+    def _catalog(self, context: int) -> MESSAGE_CATALOG:
+        # writable message catalog of a materialized context
+        catalog: Optional[MESSAGE_CATALOG] = self._catalogs[context]
+        if catalog is None:
+            target, test = self.contexts.values[context]
+            catalog = self._writable(self._writable(self._materialized, target), test)
+            self._catalogs[context] = catalog
+        return catalog
+
+    def materialize(self, share: bool = False) -> MESSAGES_BY_TARGET:
+        """
+        Materialize the messages of the store, as MESSAGES_BY_TARGET, only replaying the rows recorded
+        since the last materialization. The materialized messages are updated in place by the next
+        materialization, unless shared with a snapshot, hence should be treated as read-only.
+
+        :param share: bool = False, if True, the materialized messages are returned as a (read-only)
+                      snapshot, i.e. their containers are copied before being modified by any update.
+        :return: MESSAGES_BY_TARGET, all messages of the store
+        """
+        contexts: List[Tuple[str, Optional[str]]] = self.contexts.values
+        if (self._materialized_contexts < len(contexts) or self._materialized_rows < len(self)) and \
+                id(self._materialized) in self._foreign:
+            self._materialized = self._copy(self._materialized)
+            self._catalogs = [None] * len(self._catalogs)
+
+        for target, test in contexts[self._materialized_contexts:]:
+            messages_by_test = self._writable(self._materialized, target)
+            if test is not None and test not in messages_by_test:
+                messages_by_test[test] = {name: dict() for name in MessageType.__members__}
+            self._catalogs.append(None)
+        self._materialized_contexts = len(contexts)
+
+        codes: List[str] = self.codes.values
+        code_types: List[str] = self.code_types
+        scopes: List[str] = self.scopes.values
+        parameter_names: List[Tuple[str, ...]] = self.parameter_names.values
+        parameter_values: List[Any] = self.parameter_values
+        offset: int = self._materialized_values
+        first: int = self._materialized_rows
+        rows: int = len(self)
+        writable = self._writable
+        for kind, context, code, scope, names, identifier in zip(
+            self.kinds[first:rows],
+            self.context_ids[first:rows],
+            self.code_ids[first:rows],
+            self.scope_ids[first:rows],
+            self.parameter_names_ids[first:rows],
+            self.identifiers[first:rows]
+        ):
+            scoped_messages = writable(writable(self._catalog(context), code_types[code]), codes[code])
+            if kind == _CODE:
+                continue
+            source: str = scopes[scope]
+            if kind == _SCOPE or kind == _NULL_SCOPE:
+                if source not in scoped_messages:
+                    scoped_messages[source] = dict() if kind == _SCOPE else None
+                continue
+            identified_messages = writable(scoped_messages, source)
+            if kind == _IDENTIFIER:
+                identified_messages[identifier] = None
+                continue
+            end: int = offset + len(parameter_names[names])
+            writable(identified_messages, identifier, list).append(
+                dict(zip(parameter_names[names], parameter_values[offset:end]))
+            )
+            offset = end
+        self._materialized_rows = rows
+        self._materialized_values = offset
+
+        if share:
+            self._foreign[id(self._materialized)] = self._materialized
+        return self._materialized
+
+    def iter_messages(self) -> Iterator[MessageRecord]:
+        """
+        Iterate over the messages of the store, without materializing their parameters, with exactly the same
+        records, in the same order, as those iterated over the materialized messages, from an index of the rows
+        (by context, message type, code, scope and identifier) replayed as by materialize().
+
+        :return: Iterator[MessageRecord], flat records of the messages
+        """
+        codes: List[str] = self.codes.values
+        code_types: List[str] = self.code_types
+        scopes: List[str] = self.scopes.values
+        parameter_names: List[Tuple[str, ...]] = self.parameter_names.values
+        parameter_values: List[Any] = self.parameter_values
+
+        # rows recorded during the iteration are left out
+        rows: int = len(self)
+        catalogs: Dict[int, Dict[str, Dict[int, Dict[int, Optional[Dict[str, Optional[List[int]]]]]]]] = dict()
+        # offsets of the parameter values of the rows
+        offsets: array = array("Q")
+        offset: int = 0
+        row: int
+        for row, (kind, context, code, scope, names, identifier) in enumerate(
+            islice(
+                zip(
+                    self.kinds,
+                    self.context_ids,
+                    self.code_ids,
+                    self.scope_ids,
+                    self.parameter_names_ids,
+                    self.identifiers
+                ),
+                rows
+            )
+        ):
+            offsets.append(offset)
+            catalog = catalogs.get(context, None)
+            if catalog is None:
+                catalog = catalogs[context] = {name: dict() for name in MessageType.__members__}
+            scoped_rows = catalog[code_types[code]].setdefault(code, dict())
+            if kind == _CODE:
+                continue
+            if kind == _SCOPE or kind == _NULL_SCOPE:
+                if scope not in scoped_rows:
+                    scoped_rows[scope] = None
+                continue
+            identified_rows = scoped_rows.get(scope, None)
+            if identified_rows is None:
+                identified_rows = scoped_rows[scope] = dict()
+            if kind == _IDENTIFIER:
+                identified_rows[identifier] = None
+                continue
+            parameter_rows = identified_rows.get(identifier, None)
+            if parameter_rows is None:
+                parameter_rows = identified_rows[identifier] = list()
+            parameter_rows.append(row)
+            offset += len(parameter_names[names])
+
+        # contexts of the messages, in order of creation, by target (in order of creation)
+        contexts: Dict[str, List[int]] = dict()
+        for context, (target, test) in enumerate(self.contexts.values):
+            target_contexts: List[int] = contexts.setdefault(target, list())
+            if context in catalogs:
+                target_contexts.append(context)
+
+        for target, target_contexts in contexts.items():
+            for context in target_contexts:
+                test: str = self.contexts.values[context][1]
+                for message_type, coded_rows in catalogs[context].items():
+                    for code, scoped_rows in coded_rows.items():
+                        if not scoped_rows:
+                            yield MessageRecord(target, test, message_type, codes[code], None, None, None)
+                        for scope, identified_rows in scoped_rows.items():
+                            if not identified_rows:
+                                yield MessageRecord(target, test, message_type, codes[code], scopes[scope], None, None)
+                                continue
+                            for identifier, parameter_rows in identified_rows.items():
+                                if parameter_rows is None:
+                                    yield MessageRecord(
+                                        target, test, message_type, codes[code], scopes[scope], identifier, None
+                                    )
+                                    continue
+                                for row in parameter_rows:
+                                    names: Tuple[str, ...] = parameter_names[self.parameter_names_ids[row]]
+                                    offset = offsets[row]
+                                    yield MessageRecord(
+                                        target,
+                                        test,
+                                        message_type,
+                                        codes[code],
+                                        scopes[scope],
+                                        identifier,
+                                        dict(zip(names, parameter_values[offset:offset + len(names)]))
+                                    )
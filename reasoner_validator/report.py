@@ -1,12 +1,11 @@
 """Error and Warning Reporting Module"""
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Optional, Any, Dict, List, Tuple, Iterator
 from sys import stdout
 from importlib import metadata
 from io import StringIO
-import copy
 
-from json import dumps, JSONEncoder
+from json import dumps, loads, JSONEncoder
 
 from reasoner_validator.message import (
     MessageType,
@@ -16,8 +15,11 @@ from reasoner_validator.message import (
     IDENTIFIED_MESSAGES,
     MESSAGE_PARAMETERS,
     MESSAGES_BY_TARGET,
-    MESSAGES_BY_TEST
+    MESSAGES_BY_TEST,
+    MESSAGE_COUNTS,
+    MessageRecord
 )
+from reasoner_validator.message_store import MESSAGE_STORES, ColumnarMessages
 from reasoner_validator.validation_codes import CodeDictionary
 
 import logging
@@ -61,11 +63,18 @@ class ValidationReporter:
     # specifically 1.3.0, as of September 1st, 2022
     DEFAULT_TRAPI_VERSION = "1"
 
+    # Number of message records added at once by import_ndjson()
+    NDJSON_BATCH_SIZE: int = 10000
+
     def __init__(
             self,
             default_test: Optional[str] = None,
             default_target: Optional[str] = None,
-            strict_validation: Optional[bool] = None
+            strict_validation: Optional[bool] = None,
+            message_store: str = "nested",
+            max_code_messages: int = 0,
+            max_identifier_messages: int = 0,
+            counts_only: bool = False
     ):
         """
         :param default_test: Optional[str] =  None, initial default test context of the Validator messages
@@ -74,11 +83,121 @@ class ValidationReporter:
                                also used as a prefix in validation messages. Default "global" if not provided.
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error';  False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
-        """
+        :param message_store: str = "nested", storage of the validation messages, one of MESSAGE_STORES: "nested"
+                              (Default, MESSAGES_BY_TARGET dictionaries) or "columnar" (compact arrays of interned
+                              message codes, scopes, identifiers and parameters, for very large numbers of messages,
+                              see reasoner_validator.message_store), with the same validation messages.
+        :param max_code_messages: int = 0, maximum number of identified messages recorded per code (and target
+                                  and test), beyond which further messages of the code are only counted (their
+                                  scope being recorded), bounding the size of the report (Default: 0, no limit).
+        :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier
+                                        (of a code, in a given scope), beyond which further parameterized messages
+                                        of the identifier are only counted (Default: 0, no limit).
+        :param counts_only: bool = False, if True, identified messages are only counted, by code (and their
+                            scope recorded), e.g. for the screening of many or very large TRAPI Responses.
+        """
+        if message_store not in MESSAGE_STORES:
+            raise ValueError(f"Unknown message store '{message_store}'")
+        self.message_store: str = message_store
+
         self.default_test: str = default_test if default_test else "Test"
         self.default_target: str = default_target if default_target else "Target"
         self.strict_validation: Optional[bool] = strict_validation
-        self.messages: MESSAGES_BY_TARGET = dict()
+        self._messages: MESSAGES_BY_TARGET = dict()
+        self._store: Optional[ColumnarMessages] = ColumnarMessages() if message_store == "columnar" else None
+
+        self.max_code_messages: int = max_code_messages
+        self.max_identifier_messages: int = max_identifier_messages
+        self.counts_only: bool = counts_only
+        # numbers of identified messages recorded by (target, test, code), and of parameterized
+        # messages recorded by (target, test, code, scope, identifier), checked against the caps
+        self._code_counts: Dict[Tuple[str, str, str], int] = dict()
+        self._identifier_counts: Dict[Tuple[str, str, str, str, str], int] = dict()
+        # outcomes (recorded or only counted) of the messages identified by (target, test, code, scope, identifier),
+        # without other parameters, since a repeated report of such a message adds nothing to the messages
+        self._identified: Dict[Tuple[str, str, str, str, str], bool] = dict()
+        # numbers of identified messages only counted, beyond the caps
+        self._truncated: MESSAGE_COUNTS = dict()
+
+        # The messages are shared with the snapshots of messages returned by get_all_messages() and
+        # get_messages_of_type(), and may share the messages merged from other reporters, hence, are
+        # copied on write, i.e. any 'foreign' (shared) message container (dictionary or list) is copied
+        # before being modified, the containers of a foreign dictionary being foreign in turn (copied
+        # containers, and containers created since, being owned by the ValidationReporter). Foreign
+        # containers are referenced by identity (kept alive, such that their identity isn't reused)
+        # until copied, a message container being only found once in the messages of a reporter.
+        self._foreign: Dict[int, Any] = dict()
+
+    @property
+    def messages(self) -> MESSAGES_BY_TARGET:
+        """
+        :return: MESSAGES_BY_TARGET, all the messages of the ValidationReporter
+                 (materialized on access, from a "columnar" message store, see ColumnarMessages.materialize()).
+        """
+        if self._store is not None:
+            return self._store.materialize()
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages: MESSAGES_BY_TARGET):
+        """
+        :param messages: MESSAGES_BY_TARGET, replacing all the messages of the ValidationReporter
+        """
+        self._code_counts = dict()
+        self._identifier_counts = dict()
+        self._identified = dict()
+        self._truncated = dict()
+        if self._store is not None:
+            self._store = ColumnarMessages()
+            self.add_messages(messages)
+        else:
+            self._messages = messages
+            self._foreign = dict()
+            self._share()
+
+    def _get_context(self, test: Optional[str] = None, target: Optional[str] = None) -> int:
+        # (target, test) context of the "columnar" message store, for a given or default target and test
+        return self._store.get_context(
+            target if target else self.get_default_target(),
+            test if test else self.get_default_test()
+        )
+
+    def _share(self):
+        # all message containers are (possibly) shared with a new snapshot
+        if self._store is not None:
+            self._store.materialize(share=True)
+            return
+        self._foreign[id(self._messages)] = self._messages
+
+    def _borrow(self, parent: Dict, key: str, container: Dict):
+        # share a (read-only) message container, e.g. of the messages merged from another reporter
+        parent[key] = container
+        self._foreign[id(container)] = container
+
+    def _copy(self, container: Any) -> Any:
+        # shallow copy of a foreign message container, sharing (hence, making foreign) any grandchildren
+        del self._foreign[id(container)]
+        if isinstance(container, dict):
+            self._foreign.update((id(child), child) for child in container.values() if child is not None)
+            return dict(container)
+        return list(container)
+
+    def _writable(self, parent: Dict, key: str, container: type = dict) -> Any:
+        """
+        Get a child container (dictionary or list) of a writable message container,
+        ready to be modified (i.e. created if missing or None, or copied if shared).
+
+        :param parent: Dict, writable message container
+        :param key: str, key of the child container in its parent
+        :param container: type, type of the child container, 'dict' or 'list' (Default: dict)
+        :return: writable child container
+        """
+        child = parent.get(key, None)
+        if child is None:
+            child = parent[key] = container()
+        elif id(child) in self._foreign:
+            child = parent[key] = self._copy(child)
+        return child
 
     def reset_default_test(self, name: str):
         """
@@ -136,24 +255,32 @@ class ValidationReporter:
         :return: MESSAGES_BY_TEST corresponding to a resolved target
         """
         current_target = target if target else self.get_default_target()
-        if current_target not in self.messages:
-            self.messages[current_target] = dict()
-        return self.messages[current_target]
+        if self._store is not None:
+            self._store.get_context(current_target, None)
+            return self._store.materialize()[current_target]
+        if id(self._messages) in self._foreign:
+            self._messages = self._copy(self._messages)
+        return self._writable(self._messages, current_target)
 
     def get_messages_by_test(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_CATALOG:
         """
         Returns MESSAGE_CATALOG corresponding to a given or default target.
-        Note that the dictionary returned is not a copy of the original
-         thus caution should be taken not to mutate it!
+        Note that the dictionary returned is not a copy of the original, and that its message
+         containers may be shared with snapshots of the messages, thus caution should be taken not to mutate it!
+         (the catalog materialized from a "columnar" message store is moreover not updated by its mutation).
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: MESSAGES_BY_TEST corresponding to a resolved target
         """
-        messages_by_test: MESSAGES_BY_TEST = self.get_messages_by_target(target=target)
         current_test = test if test else self.get_default_test()
+        if self._store is not None:
+            current_target = target if target else self.get_default_target()
+            self._store.get_context(current_target, current_test)
+            return self._store.materialize()[current_target][current_test]
+        messages_by_test: MESSAGES_BY_TEST = self.get_messages_by_target(target=target)
         if current_test not in messages_by_test:
             messages_by_test[current_test] = {name: dict() for name in MessageType.__members__}
-        return messages_by_test[current_test]
+        return self._writable(messages_by_test, current_test)
 
     def has_messages(self, test: Optional[str] = None, target: Optional[str] = None) -> bool:
         """Predicate to detect any recorded validation messages.
@@ -181,6 +308,8 @@ class ValidationReporter:
         :param target: str, specified target (gets current 'default' test if not given)
         :return: bool, true only if ValidationReporter has any non-empty messages of type 'message_type'.
         """
+        if self._store is not None:
+            return self._store.has_message_type(self._get_context(test=test, target=target), message_type)
         message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
         return bool(message_catalog[message_type.name])
 
@@ -331,31 +460,38 @@ class ValidationReporter:
         :return: None (internally record the validation message)
         """
         # Sanity check: that the given code has been registered in the codes.yaml file
-        assert CodeDictionary.get_code_entry(code) is not None, f"ValidationReporter.report: unknown code '{code}'"
+        assert CodeDictionary.get_code_table_entry(code) is not None, \
+            f"ValidationReporter.report: unknown code '{code}'"
 
         # Rarely, get_message_type_label() can raise a
         # "KeyError" if the message_type_id is unknown?
         message_type: MessageType = self.get_message_type(code)
 
-        message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
-        messages: message_catalog[message_type.name]
-
-        if code not in message_catalog[message_type.name]:
-            message_catalog[message_type.name][code] = dict()
-
         # Set current scope of validation message
         if source_trail is None:
             source_trail = "global"
 
-        if source_trail not in message_catalog[message_type.name][code]:
-            message_catalog[message_type.name][code][source_trail] = dict()
+        if "identifier" in message and self._is_capped() and \
+                not self._is_recorded(code, test, target, source_trail, message["identifier"], len(message) > 1):
+            # the message is only counted, but its scope is recorded
+            message = dict()
 
-        scope = message_catalog[message_type.name][code][source_trail]
+        if self._store is not None:
+            self._store.report(self._get_context(test=test, target=target), code, source_trail, message)
+            return
+
+        message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
+        coded_messages: MESSAGE_PARTITION = self._writable(message_catalog, message_type.name)
+        scoped_messages: SCOPED_MESSAGES = self._writable(coded_messages, code)
+
+        if source_trail not in scoped_messages:
+            scoped_messages[source_trail] = dict()
 
         if message:
             # If a message has any parameters, then one of them is
             # expected to be a message indexing identifier
             if "identifier" in message:
+                scope: IDENTIFIED_MESSAGES = self._writable(scoped_messages, source_trail)
                 message_identifier = message.pop("identifier")
                 if not message:
                     # the message_identifier was the only parameter to keep track of...
@@ -363,19 +499,128 @@ class ValidationReporter:
                 else:
                     # keep track of additional parameters in a list of dictionaries
                     # (may have additional, currently unavoidable, content duplication?)
-                    if message_identifier not in scope or scope[message_identifier] is None:
-                        scope[message_identifier] = list()
-
-                    scope[message_identifier].append(message)
+                    self._writable(scope, message_identifier, list).append(message)
 
         # else: additional parameters are None
 
-    def add_messages(self, new_messages: MESSAGES_BY_TARGET):
+    def _is_capped(self) -> bool:
+        # True if identified messages are only recorded up to some caps (or only counted)
+        return bool(self.counts_only or self.max_code_messages or self.max_identifier_messages)
+
+    def _is_recorded(
+            self,
+            code: str,
+            test: Optional[str],
+            target: Optional[str],
+            source_trail: str,
+            identifier: str,
+            parameterized: bool
+    ) -> bool:
         """
-        Batch addition of MESSAGES_BY_TARGET messages to a ValidationReporter instance.
+        Check an identified message against the caps of the messages recorded,
+        counting the message as truncated if beyond these caps. A message without
+        other parameters than its identifier is only checked (and counted) once
+        per scope and identifier of its code, its repeated reports having the same outcome.
+
+        :param code: str, dot delimited validation path code
+        :param test: str, specified test (gets current 'default' test if not given)
+        :param target: str, specified target (gets current 'default' test if not given)
+        :param source_trail: str, scope of the message
+        :param identifier: str, message identifier
+        :param parameterized: bool, True if the message has other parameters than its identifier
+        :return: bool, True if the message is to be recorded, False if only counted
+        """
+        current_target: str = target if target else self.get_default_target()
+        current_test: str = test if test else self.get_default_test()
+        code_key: Tuple[str, str, str] = (current_target, current_test, code)
+        identified_key: Optional[Tuple[str, str, str, str, str]] = None
+        if not parameterized:
+            identified_key = code_key + (source_trail, identifier)
+            if identified_key in self._identified:
+                return self._identified[identified_key]
+        recorded: bool = not self.counts_only
+        if recorded and self.max_code_messages:
+            recorded = self._code_counts.get(code_key, 0) < self.max_code_messages
+        if recorded and self.max_identifier_messages and parameterized:
+            identifier_key: Tuple[str, str, str, str, str] = code_key + (source_trail, identifier)
+            count: int = self._identifier_counts.get(identifier_key, 0)
+            recorded = count < self.max_identifier_messages
+            if recorded:
+                self._identifier_counts[identifier_key] = count + 1
+        if not recorded:
+            counts: Dict[str, int] = self._truncated.setdefault(current_target, dict()).setdefault(current_test, dict())
+            counts[code] = counts.get(code, 0) + 1
+        elif self.max_code_messages:
+            self._code_counts[code_key] = self._code_counts.get(code_key, 0) + 1
+        if identified_key is not None:
+            self._identified[identified_key] = recorded
+        return recorded
+
+    def _capped_messages(self, target: str, test: str, new_message_catalog: MESSAGE_CATALOG) -> MESSAGE_CATALOG:
+        """
+        Check the identified messages of a MESSAGE_CATALOG being added to the ValidationReporter
+        (see add_messages()) against its caps, as if reported one at a time.
+
+        :param target: str, target of the messages
+        :param test: str, test of the messages
+        :param new_message_catalog: MESSAGE_CATALOG, messages indexed by message type and code
+        :return: MESSAGE_CATALOG, the messages to be recorded, i.e. only the scopes of the messages only counted
+        """
+        capped_catalog: MESSAGE_CATALOG = dict()
+        message_type: str
+        new_coded_messages: Optional[MESSAGE_PARTITION]
+        for message_type, new_coded_messages in new_message_catalog.items():
+            if not new_coded_messages:
+                capped_catalog[message_type] = new_coded_messages
+                continue
+            coded_messages: MESSAGE_PARTITION = dict()
+            capped_catalog[message_type] = coded_messages
+            code: str
+            new_scoped_messages: SCOPED_MESSAGES
+            for code, new_scoped_messages in new_coded_messages.items():
+                scoped_messages: SCOPED_MESSAGES = dict()
+                coded_messages[code] = scoped_messages
+                source: str
+                content: Optional[IDENTIFIED_MESSAGES]
+                for source, content in new_scoped_messages.items():
+                    identified_messages: IDENTIFIED_MESSAGES = dict()
+                    scoped_messages[source] = identified_messages
+                    identifier: str
+                    parameters: Optional[List[MESSAGE_PARAMETERS]]
+                    for identifier, parameters in (content or dict()).items():
+                        if not parameters:
+                            if self._is_recorded(code, test, target, source, identifier, False):
+                                identified_messages[identifier] = None
+                            continue
+                        recorded: List[MESSAGE_PARAMETERS] = [
+                            message for message in parameters
+                            if self._is_recorded(code, test, target, source, identifier, True)
+                        ]
+                        if recorded:
+                            identified_messages[identifier] = recorded
+        return capped_catalog
+
+    def get_truncated_counts(self) -> MESSAGE_COUNTS:
+        """
+        Get the numbers of identified messages only counted (rather than recorded), beyond the caps of the
+        ValidationReporter (see its 'max_code_messages', 'max_identifier_messages' and 'counts_only' arguments).
+        :return: MESSAGE_COUNTS, (copy of the) numbers of messages not recorded, by target, test and code.
+        """
+        return {
+            target: {test: dict(counts) for test, counts in counts_by_test.items()}
+            for target, counts_by_test in self._truncated.items()
+        }
+
+    def add_messages(self, new_messages: MESSAGES_BY_TARGET, share: bool = False):
+        """
+        Batch addition of MESSAGES_BY_TARGET messages to a ValidationReporter instance. As with report(),
+        identified messages beyond the caps of the ValidationReporter are only counted (their scope recorded).
         :param new_messages: MESSAGES_BY_TARGET, messages indexed by target, test and categories:
                              one of "information", "skipped tests", "warnings", "errors" or "critical",
                              with code-keyed dictionaries of (structured) message parameters.
+        :param share: bool = False, if True, the identified messages of any scope new to the ValidationReporter
+                      are shared with 'new_messages' (e.g. a read-only snapshot of the messages of another
+                      ValidationReporter, see get_all_messages()), rather than copied, until modified.
         """
         target: str
         target_messages: MESSAGES_BY_TEST
@@ -383,51 +628,61 @@ class ValidationReporter:
             test: str
             new_message_catalog: MESSAGE_CATALOG
             for test, new_message_catalog in target_messages.items():
+                if self._is_capped():
+                    new_message_catalog = self._capped_messages(target, test, new_message_catalog)
+                if self._store is not None:
+                    self._store.add_messages(self._get_context(test=test, target=target), new_message_catalog)
+                    continue
                 this_message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
-                for message_type in [name for name in MessageType.__members__]:
-                    if message_type in new_message_catalog.keys():
-                        new_message_type_entry: Dict = new_message_catalog[message_type]
-                        this_message_type_entry: Dict = this_message_catalog[message_type]
-                        code: str
-                        new_message_details: SCOPED_MESSAGES
-                        for code, new_scoped_messages in new_message_type_entry.items():   # codes.yaml message codes
-                            if code not in this_message_type_entry.keys():
-                                this_message_type_entry[code] = dict()  # SCOPED_MESSAGES
-                            # 'source' scope is 'global' or a source trail
-                            # path string, from primary to topmost aggregator
-                            source: str
-                            content: Optional[IDENTIFIED_MESSAGES]
-                            for source, content in new_scoped_messages.items():
-                                if source not in this_message_type_entry[code].keys():
-                                    this_message_type_entry[code][source] = dict() if content else None
-                                scope = this_message_type_entry[code][source]
-                                if content:
-                                    # content is of type IDENTIFIED_MESSAGES
-                                    # where dictionary keys are a set of
-                                    # message discriminating 'identifier'
-                                    identifier: str
-                                    parameters: Optional[IDENTIFIED_MESSAGES]
-                                    for identifier, parameters in content.items():
-                                        if parameters:
-                                            # additional parameters seen, then capture
-                                            if scope is None:
-                                                scope = this_message_type_entry[code][source] = dict()
-                                            if identifier not in scope or scope[identifier] is None:
-                                                scope[identifier] = list()
-                                            scope[identifier].extend(parameters)
-                                        else:
-                                            # the message 'identifier' is the only parameter
-                                            scope[identifier] = None
+                for message_type in MessageType.__members__:
+                    new_message_type_entry: Optional[Dict] = new_message_catalog.get(message_type, None)
+                    if not new_message_type_entry:
+                        continue
+                    this_message_type_entry: Dict = self._writable(this_message_catalog, message_type)
+                    code: str
+                    new_scoped_messages: SCOPED_MESSAGES
+                    for code, new_scoped_messages in new_message_type_entry.items():   # codes.yaml message codes
+                        this_scoped_messages: SCOPED_MESSAGES = self._writable(this_message_type_entry, code)
+                        # 'source' scope is 'global' or a source trail
+                        # path string, from primary to topmost aggregator
+                        source: str
+                        content: Optional[IDENTIFIED_MESSAGES]
+                        for source, content in new_scoped_messages.items():
+                            if not content:
+                                if source not in this_scoped_messages:
+                                    this_scoped_messages[source] = None
+                                continue
+                            # content is of type IDENTIFIED_MESSAGES
+                            # where dictionary keys are a set of
+                            # message discriminating 'identifier'
+                            if share and not this_scoped_messages.get(source, None):
+                                # new identified messages are shared as a whole
+                                self._borrow(this_scoped_messages, source, content)
+                                continue
+                            scope: IDENTIFIED_MESSAGES = self._writable(this_scoped_messages, source)
+                            identifier: str
+                            parameters: Optional[List[MESSAGE_PARAMETERS]]
+                            for identifier, parameters in content.items():
+                                if not parameters:
+                                    # the message 'identifier' is the only parameter
+                                    scope[identifier] = None
+                                elif scope.get(identifier, None) is None:
+                                    # (the parameters themselves are shared, not copied)
+                                    scope[identifier] = list(parameters)
+                                else:
+                                    # additional parameters seen, then appended in place
+                                    self._writable(scope, identifier, list).extend(parameters)
 
     def get_all_messages(self) -> MESSAGES_BY_TARGET:
         """
-        Get copy of all MESSAGES_BY_TARGET as a Python data structure.
-        :return: Dict (copy) of all validation messages in the ValidationReporter.
+        Get a snapshot of all MESSAGES_BY_TARGET as a Python data structure. The snapshot is not copied,
+        but shares its contents with the ValidationReporter, which rather copies any part of its messages
+        before modifying it (i.e. the snapshot is not changed by further validation). The snapshot should
+        thus be treated as read-only (it may be copied, i.e. with copy.deepcopy(), to be modified).
+        :return: Dict (snapshot) of all validation messages in the ValidationReporter.
         """
-        # TODO: is it necessary to copy these messages -
-        #       may be a large data structure,
-        #       costly to replicate (just for 'safety')
-        return copy.deepcopy(self.messages)
+        self._share()
+        return self.messages
 
     def get_messages_of_type(
             self,
@@ -441,12 +696,11 @@ class ValidationReporter:
         :param message_type: MessageType, type of message whose presence is to be detected.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
-        :return: get copy of messages of type 'message_type'.
+        :return: get (read-only) snapshot of messages of type 'message_type' (see get_all_messages()).
         """
         message_catalog: MESSAGE_CATALOG = self.get_messages_by_test(test=test, target=target)
-        # TODO: the deepcopy may be desirable for message data
-        #       integrity, but it may be computationally expensive?
-        return copy.deepcopy(message_catalog[message_type.name])
+        self._share()
+        return message_catalog[message_type.name]
 
     @staticmethod
     def merge_identified_messages(
@@ -461,7 +715,8 @@ class ValidationReporter:
             if message_parameters_list is not None:
                 if aggregated[identifier] is None:
                     aggregated[identifier] = list()
-                aggregated[identifier].extend(copy.deepcopy(message_parameters_list))
+                # the (read-only) message parameters are shared, not copied
+                aggregated[identifier].extend(message_parameters_list)
 
     def merge_scoped_messages(
         self,
@@ -504,21 +759,17 @@ class ValidationReporter:
         :return: MESSAGE_PARTITION of aggregated messages of the specified MessageType.
         """
         all_messages_of_type: MESSAGE_PARTITION = dict()
-        target: str
-        messages_by_target: MESSAGES_BY_TARGET = self.get_all_messages()
-        test: str
         messages_by_test: MESSAGES_BY_TEST
         message_catalog: MESSAGE_CATALOG
-        for target, messages_by_test in messages_by_target.items():
-            for test in messages_by_test.keys():
-                additional_messages: MESSAGE_PARTITION = \
-                    self.get_messages_of_type(message_type=message_type, test=test, target=target)
-                self.merge_coded_messages(all_messages_of_type, additional_messages)
+        # the messages are merged into new message containers, hence read in place
+        for messages_by_test in self.messages.values():
+            for message_catalog in messages_by_test.values():
+                self.merge_coded_messages(all_messages_of_type, message_catalog[message_type.name])
         return all_messages_of_type
 
     def get_info(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'information' messages, for a given test from a given target.
+        Get (read-only) snapshot of all recorded 'information' messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'information' messages.
@@ -527,7 +778,7 @@ class ValidationReporter:
 
     def get_skipped(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'skipped test' messages, for a given test from a given target.
+        Get (read-only) snapshot of all recorded 'skipped test' messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'skipped test' messages.
@@ -536,7 +787,7 @@ class ValidationReporter:
 
     def get_warnings(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'warning' messages, for a given test from a given target.
+        Get (read-only) snapshot of all recorded 'warning' messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'warning' messages.
@@ -545,7 +796,7 @@ class ValidationReporter:
 
     def get_errors(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'error' messages, for a given test from a given target.
+        Get (read-only) snapshot of all recorded 'error' messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'error' messages.
@@ -554,7 +805,7 @@ class ValidationReporter:
 
     def get_critical(self, test: Optional[str] = None, target: Optional[str] = None) -> MESSAGE_PARTITION:
         """
-        Get copy of all recorded 'critical' error messages, for a given test from a given target.
+        Get (read-only) snapshot of all recorded 'critical' error messages, for a given test from a given target.
         :param test: str, specified test (gets current 'default' test if not given)
         :param target: str, specified target (gets current 'default' test if not given)
         :return: Dict of all 'critical error' messages.
@@ -573,15 +824,126 @@ class ValidationReporter:
         """
         assert isinstance(reporter, ValidationReporter)
 
-        # new coded messages also need to be merged!
-        self.add_messages(reporter.get_all_messages())
+        # (taken first, in case the merged messages are capped by the reporter itself)
+        truncated: MESSAGE_COUNTS = reporter.get_truncated_counts()
+
+        # new coded messages also need to be merged! (sharing, rather than copying, any messages new to this reporter)
+        self.add_messages(reporter.get_all_messages(), share=True)
+
+        # ...as well as the numbers of messages only counted
+        for target, counts_by_test in truncated.items():
+            for test, counts in counts_by_test.items():
+                these_counts: Dict[str, int] = self._truncated.setdefault(target, dict()).setdefault(test, dict())
+                for code, count in counts.items():
+                    these_counts[code] = these_counts.get(code, 0) + count
 
     def to_dict(self) -> Dict:
         """
         Export ValidationReporter message contents as a Python dictionary.
-        :return: Dict
+        :return: Dict, with a (read-only) snapshot of the messages (see get_all_messages()),
+                 plus the numbers of any messages only counted, beyond the caps of the
+                 ValidationReporter, as "truncated" (see get_truncated_counts()).
         """
-        return {"messages": self.get_all_messages()}
+        contents: Dict = {"messages": self.get_all_messages()}
+        if self._truncated:
+            contents["truncated"] = self.get_truncated_counts()
+        return contents
+
+    def iter_messages(self) -> Iterator[MessageRecord]:
+        """
+        Iterate over all the messages of the ValidationReporter, as flat records, without materializing
+        them as MESSAGES_BY_TARGET (the records of both message stores being the same, in the same order).
+        Messages reported during the iteration are not iterated over.
+        :return: Iterator[MessageRecord], flat records of the messages
+        """
+        if self._store is not None:
+            yield from self._store.iter_messages()
+            return
+
+        # the messages being iterated over are shared, hence copied on write
+        self._share()
+        target: str
+        test: str
+        message_type: str
+        code: str
+        scope: str
+        identifier: str
+        for target, target_messages in self._messages.items():
+            for test, test_messages in target_messages.items():
+                for message_type, coded_messages in test_messages.items():
+                    for code, scoped_messages in coded_messages.items():
+                        if not scoped_messages:
+                            yield MessageRecord(target, test, message_type, code, None, None, None)
+                        for scope, identified_messages in scoped_messages.items():
+                            if not identified_messages:
+                                yield MessageRecord(target, test, message_type, code, scope, None, None)
+                                continue
+                            for identifier, messages in identified_messages.items():
+                                if not messages:
+                                    yield MessageRecord(target, test, message_type, code, scope, identifier, None)
+                                for parameters in messages or []:
+                                    yield MessageRecord(
+                                        target, test, message_type, code, scope, identifier, parameters
+                                    )
+
+    def export_ndjson(self, file=stdout) -> int:
+        """
+        Export all the messages of the ValidationReporter as newline delimited JSON (NDJSON) text,
+        one JSON object per message record (see iter_messages()), written incrementally.
+
+        :param file: target file device for output
+        :return: int, number of message records written
+        """
+        count: int = 0
+        for record in self.iter_messages():
+            file.write(_output(record._asdict(), flat=True) + "\n")
+            count += 1
+        return count
+
+    def import_ndjson(self, file) -> int:
+        """
+        Add the messages of newline delimited JSON (NDJSON) text, as exported by export_ndjson(), to the
+        ValidationReporter, in batches of NDJSON_BATCH_SIZE message records (with the same outcome
+        as merging the messages of the ValidationReporter which exported them).
+
+        :param file: source file device, or any iterable of NDJSON text lines
+        :return: int, number of message records read
+        :raises: ValueError, if a line is not the JSON object of a message record
+        """
+        count: int = 0
+        batch: MESSAGES_BY_TARGET = dict()
+        line: str
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                record = MessageRecord(**loads(line))
+            except TypeError:
+                raise ValueError(f"ValidationReporter.import_ndjson(): invalid message record '{line.strip()}'")
+            coded_messages: MESSAGE_PARTITION = batch.setdefault(record.target, dict()).setdefault(
+                record.test, dict()
+            ).setdefault(record.type, dict())
+            scoped_messages: SCOPED_MESSAGES = coded_messages.setdefault(record.code, dict())
+            if record.scope is not None:
+                if record.identifier is None:
+                    scoped_messages.setdefault(record.scope, None)
+                else:
+                    identified_messages: Optional[IDENTIFIED_MESSAGES] = scoped_messages.get(record.scope, None)
+                    if identified_messages is None:
+                        identified_messages = scoped_messages[record.scope] = dict()
+                    if record.parameters is None:
+                        identified_messages[record.identifier] = None
+                    elif identified_messages.get(record.identifier, None) is None:
+                        identified_messages[record.identifier] = [record.parameters]
+                    else:
+                        identified_messages[record.identifier].append(record.parameters)
+            count += 1
+            if count % self.NDJSON_BATCH_SIZE == 0:
+                self.add_messages(batch)
+                batch = dict()
+        if batch:
+            self.add_messages(batch)
+        return count
 
     def apply_validation(self, validation_method, *args, **kwargs) -> bool:
         """
@@ -867,6 +1229,15 @@ class ValidationReporter:
                                             break
                                     if not compact_format:
                                         print(file=file)
+                                truncated: int = self._truncated.get(target, dict()).get(test, dict()).get(code, 0)
+                                if truncated:
+                                    print(
+                                        f"\t\t\t{str(truncated)} more messages for code '{code_label}' " +
+                                        "(counted, but not recorded)...",
+                                        file=file
+                                    )
+                                    if not compact_format:
+                                        print(file=file)
                                 # else:
                                 #     For codes with associated non-parametric templates,
                                 #     just printing the template (done above) suffices
@@ -0,0 +1,139 @@
+"""
+Sampling strategies of the Knowledge Graph edges and Results validated from large TRAPI Responses.
+
+- "first": the first N edges (or Results), in Response order (the default).
+- "random": a (seeded) uniform random sample of N edges (or Results).
+- "stratified": up to N edges, shared (round-robin) among the strata of edges of the same predicate and primary
+  knowledge source, such that rarer kinds of edges are sampled too (Results are stratified by the resources
+  of their analyses).
+- "reservoir": a uniform random sample of N edges (or Results), in a single pass over them.
+
+All samples are returned in Response order. The random sample of elements read one at a time (e.g. streamed
+from a TRAPI Response JSON file), whose number isn't known beforehand, is a reservoir sample.
+"""
+from typing import Optional, Any, List, Dict, Tuple, Hashable
+from random import Random
+
+SAMPLING_STRATEGIES: List[str] = ["first", "random", "stratified", "reservoir"]
+
+
+def edge_stratum(edge: Any) -> Tuple[Optional[str], Optional[str]]:
+    """
+    :param edge: Any, TRAPI Knowledge Graph edge
+    :return: Tuple[Optional[str], Optional[str]], predicate and primary knowledge source of the edge
+    """
+    if not isinstance(edge, Dict):
+        return None, None
+    predicate: Optional[str] = edge.get("predicate", None)
+    source: Optional[str] = None
+    # TRAPI releases 1.4 and later have edge 'sources', earlier releases, provenance attributes
+    for entry in edge.get("sources", None) or []:
+        if isinstance(entry, Dict) and entry.get("resource_role", None) == "primary_knowledge_source":
+            source = entry.get("resource_id", None)
+            break
+    else:
+        for attribute in edge.get("attributes", None) or []:
+            if isinstance(attribute, Dict) and \
+                    attribute.get("attribute_type_id", None) == "biolink:primary_knowledge_source":
+                source = attribute.get("value", None)
+                break
+    return (
+        predicate if isinstance(predicate, str) else None,
+        source if isinstance(source, str) else None
+    )
+
+
+def result_stratum(result: Any) -> Tuple[str, ...]:
+    """
+    :param result: Any, TRAPI Result
+    :return: Tuple[str, ...], (sorted) identifiers of the resources of the analyses of the Result
+    """
+    if not isinstance(result, Dict):
+        return ()
+    return tuple(sorted({
+        analysis["resource_id"]
+        for analysis in result.get("analyses", None) or []
+        if isinstance(analysis, Dict) and isinstance(analysis.get("resource_id", None), str)
+    }))
+
+
+class Sampler:
+    """
+    Single pass sampler of a sequence of items, e.g. the identifiers of Knowledge Graph edges.
+    """
+    def __init__(self, size: int, strategy: str = "first", seed: Optional[int] = None):
+        """
+        :param size: int, (positive) maximum number of items sampled
+        :param strategy: str = "first", sampling strategy, one of SAMPLING_STRATEGIES
+        :param seed: Optional[int] = None, seed of the random sampling strategies (Default: None, unseeded)
+        """
+        if strategy not in SAMPLING_STRATEGIES:
+            raise ValueError(f"Unknown sampling strategy '{strategy}'")
+        self.size: int = size
+        self.strategy: str = strategy
+        self.random: Random = Random(seed)
+        self.count: int = 0
+        # (sequence number, item) of the sampled items, by stratum
+        self.strata: Dict[Hashable, List[Tuple[int, Any]]] = dict()
+        self.stratum_counts: Dict[Hashable, int] = dict()
+
+    def add(self, item: Any, stratum: Hashable = None):
+        """
+        :param item: Any, next item of the sequence
+        :param stratum: Hashable = None, stratum of the item (only used by the "stratified" strategy)
+        """
+        if self.strategy != "stratified":
+            stratum = None
+        sampled: List[Tuple[int, Any]] = self.strata.setdefault(stratum, list())
+        # number of items of the stratum seen so far (Algorithm R of reservoir sampling)
+        seen: int = self.stratum_counts.get(stratum, 0)
+        if seen < self.size:
+            sampled.append((self.count, item))
+        elif self.strategy != "first":
+            slot: int = self.random.randrange(seen + 1)
+            if slot < self.size:
+                sampled[slot] = (self.count, item)
+        self.stratum_counts[stratum] = seen + 1
+        self.count += 1
+
+    def sample(self) -> List[Any]:
+        """
+        :return: List[Any], sampled items, in sequence order
+        """
+        if self.strategy == "stratified":
+            # strata take turns to contribute (randomly drawn) items to the sample
+            strata: List[List[Tuple[int, Any]]] = [list(sampled) for sampled in self.strata.values()]
+            for sampled in strata:
+                self.random.shuffle(sampled)
+            selected: List[Tuple[int, Any]] = list()
+            rank: int = 0
+            while len(selected) < self.size and any(rank < len(sampled) for sampled in strata):
+                selected.extend(sampled[rank] for sampled in strata if rank < len(sampled))
+                rank += 1
+            del selected[self.size:]
+        else:
+            selected = self.strata.get(None, [])
+        return [item for _, item in sorted(selected, key=lambda entry: entry[0])]
+
+
+def sample_indices(population: int, size: int, strategy: str = "first", seed: Optional[int] = None) -> List[int]:
+    """
+    Sample the indices of a sequence of known length, for any sampling strategy not needing the sequence
+    items themselves (i.e. but for the "stratified" strategy, which needs a Sampler over the items).
+
+    :param population: int, length of the sequence
+    :param size: int, (positive) maximum number of indices sampled
+    :param strategy: str = "first", sampling strategy, one of SAMPLING_STRATEGIES but "stratified"
+    :param seed: Optional[int] = None, seed of the random sampling strategies (Default: None, unseeded)
+    :return: List[int], sampled indices, in increasing order
+    """
+    size = min(size, population)
+    if strategy == "first":
+        return list(range(size))
+    elif strategy == "random":
+        return sorted(Random(seed).sample(range(population), size))
+    else:
+        sampler = Sampler(size=size, strategy=strategy, seed=seed)
+        for index in range(population):
+            sampler.add(index)
+        return sampler.sample()
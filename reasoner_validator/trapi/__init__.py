@@ -1,11 +1,14 @@
 """TRAPI Validation Functions."""
 from json import dumps
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Iterator
+from collections.abc import Mapping
 from os.path import isfile
-import copy
 from functools import lru_cache
+from itertools import groupby
+from threading import Lock
 
 import jsonschema
+from jsonschema.exceptions import best_match
 import requests
 
 try:
@@ -15,7 +18,16 @@ except ImportError:
 
 from reasoner_validator.report import ValidationReporter
 from reasoner_validator.trapi.mapping import check_node_edge_mappings
-from reasoner_validator.github import GIT_ORG, GIT_REPO
+from reasoner_validator.trapi.schema_compiler import ValidationFunction, compile_validator
+from reasoner_validator.trapi.schema_cache import (
+    offline_schema_mode,
+    get_branch_schema_ttl,
+    MAX_CACHED_LOCAL_SCHEMATA,
+    schema_hash,
+    read_cached_schema,
+    write_cached_schema
+)
+from reasoner_validator.github import GIT_ORG, GIT_REPO, get_versions
 from reasoner_validator.versioning import SemVer, SemVerError, get_latest_version
 
 import logging
@@ -24,7 +36,18 @@ logger = logging.getLogger(__name__)
 # For testing, set TRAPI API query POST timeouts to 10 minutes == 600 seconds
 DEFAULT_TRAPI_POST_TIMEOUT = 600.0
 
+# TRAPISchemaValidator JSON schema validation backends: "jsonschema" validates
+# every instance with the (generic) jsonschema validators; "compiled" first checks
+# instances with validation functions compiled from the TRAPI schemata (see the
+# schema_compiler module), only running jsonschema validation on invalid instances.
+SCHEMA_BACKENDS: List[str] = ["jsonschema", "compiled"]
 
+# Default maximum number of JSON schema validation errors
+# traversed per TRAPI component, when reporting all schema errors
+DEFAULT_MAX_SCHEMA_ERRORS: int = 100
+
+
+TRAPI_1_3_0_BETA_SEMVER = SemVer.from_string("v1.3.0-beta")
 TRAPI_1_3_0_SEMVER = SemVer.from_string("v1.3.0")
 TRAPI_1_3_0: str = str(TRAPI_1_3_0_SEMVER)
 TRAPI_1_4_0_BETA_SEMVER = SemVer.from_string("v1.4.0-beta")
@@ -42,6 +65,7 @@ TRAPI_1_5_0_BETA_SEMVER = SemVer.from_string("v1.5.0-beta")
 TRAPI_1_5_0_BETA: str = str(TRAPI_1_5_0_BETA_SEMVER)
 TRAPI_1_5_0_SEMVER = SemVer.from_string("v1.5.0")
 TRAPI_1_5_0: str = str(TRAPI_1_5_0_SEMVER)
+TRAPI_1_6_0_SEMVER = SemVer.from_string("v1.6.0")
 
 LATEST_TRAPI_RELEASE_SEMVER: SemVer = TRAPI_1_5_0_SEMVER
 LATEST_TRAPI_RELEASE: str = TRAPI_1_5_0
@@ -69,53 +93,142 @@ class TRAPIAccessError(RuntimeError):
     pass
 
 
-@lru_cache()
-def _load_schema(schema_version: str) -> Dict:
+def _fetch_schema_text(schema_version: str) -> str:
     """
-    Load schema from GitHub version or directly from a local schema file.
+    Retrieve the original (OpenAPI YAML) text of a TRAPI schema.
     :param schema_version: either a GitHub 'v' prefixed SemVer version of a
            TRAPI schema or a file name (path) from which the TRAPI schema may be read in.
-    :return: Dict, schema components
+    :return: str, TRAPI schema text
     """
-    spec: Dict
     if schema_version.lower().endswith(".yaml"):
         # treat as a candidate TRAPI schema file path or name (the latter, assumed local)
         if not isfile(schema_version):
             raise TRAPIAccessError(f"Candidate TRAPI schema file '{schema_version}' does not exist!")
         with open(schema_version, "r") as schema_file:
-            spec = load(schema_file, Loader=Loader)
-        if spec is None:
-            raise TRAPIAccessError(f"Candidate TRAPI schema file '{schema_version}' could not be retrieved!")
+            return schema_file.read()
     else:
         result = requests.get(
             f"https://raw.githubusercontent.com/{GIT_ORG}/{GIT_REPO}/{schema_version}/TranslatorReasonerAPI.yaml"
         )
-        schema_text: str = result.text
-        spec = load(schema_text, Loader=Loader)
+        return result.text
 
+
+def _convert_schema(schema_version: str, schema_text: str) -> Dict:
+    """
+    Parse a TRAPI schema then convert its OpenAPI schema components into JSON Schema.
+    :param schema_version: TRAPI schema version (see _load_schema())
+    :param schema_text: str, TRAPI schema (OpenAPI YAML) text
+    :return: Dict, converted schema components, indexed by component name
+    """
+    spec: Optional[Dict] = load(schema_text, Loader=Loader)
+    if spec is None:
+        raise TRAPIAccessError(f"Candidate TRAPI schema '{schema_version}' could not be retrieved!")
     components = spec["components"]["schemas"]
     for component, schema in components.items():
         openapi_to_jsonschema(schema, version=schema_version)
+    return components
+
+
+def get_schema_components(schema_version: str, refresh: bool = False) -> Dict:
+    """
+    Get the JSON Schema converted components of a TRAPI schema, preferably from the
+    on-disk schema cache (see reasoner_validator.trapi.schema_cache), otherwise retrieved from GitHub
+    (or a local file), converted then saved into the cache.
+
+    Note that a local TRAPI schema file is always read in, since its (text)
+    content hash is the key to its cached conversion, whereas a GitHub
+    release is only accessed when not yet cached (or refreshed), and a
+    GitHub branch, when not cached within its time to live (see
+    reasoner_validator.trapi.schema_cache.get_branch_schema_ttl()).
+
+    :param schema_version: either a GitHub 'v' prefixed SemVer version of a
+           TRAPI schema or a file name (path) from which the TRAPI schema may be read in.
+    :param refresh: bool, if True, ignore any cached GitHub release
+                    or branch schema and retrieve it again (default: False)
+    :return: Dict, converted schema components, indexed by component name
+    """
+    components: Optional[Dict]
+    is_local_file: bool = schema_version.lower().endswith(".yaml")
+    # cached conversions of local files are keyed
+    # on their content, not on their file path
+    cache_key: str = "local_file" if is_local_file else schema_version
+    # TRAPI release schemata never change, unlike TRAPI Git branches
+    is_release: bool = schema_version in get_versions()["releases"]
+
+    if not (refresh or is_local_file):
+        components = read_cached_schema(cache_key, max_age=None if is_release else get_branch_schema_ttl())
+        if components is not None:
+            return components
+
+    if offline_schema_mode() and not is_local_file:
+        # an expired TRAPI Git branch schema is better than none
+        components = read_cached_schema(cache_key) if not refresh else None
+        if components is not None:
+            logger.warning(f"Using an expired cached schema of TRAPI '{schema_version}' (offline)")
+            return components
+        raise TRAPIAccessError(
+            f"TRAPI schema '{schema_version}' is not cached, " +
+            "but TRAPI schema retrieval is disabled (TRAPI_SCHEMA_OFFLINE environment variable)!"
+        )
+
+    schema_text: str = _fetch_schema_text(schema_version)
+    content_hash: str = schema_hash(schema_text)
+
+    if is_local_file:
+        components = read_cached_schema(cache_key, content_hash=content_hash)
+        if components is not None:
+            return components
+
+    components = _convert_schema(schema_version, schema_text)
+    write_cached_schema(cache_key, content_hash, components, keep=MAX_CACHED_LOCAL_SCHEMATA if is_local_file else 1)
+
+    return components
+
+
+# Concurrent (threaded) validators of a given TRAPI release rather
+# wait for, then share, the schema loaded by the first of them
+_load_schema_lock = Lock()
+
+
+def _load_schema(schema_version: str) -> Dict:
+    """
+    Load schema from GitHub version or directly from a local schema file.
+    :param schema_version: either a GitHub 'v' prefixed SemVer version of a
+           TRAPI schema or a file name (path) from which the TRAPI schema may be read in.
+    :return: Dict, schema components
+    """
+    with _load_schema_lock:
+        return _get_schema(schema_version)
+
+
+@lru_cache()
+def _get_schema(schema_version: str) -> Dict:
+    components: Dict = get_schema_components(schema_version)
+
+    # Rather than building a standalone copy of the whole schema for every
+    # component, the json schema of each component is simply a '$ref' into
+    # one common catalog of all the (converted) components, shared by all of them,
+    # against which the internal '#/components/schemas/...' references also resolve.
+    shared_components: Dict = {"schemas": components}
     schemas = dict()
     for component in components:
-        # build json schema against which we validate
-        subcomponents = copy.deepcopy(components)
-        schema = subcomponents.pop(component)
-        schema["components"] = {"schemas": subcomponents}
-        schemas[component] = schema
+        schemas[component] = {
+            "$ref": f"#/components/schemas/{component}",
+            "components": shared_components
+        }
     return schemas
 
 
-def load_schema(target: str):
+def _resolve_schema_version(target: str) -> str:
     """
-    Load schema from GitHub release or branch, or from a locally specified YAML schema file.
+    Resolve a TRAPI version target into the schema version used to load the schema.
     :param target: release semver, schema file path (with '.yaml' file extension)
                     or a git branch name, all referencing a target TRAPI schema.
-    :return: loaded TRAPI schema
+    :return: str, resolved schema version
     """
     mapped_release = get_latest_version(target)
     if mapped_release:
-        schema_version = mapped_release
+        return mapped_release
     else:
         err_msg: str = \
             f"Requested TRAPI version '{target}' is unknown to the system. " + \
@@ -123,7 +236,89 @@ def load_schema(target: str):
         logger.error(err_msg)
         raise ValueError(err_msg)
 
-    return _load_schema(schema_version)
+
+def load_schema(target: str):
+    """
+    Load schema from GitHub release or branch, or from a locally specified YAML schema file.
+    :param target: release semver, schema file path (with '.yaml' file extension)
+                    or a git branch name, all referencing a target TRAPI schema.
+    :return: loaded TRAPI schema
+    """
+    return _load_schema(_resolve_schema_version(target))
+
+
+@lru_cache()
+def _get_validator(schema_version: str, component: str):
+    """
+    Build a ready-to-use JSON schema validator for a given TRAPI schema component.
+    The schema is only checked once, when the validator is first built.
+    :param schema_version: resolved TRAPI schema version (see _load_schema())
+    :param component: str, TRAPI subschema (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+    :return: jsonschema validator instance
+    """
+    schema: Dict = _load_schema(schema_version)[component]
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def get_validator(target: str, component: str):
+    """
+    Get the (cached) JSON schema validator for a given TRAPI version and schema component.
+    :param target: release semver, schema file path (with '.yaml' file extension)
+                    or a git branch name, all referencing a target TRAPI schema.
+    :param component: str, TRAPI subschema (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+    :return: jsonschema validator instance, shared by all callers of the same TRAPI version and component
+    """
+    return _get_validator(_resolve_schema_version(target), component)
+
+
+@lru_cache()
+def _get_compiled_validator(schema_version: str, component: str) -> ValidationFunction:
+    return compile_validator(_get_validator(schema_version, component))
+
+
+def get_compiled_validator(target: str, component: str) -> ValidationFunction:
+    """
+    Get the (cached) compiled validation function for a given TRAPI version and schema component.
+    :param target: release semver, schema file path (with '.yaml' file extension)
+                    or a git branch name, all referencing a target TRAPI schema.
+    :param component: str, TRAPI subschema (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+    :return: ValidationFunction, returning True if a given instance is valid
+             (with the same outcome as get_validator(target, component).is_valid(instance))
+    """
+    return _get_compiled_validator(_resolve_schema_version(target), component)
+
+
+@lru_cache()
+def _get_array_validator(schema_version: str, component: str):
+    """
+    Build a ready-to-use JSON schema validator for an array of a given TRAPI schema component.
+    :param schema_version: resolved TRAPI schema version (see _load_schema())
+    :param component: str, TRAPI subschema of the array items (e.g. 'Result')
+    :return: jsonschema validator instance
+    """
+    component_schema: Dict = _load_schema(schema_version)[component]
+    schema: Dict = {
+        "type": "array",
+        "items": {"$ref": component_schema["$ref"]},
+        "components": component_schema["components"]
+    }
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def get_array_validator(target: str, component: str):
+    """
+    Get the (cached) JSON schema validator for an array of a given TRAPI version schema component,
+    e.g. a 'results' list of 'Result' objects, validated in one traversal of the array.
+    :param target: release semver, schema file path (with '.yaml' file extension)
+                    or a git branch name, all referencing a target TRAPI schema.
+    :param component: str, TRAPI subschema of the array items (e.g. 'Result')
+    :return: jsonschema validator instance, shared by all callers of the same TRAPI version and component
+    """
+    return _get_array_validator(_resolve_schema_version(target), component)
 
 
 def _output(json, flat=False):
@@ -256,7 +451,14 @@ class TRAPISchemaValidator(ValidationReporter):
             default_test: Optional[str] = None,
             default_target: Optional[str] = None,
             trapi_version: Optional[str] = None,
-            strict_validation: Optional[bool] = None
+            strict_validation: Optional[bool] = None,
+            all_schema_errors: bool = False,
+            max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS,
+            schema_backend: str = "jsonschema",
+            message_store: str = "nested",
+            max_code_messages: int = 0,
+            max_identifier_messages: int = 0,
+            counts_only: bool = False
     ):
         """
         TRAPI Validator constructor.
@@ -266,21 +468,47 @@ class TRAPISchemaValidator(ValidationReporter):
         :param trapi_version: str, version of component to validate against
         :param strict_validation: Optional[bool] = None, if True, some tests validate as 'error';  False, simply issues
                                   'info' message; A value of 'None' uses the default value for specific graph contexts.
+        :param all_schema_errors: bool = False, if True, report all the JSON schema validation errors of a
+                                  TRAPI component, grouped by schema path, rather than only the most relevant one.
+        :param max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS, maximum number of JSON schema validation errors
+                                  traversed per TRAPI component when 'all_schema_errors' is True (zero: no limit).
+        :param schema_backend: str = "jsonschema", JSON schema validation backend, one of SCHEMA_BACKENDS:
+                               "jsonschema" or "compiled" (faster validation functions compiled from the
+                               TRAPI schemata, with identical validation messages).
+        :param message_store: str = "nested", storage of the validation messages, "nested" or "columnar"
+                              (compact storage of very large numbers of messages, see ValidationReporter).
+        :param max_code_messages: int = 0, maximum number of identified messages recorded per code, beyond which
+                                  they are only counted (Default: 0, no limit; see ValidationReporter).
+        :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier,
+                                        beyond which they are only counted (Default: 0, no limit).
+        :param counts_only: bool = False, if True, identified messages are only counted, by code.
 
         """
+        if schema_backend not in SCHEMA_BACKENDS:
+            raise ValueError(f"Unknown TRAPI schema validation backend '{schema_backend}'")
+        self.schema_backend: str = schema_backend
+
         self.default_trapi: bool = False
         if trapi_version is None:
             self.default_trapi = True
         self.trapi_version = get_latest_version(trapi_version) \
             if trapi_version else get_latest_version(self.DEFAULT_TRAPI_VERSION)
+        self._resolve_trapi_features()
 
         logger.debug(f"TRAPISchemaValidator set to TRAPI Version: '{self.trapi_version}'")
 
+        self.all_schema_errors: bool = all_schema_errors
+        self.max_schema_errors: int = max_schema_errors
+
         ValidationReporter.__init__(
             self,
             default_test=default_test if default_test is not None else "Standards Test",
             default_target=default_target if default_target is not None else "TRAPI Validation",
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            message_store=message_store,
+            max_code_messages=max_code_messages,
+            max_identifier_messages=max_identifier_messages,
+            counts_only=counts_only
         )
 
     def get_trapi_version(self) -> str:
@@ -296,6 +524,31 @@ class TRAPISchemaValidator(ValidationReporter):
         :return: None
         """
         self.trapi_version = version
+        self._resolve_trapi_features()
+
+    def _resolve_trapi_features(self):
+        """
+        Resolve the TRAPI features which depend on the current TRAPI version, once per (re)setting of the
+        version, rather than comparing SemVers each time that the features are checked during validation.
+        A TRAPI version which is not a release SemVer (e.g. a Git branch name) resolves to the features
+        of the latest TRAPI release.
+        :return: None
+        """
+        current: SemVer
+        try:
+            current = SemVer.from_string(self.trapi_version)
+        except SemVerError:
+            current = LATEST_TRAPI_RELEASE_SEMVER
+
+        # Edge 'qualifiers' property, from TRAPI 1.3.0-beta onwards
+        self.trapi_has_qualifiers: bool = current >= TRAPI_1_3_0_BETA_SEMVER
+
+        # Edge provenance recorded in an Edge 'sources' property, rather than
+        # in Edge 'attributes', from TRAPI 1.4.0-beta onwards
+        self.trapi_has_sources: bool = current >= TRAPI_1_4_0_BETA_SEMVER
+
+        # Edge 'knowledge_level' and 'agent_type' attributes mandatory from TRAPI 1.6.0 onwards
+        self.trapi_requires_knowledge_level: bool = current >= TRAPI_1_6_0_SEMVER
 
     def minimum_required_trapi_version(self, version: str) -> bool:
         """
@@ -331,11 +584,17 @@ class TRAPISchemaValidator(ValidationReporter):
         >>> TRAPISchemaValidator(trapi_version="1.3.0").validate({"message": {}}, "QGraph")
 
         """
-        schema = load_schema(self.trapi_version)[component]
-        # print("instance", instance)
-        jsonschema.validate(instance, schema)
+        if self._is_valid_compiled(instance, component):
+            return
+
+        # Same outcome as jsonschema.validate(instance, schema), but
+        # using a validator built once per TRAPI version and component
+        validator = get_validator(self.trapi_version, component)
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
 
-    def is_valid_trapi_query(self, instance, component: str = "Query"):
+    def is_valid_trapi_query(self, instance, component: str = "Query", json_path: str = "$"):
         """Make sure that the Message is a syntactically valid TRAPI Query JSON object.
 
         Parameters
@@ -344,6 +603,9 @@ class TRAPISchemaValidator(ValidationReporter):
             Dict, instance to validate
         component:
             str, TRAPI subschema to validate (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result'; Default: 'Query')
+        json_path:
+            str, JSON path of the instance within its enclosing TRAPI document, prefixing the
+            JSON paths of reported validation errors (Default: '$', the instance is the document)
 
         Returns
         -------
@@ -353,24 +615,183 @@ class TRAPISchemaValidator(ValidationReporter):
         --------
         >>> TRAPISchemaValidator(trapi_version="1.3.0").is_valid_trapi_query({"message": {}}, component="Query")
         """
+        if self.all_schema_errors:
+            self.report_all_schema_errors(instance=instance, component=component, json_path=json_path)
+            return
+
         try:
             self.validate(
                 instance=instance,
                 component=component
             )
         except jsonschema.ValidationError as e:
-            if len(e.message) <= 160:
-                reason = e.message
-            else:
-                reason = e.message[0:49] + " "*5 + "... " + " "*5 + e.message[-100:-1]
             self.report(
                 code="critical.trapi.validation",
                 identifier=self.trapi_version,
                 component=component,
-                json_path=e.json_path,
-                reason=reason
+                json_path=json_path + e.json_path[1:],
+                reason=self._schema_error_reason(e)
             )
 
+    def _is_valid_compiled(self, instance, component: str) -> bool:
+        # Fast path of the "compiled" schema backend: only instances
+        # found invalid need (detailed) jsonschema validation
+        return self.schema_backend == "compiled" and \
+            get_compiled_validator(self.trapi_version, component)(instance)
+
+    @staticmethod
+    def _schema_error_reason(error: jsonschema.ValidationError) -> str:
+        if len(error.message) <= 160:
+            return error.message
+        else:
+            return error.message[0:49] + " "*5 + "... " + " "*5 + error.message[-100:-1]
+
+    def report_all_schema_errors(self, instance, component: str = "Query", json_path: str = "$"):
+        """
+        Report all the JSON schema validation errors of a TRAPI component instance, found in one
+        traversal of the instance. Errors are grouped by schema path, with each group reported as a
+        single 'critical.trapi.validation' message, giving the JSON path and reason of its first error,
+        plus the number of 'occurrences' of errors in the group, if more than one. At most
+        'max_schema_errors' errors are traversed, with any overflow reported as a warning.
+
+        :param instance: Dict, instance to validate
+        :param component: str, TRAPI subschema to validate (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+        :param json_path: str, JSON path of the instance within its enclosing TRAPI document (Default: '$')
+        :return: None (validation messages are recorded within the TRAPISchemaValidator)
+        """
+        if self._is_valid_compiled(instance, component):
+            return
+        validator = get_validator(self.trapi_version, component)
+        self._report_schema_errors(validator.iter_errors(instance), component, json_path)
+
+    def _report_schema_errors(
+            self,
+            errors: Iterator[jsonschema.ValidationError],
+            component: str,
+            json_path: str = "$"
+    ) -> List[jsonschema.ValidationError]:
+        # returns the list of (not truncated) errors reported
+        reported: List[jsonschema.ValidationError] = list()
+        errors_by_schema_path: Dict[Tuple, List[jsonschema.ValidationError]] = dict()
+        number_of_errors: int = 0
+        truncated: bool = False
+        for error in errors:
+            if self.max_schema_errors and number_of_errors >= self.max_schema_errors:
+                truncated = True
+                break
+            number_of_errors += 1
+            reported.append(error)
+            # as with validate(), pick the most relevant error
+            # amongst the alternatives of any 'oneOf' or 'anyOf'
+            error = best_match([error])
+            errors_by_schema_path.setdefault(tuple(error.absolute_schema_path), list()).append(error)
+
+        for grouped_errors in errors_by_schema_path.values():
+            error: jsonschema.ValidationError = grouped_errors[0]
+            context: Dict[str, str] = {
+                "component": component,
+                "json_path": json_path + error.json_path[1:],
+                "reason": self._schema_error_reason(error)
+            }
+            if len(grouped_errors) > 1:
+                context["occurrences"] = str(len(grouped_errors))
+            self.report(code="critical.trapi.validation", identifier=self.trapi_version, **context)
+
+        if truncated:
+            self.report(
+                code="warning.trapi.validation.truncated",
+                identifier=self.trapi_version,
+                component=component,
+                max_errors=str(self.max_schema_errors)
+            )
+
+        return reported
+
+    def is_valid_trapi_array(self, instances: List, component: str = "Result", max_invalid: int = 0) -> List[int]:
+        """
+        Validate a list of instances of a TRAPI component (e.g. the 'results' of a Message) in
+        one traversal of the list. Each invalid instance is reported, as by is_valid_trapi_query(),
+        but with a JSON path prefixed by the list index of the instance, e.g. '$[3].node_bindings'.
+        If 'all_schema_errors' is set, all the errors of all the instances are rather grouped by
+        schema path (see report_all_schema_errors()), capped by 'max_schema_errors' instead of 'max_invalid'.
+
+        :param instances: List, instances to validate
+        :param component: str, TRAPI subschema of the instances (Default: 'Result')
+        :param max_invalid: int, fail-fast threshold: stop validation after this number
+                            of invalid instances (Default: 0, validate all the instances)
+        :return: List[int], list indices of the invalid instances reported
+        """
+        if isinstance(instances, list) and self.schema_backend == "compiled":
+            is_valid: ValidationFunction = get_compiled_validator(self.trapi_version, component)
+            if all(is_valid(instance) for instance in instances):
+                return list()
+
+        validator = get_array_validator(self.trapi_version, component)
+        if self.all_schema_errors:
+            errors = self._report_schema_errors(validator.iter_errors(instances), component)
+            return sorted(set(error.path[0] for error in errors if error.path))
+
+        invalid: List[int] = list()
+        # errors of the array items are generated in
+        # list order, hence are contiguous for a given item
+        errors_by_index = groupby(validator.iter_errors(instances), key=lambda e: e.path[0] if e.path else None)
+        for index, errors in errors_by_index:
+            if max_invalid and len(invalid) >= max_invalid:
+                self.report(
+                    code="warning.trapi.validation.truncated",
+                    identifier=self.trapi_version,
+                    component=component,
+                    max_errors=str(max_invalid)
+                )
+                break
+            # same outcome as validate() of the single instance
+            error: jsonschema.ValidationError = best_match(errors)
+            self.report(
+                code="critical.trapi.validation",
+                identifier=self.trapi_version,
+                component=component,
+                json_path=error.json_path,
+                reason=self._schema_error_reason(error)
+            )
+            if index is not None:
+                invalid.append(index)
+        return invalid
+
+    def is_valid_trapi_graph_skeleton(self, graph: Dict, component: str = "KnowledgeGraph"):
+        """
+        Validate a TRAPI graph, but for the contents of its 'nodes' and 'edges' catalogs (if these
+        are objects), such that nodes and edges may then be individually validated, with
+        is_valid_trapi_graph_element(), e.g. in the same pass as their Biolink Model validation.
+
+        :param graph: Dict, TRAPI graph (e.g. KnowledgeGraph) to validate
+        :param component: str, TRAPI subschema of the graph (Default: 'KnowledgeGraph')
+        :return: None (validation messages are recorded within the TRAPISchemaValidator)
+        """
+        skeleton = graph
+        if isinstance(graph, dict):
+            skeleton = {
+                tag: dict() if tag in ["nodes", "edges"] and isinstance(value, Mapping) else value
+                for tag, value in graph.items()
+            }
+        self.is_valid_trapi_query(instance=skeleton, component=component)
+
+    def is_valid_trapi_graph_element(self, element_id: str, element, element_type: str):
+        """
+        Validate a single node or edge of a TRAPI graph, with validation
+        errors reported at the JSON path of the element within the graph.
+
+        :param element_id: str, node or edge identifier in the graph 'nodes' or 'edges' catalog
+        :param element: Dict, node or edge to validate
+        :param element_type: str, TRAPI subschema of the element, either 'Node' or 'Edge'
+        :return: None (validation messages are recorded within the TRAPISchemaValidator)
+        """
+        assert element_type in ["Node", "Edge"]
+        self.is_valid_trapi_query(
+            instance=element,
+            component=element_type,
+            json_path=f"$.{element_type.lower()}s.{element_id}"
+        )
+
     def merge(self, reporter):
         """
         Merge all messages and metadata from a second TRAPISchemaValidator,
@@ -0,0 +1,225 @@
+"""
+Memory-mapped TRAPI Response JSON files, with lazily decoded Knowledge Graph nodes and edges.
+
+A MappedResponse memory-maps a TRAPI Response JSON file and decodes it in one scan, but for the
+nodes and edges catalogs of its Knowledge Graph, of which only the (byte) offsets of the node and
+edge values are indexed, by node and edge identifier. The decoded Response holds LazyElements
+read-only mappings in place of these catalogs, each node or edge being only decoded (from the
+mapped file) on access, such that, for example, the sampling of the Knowledge Graph by
+TRAPIResponseValidator.sample_graph() only decodes the sampled edges and their nodes.
+
+The lazily decoded nodes and edges may only be accessed while the MappedResponse is open.
+"""
+from typing import Dict, Tuple, Iterator, Any
+from collections.abc import Mapping
+from json import loads, JSONDecoder
+from codecs import getincrementaldecoder
+from mmap import mmap, ACCESS_READ
+import re
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+
+_STRING_PATTERN: bytes = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING = re.compile(_STRING_PATTERN)
+
+# numbers and literals
+_SCALAR = re.compile(rb"[-+.0-9a-zA-Z]+")
+
+# anything but brackets (or strings), which is not ambiguous, hence not prone to catastrophic backtracking
+_NOT_BRACKETS: bytes = rb'[^"{}\[\]]*(?:' + _STRING_PATTERN + rb'[^"{}\[\]]*)*'
+
+_NEXT_BRACKET = re.compile(_NOT_BRACKETS + rb'[{}\[\]]')
+
+_OPENING_BRACKETS = frozenset(b"{[")
+
+
+def _nested_value_pattern(depth: int) -> bytes:
+    # JSON object or array, of nesting depth up to 'depth', matched in one
+    # go (brackets are loosely paired, the decoding of the value catching any
+    # mismatch). Note that the matching of a value takes memory proportional to
+    # its number of strings and brackets, so it is only used for small values.
+    contents: bytes = _NOT_BRACKETS
+    for _ in range(depth - 1):
+        contents = _NOT_BRACKETS + rb'(?:[{\[]' + contents + rb'[}\]]' + _NOT_BRACKETS + rb')*'
+    return rb'[{\[]' + contents + rb'[}\]]'
+
+
+# JSON objects or arrays, of (at most) the nesting depth of typical TRAPI nodes and edges
+_NESTED_VALUE = re.compile(_nested_value_pattern(depth=16))
+
+# size of the first window of text decoded, by JSON value
+_DECODING_WINDOW: int = 1 << 16
+
+# characters which may continue a JSON number
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+
+# paths of the TRAPI Knowledge Graph node and edge catalogs, lazily decoded
+LAZY_CATALOGS = (("message", "knowledge_graph", "nodes"), ("message", "knowledge_graph", "edges"))
+
+
+class LazyElements(Mapping):
+    """
+    Read-only mapping of the nodes (or edges) of a memory-mapped TRAPI Knowledge Graph,
+    by identifier, in file order, each node or edge being decoded at each access.
+    """
+    def __init__(self, data: mmap, index: Dict[str, Tuple[int, int]]):
+        """
+        :param data: mmap, memory-mapped JSON text file
+        :param index: Dict[str, Tuple[int, int]], start and end offsets of the (JSON) value of each element
+        """
+        self._data: mmap = data
+        self._index: Dict[str, Tuple[int, int]] = index
+
+    def __getitem__(self, identifier: str) -> Any:
+        start, end = self._index[identifier]
+        return loads(self._data[start:end])
+
+    def __contains__(self, identifier) -> bool:
+        return identifier in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"LazyElements({len(self)} elements)"
+
+
+class MappedResponse:
+    """
+    Memory-mapped TRAPI Response JSON file, to be used as a context manager,
+    returning the decoded Response, with LazyElements Knowledge Graph nodes and edges.
+    """
+    def __init__(self, file_path: str):
+        """
+        :param file_path: str, path of the TRAPI Response JSON file
+        """
+        self.file_path: str = file_path
+        self._file = None
+        self.data = None
+        self.position: int = 0
+        self._decoder = JSONDecoder()
+
+    def __enter__(self) -> Any:
+        self._file = open(self.file_path, "rb")
+        try:
+            self.data = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # empty files can't be memory-mapped
+            self._file.close()
+            raise ValueError(f"Invalid JSON text: empty file '{self.file_path}'")
+        try:
+            return self.load()
+        except ValueError:
+            self.__exit__(None, None, None)
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.data.close()
+        self._file.close()
+
+    def _error(self, reason: str) -> ValueError:
+        return ValueError(f"Invalid JSON text: {reason} at byte {self.position} of '{self.file_path}'")
+
+    def _peek(self) -> bytes:
+        self.position = _WHITESPACE.match(self.data, self.position).end()
+        return self.data[self.position:self.position + 1]
+
+    def _expect(self, character: bytes):
+        if self._peek() != character:
+            raise self._error(f"expecting '{character.decode()}'")
+        self.position += 1
+
+    def _skip_value(self) -> Tuple[int, int]:
+        # skip over the next JSON value, (expected to be) a node or edge, returning its start and end offsets
+        character: bytes = self._peek()
+        start: int = self.position
+        if character == b'"':
+            match = _STRING.match(self.data, start)
+        elif character in (b"{", b"["):
+            match = _NESTED_VALUE.match(self.data, start)
+            if match is None:
+                # deeply nested value, traversed one bracket at a time
+                depth: int = 1
+                self.position += 1
+                while depth:
+                    match = _NEXT_BRACKET.match(self.data, self.position)
+                    if match is None:
+                        raise self._error("unexpected end of file")
+                    self.position = match.end()
+                    depth += 1 if self.data[self.position - 1] in _OPENING_BRACKETS else -1
+                return start, self.position
+        else:
+            match = _SCALAR.match(self.data, start)
+        if match is None:
+            raise self._error("expecting a value")
+        self.position = match.end()
+        return start, self.position
+
+    def _decode_value(self) -> Any:
+        # decode the next JSON value, from windows of the file text of doubling size, until the value fits
+        self._peek()
+        start: int = self.position
+        size: int = _DECODING_WINDOW
+        while True:
+            end_of_file: bool = start + size >= len(self.data)
+            # a multibyte character cut short at the end of the window is left out
+            text: str = getincrementaldecoder("utf-8")().decode(self.data[start:start + size], final=end_of_file)
+            try:
+                value, end = self._decoder.raw_decode(text)
+                # a number may also be cut short at the end of the window
+                if end_of_file or (end < len(text) and text[end] not in _NUMBER_CHARACTERS):
+                    self.position = start + (end if text.isascii() else len(text[:end].encode()))
+                    return value
+            except ValueError as error:
+                if end_of_file:
+                    raise self._error(str(error))
+            size *= 2
+
+    def _iter_object(self) -> Iterator[str]:
+        # names of the members of the next JSON object, with the position at each member value
+        self._expect(b"{")
+        if self._peek() == b"}":
+            self.position += 1
+            return
+        while True:
+            if self._peek() != b'"':
+                raise self._error("expecting an object member name")
+            start, end = self._skip_value()
+            name: str = self.data[start + 1:end - 1].decode()
+            if "\\" in name:
+                name = loads(self.data[start:end])
+            self._expect(b":")
+            yield name
+            separator: bytes = self._peek()
+            self.position += 1
+            if separator == b"}":
+                return
+            elif separator != b",":
+                raise self._error("expecting ',' or '}'")
+
+    def _read_value(self, path: Tuple[str, ...]) -> Any:
+        # decode the next JSON value, at the given path, but for any lazily decoded catalogs
+        if self._peek() == b"{":
+            if path in LAZY_CATALOGS:
+                index: Dict[str, Tuple[int, int]] = dict()
+                for identifier in self._iter_object():
+                    index[identifier] = self._skip_value()
+                return LazyElements(self.data, index)
+            elif any(catalog[:len(path)] == path for catalog in LAZY_CATALOGS):
+                return {name: self._read_value(path + (name,)) for name in self._iter_object()}
+        return self._decode_value()
+
+    def load(self) -> Any:
+        """
+        :return: Any, decoded TRAPI Response, with LazyElements Knowledge Graph nodes and edges
+        :raises: ValueError, if the file is not valid JSON text
+        """
+        self.position = 0
+        response = self._read_value(path=())
+        if self._peek():
+            raise self._error("extra data")
+        return response
+
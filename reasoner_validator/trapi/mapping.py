@@ -9,13 +9,27 @@ class MappingValidator(ValidationReporter):
     dangling references between nodes and edges of a graph.
     This is more of a TRAPI expectation (that all nodes and edges identifiers refer to one another)
     """
-    def __init__(self):
+    def __init__(
+            self,
+            max_code_messages: int = 0,
+            max_identifier_messages: int = 0,
+            counts_only: bool = False
+    ):
         """
         Mapping Validator constructor.
+
+        :param max_code_messages: int = 0, maximum number of identified messages recorded per code
+                                  (Default: 0, no limit; see ValidationReporter)
+        :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier
+                                        (Default: 0, no limit; see ValidationReporter)
+        :param counts_only: bool = False, if True, identified messages are only counted, by code.
         """
         ValidationReporter.__init__(
             self,
-            default_target="Validating Knowledge Graph Node and Edge Mappings"
+            default_target="Validating Knowledge Graph Node and Edge Mappings",
+            max_code_messages=max_code_messages,
+            max_identifier_messages=max_identifier_messages,
+            counts_only=counts_only
         )
 
     def check_dangling_references(self, graph: Dict):
@@ -26,7 +40,24 @@ class MappingValidator(ValidationReporter):
 
 
 # Detect 'dangling nodes/edges' by iterating through node <-> edge mappings)
-def check_node_edge_mappings(graph: Dict) -> MappingValidator:
-    validator: MappingValidator = MappingValidator()
+def check_node_edge_mappings(
+        graph: Dict,
+        max_code_messages: int = 0,
+        max_identifier_messages: int = 0,
+        counts_only: bool = False
+) -> MappingValidator:
+    """
+    :param graph: Dict, TRAPI Knowledge Graph
+    :param max_code_messages: int = 0, maximum number of identified messages recorded per code (Default: 0, no limit)
+    :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier
+                                    (Default: 0, no limit)
+    :param counts_only: bool = False, if True, identified messages are only counted, by code.
+    :return: MappingValidator, with the messages about the node and edge mappings of the graph
+    """
+    validator: MappingValidator = MappingValidator(
+        max_code_messages=max_code_messages,
+        max_identifier_messages=max_identifier_messages,
+        counts_only=counts_only
+    )
     validator.check_dangling_references(graph)
     return validator
@@ -0,0 +1,233 @@
+"""
+Persistent on-disk cache of the TRAPI schema components, as converted into JSON Schema.
+
+Each converted schema is saved as a JSON file named after its TRAPI version
+(release tag or branch name) and the SHA-256 hash of the original schema YAML text,
+such that a (possibly offline) cold start of a process can simply read back the
+JSON file, skipping both the GitHub access and the YAML parsing and conversion.
+
+Files are written to a temporary file, then atomically renamed into place,
+so concurrent readers (e.g. web service workers or test runners) only
+ever see either no file or a complete file.
+
+The cache directory is set by the TRAPI_SCHEMA_CACHE_DIR environment variable
+(default: '~/.cache/reasoner-validator/trapi'). Setting it to an empty string disables the cache.
+
+The schemata of TRAPI releases never change, hence are cached without expiry, whereas the schemata of
+TRAPI Git branches (which may be updated at any time) are only read back from the cache for a limited
+time (by default, one hour) set by the TRAPI_SCHEMA_BRANCH_TTL environment variable, in seconds, beyond
+which they are retrieved again. Only the most recently cached conversions of local TRAPI schema files,
+cached by content, are kept.
+
+Setting the TRAPI_SCHEMA_OFFLINE environment variable to 'true' prevents any retrieval
+of TRAPI schemata which are not cached (see the scripts/trapi_schema_cache.py script).
+"""
+from typing import Optional, Dict, List
+from os import environ, makedirs, replace, remove, utime
+from os.path import join, expanduser, isdir, isfile, getmtime, dirname
+from time import time
+from glob import glob, escape
+from hashlib import sha256
+from json import load, dump
+from tempfile import NamedTemporaryFile
+
+from reasoner_validator.github import GIT_ORG, GIT_REPO
+
+import logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_CACHE_DIR: str = join("~", ".cache", "reasoner-validator", "trapi")
+
+# Default time to live (in seconds) of the cached schemata of TRAPI Git branches
+DEFAULT_BRANCH_SCHEMA_TTL: float = 3600.0
+
+# Maximum number of cached conversions of local TRAPI schema files
+MAX_CACHED_LOCAL_SCHEMATA: int = 10
+
+# Version of the layout and content of the cached files. This should be
+# incremented whenever the OpenAPI to JSON Schema conversion of TRAPI
+# schemata is modified, so that stale conversions are no longer used.
+SCHEMA_CACHE_FORMAT: int = 1
+
+
+def get_schema_cache_dir() -> Optional[str]:
+    """
+    :return: Optional[str], (versioned) directory of the TRAPI schema cache for the current
+             TRAPI schema GitHub organization and repository; None if the cache is disabled
+    """
+    cache_dir: str = environ.get("TRAPI_SCHEMA_CACHE_DIR", DEFAULT_SCHEMA_CACHE_DIR)
+    if not cache_dir:
+        return None
+    return join(expanduser(cache_dir), f"v{SCHEMA_CACHE_FORMAT}", GIT_ORG, GIT_REPO)
+
+
+def offline_schema_mode() -> bool:
+    """
+    :return: bool, True if TRAPI schemata may only be loaded from the
+             cached schemata, as set by the TRAPI_SCHEMA_OFFLINE environment variable
+    """
+    return environ.get("TRAPI_SCHEMA_OFFLINE", "").lower() in ["1", "true", "yes"]
+
+
+def get_branch_schema_ttl() -> float:
+    """
+    :return: float, time to live (in seconds) of the cached schemata of TRAPI Git branches,
+             as set by the TRAPI_SCHEMA_BRANCH_TTL environment variable (default: one hour)
+    """
+    ttl: str = environ.get("TRAPI_SCHEMA_BRANCH_TTL", "")
+    if not ttl:
+        return DEFAULT_BRANCH_SCHEMA_TTL
+    try:
+        return float(ttl)
+    except ValueError:
+        logger.warning(f"Ignoring invalid TRAPI_SCHEMA_BRANCH_TTL value '{ttl}'")
+        return DEFAULT_BRANCH_SCHEMA_TTL
+
+
+def schema_hash(schema_text: str) -> str:
+    """
+    :param schema_text: str, original TRAPI schema YAML text
+    :return: str, (abbreviated) SHA-256 hex digest of the schema text
+    """
+    return sha256(schema_text.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_key(schema_version: str) -> str:
+    # git branch names may contain path separators
+    return schema_version.replace("/", "_")
+
+
+def _modification_time(cache_file: str) -> float:
+    try:
+        return getmtime(cache_file)
+    except OSError:
+        # file concurrently removed
+        return 0.0
+
+
+def _cached_files(schema_version: str) -> List[str]:
+    cache_dir: Optional[str] = get_schema_cache_dir()
+    if not (cache_dir and isdir(cache_dir)):
+        return list()
+    # most recently written file first
+    return sorted(
+        glob(join(escape(cache_dir), f"{escape(_cache_key(schema_version))}.*.json")),
+        key=_modification_time,
+        reverse=True
+    )
+
+
+def _read(cache_file: str) -> Optional[Dict]:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as cached:
+            document: Dict = load(cached)
+    except (OSError, ValueError) as error:
+        # a file deleted by a concurrent refresh or otherwise unreadable simply is a cache miss
+        logger.warning(f"Ignoring unreadable TRAPI schema cache file '{cache_file}': {str(error)}")
+        return None
+    if document.get("format", None) != SCHEMA_CACHE_FORMAT or "schemas" not in document:
+        logger.warning(f"Ignoring outdated TRAPI schema cache file '{cache_file}'")
+        return None
+    return document["schemas"]
+
+
+def _write(target_file: str, schema_version: str, content_hash: str, schemas: Dict):
+    """
+    Atomically write a converted schema file: readers see either no file
+    (or a previous version of it) or the complete new file, never a partial file.
+    """
+    target_dir: str = dirname(target_file)
+    makedirs(target_dir, exist_ok=True)
+    tmp_file: Optional[str] = None
+    try:
+        with NamedTemporaryFile("w", encoding="utf-8", dir=target_dir, suffix=".tmp", delete=False) as tmp:
+            tmp_file = tmp.name
+            dump(
+                {
+                    "format": SCHEMA_CACHE_FORMAT,
+                    "source": f"{GIT_ORG}/{GIT_REPO}",
+                    "version": schema_version,
+                    "hash": content_hash,
+                    "schemas": schemas
+                },
+                tmp
+            )
+        replace(tmp_file, target_file)
+    except OSError:
+        if tmp_file:
+            try:
+                remove(tmp_file)
+            except OSError:
+                pass
+        raise
+
+
+def read_cached_schema(
+        schema_version: str,
+        content_hash: Optional[str] = None,
+        max_age: Optional[float] = None
+) -> Optional[Dict]:
+    """
+    Read the converted JSON Schema components of a given TRAPI version from the cache.
+    :param schema_version: str, TRAPI release tag or branch name
+    :param content_hash: Optional[str], hash of the original schema text (see schema_hash()).
+                         If not given, then the most recently cached schema of the version is returned.
+    :param max_age: Optional[float], maximum age (in seconds) of the cached schema, beyond which
+                    it is expired, e.g. for TRAPI Git branches (default: None, no expiry)
+    :return: Optional[Dict], converted TRAPI schema components; None if not (yet) cached, or expired
+    """
+    cache_dir: Optional[str] = get_schema_cache_dir()
+    if not cache_dir:
+        return None
+    cache_files: List[str]
+    if content_hash:
+        cache_file: str = join(cache_dir, f"{_cache_key(schema_version)}.{content_hash}.json")
+        cache_files = [cache_file] if isfile(cache_file) else list()
+    else:
+        cache_files = _cached_files(schema_version)
+    for cache_file in cache_files:
+        if max_age is not None and time() - _modification_time(cache_file) > max_age:
+            continue
+        schemas: Optional[Dict] = _read(cache_file)
+        if schemas is not None:
+            return schemas
+    return None
+
+
+def write_cached_schema(
+        schema_version: str,
+        content_hash: str,
+        schemas: Dict,
+        keep: int = 1
+) -> Optional[str]:
+    """
+    Atomically write the converted JSON Schema components of a given TRAPI version into the cache,
+    then purge any other (older) cached schema of the same TRAPI version. Caching failures are
+    only logged since the cache is simply an optimization.
+    :param schema_version: str, TRAPI release tag or branch name
+    :param content_hash: str, hash of the original schema text (see schema_hash())
+    :param schemas: Dict, converted TRAPI schema components
+    :param keep: int, number of the most recently cached schemata of the same TRAPI version
+                 kept, including this one (default: 1, i.e. any other schema is removed)
+    :return: Optional[str], path to the cache file; None if not cached
+    """
+    cache_dir: Optional[str] = get_schema_cache_dir()
+    if not cache_dir:
+        return None
+    cache_file: str = join(cache_dir, f"{_cache_key(schema_version)}.{content_hash}.json")
+    try:
+        _write(cache_file, schema_version, content_hash, schemas)
+        # in case an identical file already existed, ensure that it is now the most recent one
+        utime(cache_file)
+    except OSError as error:
+        logger.warning(f"Could not cache TRAPI schema '{schema_version}' in '{cache_dir}': {str(error)}")
+        return None
+
+    for stale_file in _cached_files(schema_version)[max(keep, 1):]:
+        if stale_file != cache_file:
+            try:
+                remove(stale_file)
+            except OSError:
+                pass
+
+    return cache_file
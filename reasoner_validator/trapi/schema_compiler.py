@@ -0,0 +1,302 @@
+"""
+Compilation of (converted) TRAPI JSON schemata into specialized Python validation functions.
+
+Generic jsonschema validation dispatches every keyword of every subschema through its keyword
+validator registry and builds (lazy) error iterators, even for valid instances. Here, each
+subschema is rather compiled once, into a closure which simply returns whether or not a given
+instance is valid. Since most validated instances are valid, the compiled function serves as
+a fast path: only instances found invalid need to be validated again by the jsonschema
+validator, to obtain the usual (detailed) validation errors.
+
+JSON Schema (draft 2020-12) keywords which are not compiled here (e.g. 'patternProperties',
+'if' or 'uniqueItems') are delegated to the jsonschema validator, for the whole subschema
+in which they are used, so that compiled functions always agree with jsonschema validation.
+"""
+from typing import Any, Optional, Dict, List, Callable
+import re
+
+from jsonschema import Draft201909Validator, Draft202012Validator
+
+ValidationFunction = Callable[[Any], bool]
+
+# Keywords having no bearing on validation, in addition to any keywords
+# unknown to the jsonschema validator, (e.g. OpenAPI 'example' tags)
+# which are also ignored during jsonschema validation.
+_ANNOTATIONS = {"format"}
+
+
+def _valid(instance) -> bool:
+    return True
+
+
+def _invalid(instance) -> bool:
+    return False
+
+
+def _is_number(instance) -> bool:
+    return isinstance(instance, (int, float)) and not isinstance(instance, bool)
+
+
+def _is_integer(instance) -> bool:
+    if isinstance(instance, bool):
+        return False
+    return isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())
+
+
+_TYPE_CHECKS: Dict[str, ValidationFunction] = {
+    "object": lambda instance: isinstance(instance, dict),
+    "array": lambda instance: isinstance(instance, list),
+    "string": lambda instance: isinstance(instance, str),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": _is_number,
+    "integer": _is_integer
+}
+
+
+def _all_of(checks: List[ValidationFunction]) -> ValidationFunction:
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(instance) -> bool:
+        for each in checks:
+            if not each(instance):
+                return False
+        return True
+
+    return check
+
+
+class SchemaCompiler:
+    """
+    Compiler of the JSON schema of a (TRAPI) validator into a validation function.
+    """
+    def __init__(self, validator):
+        """
+        :param validator: jsonschema validator instance, whose schema is to be compiled,
+                          also used to validate subschemata with keywords not compiled here.
+        """
+        self.validator = validator
+        self.keywords = set(validator.VALIDATORS.keys())
+        if validator.format_checker is None:
+            self.keywords -= _ANNOTATIONS
+        self.references: Dict[str, ValidationFunction] = dict()
+        self.compilers: Dict[str, Callable[[Any], Optional[ValidationFunction]]] = {
+            "$ref": self._compile_ref,
+            "type": self._compile_type,
+            "enum": self._compile_enum,
+            "oneOf": self._compile_one_of,
+            "anyOf": self._compile_any_of,
+            "allOf": self._compile_all_of,
+            "not": self._compile_not,
+        }
+
+    def compile(self, schema=None) -> ValidationFunction:
+        """
+        :param schema: (sub)schema to compile (default: the whole schema of the validator)
+        :return: ValidationFunction, returning True if a given instance is valid against the schema
+        """
+        if schema is None:
+            schema = self.validator.schema
+        if schema is True:
+            return _valid
+        if schema is False:
+            return _invalid
+
+        if isinstance(schema.get("items", None), list):
+            # (pre-2020-12) tuple validation of arrays
+            return self.validator.evolve(schema=schema).is_valid
+
+        checks: List[ValidationFunction] = list()
+        for keyword in schema:
+            if keyword not in self.keywords or keyword in self._TYPE_SPECIFIC_KEYWORDS:
+                continue
+            if keyword not in self.compilers:
+                # delegate the whole subschema to jsonschema
+                return self.validator.evolve(schema=schema).is_valid
+            check: Optional[ValidationFunction] = self.compilers[keyword](schema[keyword])
+            if check is None:
+                return self.validator.evolve(schema=schema).is_valid
+            checks.append(check)
+
+        for keywords, compiler in [
+            (self._OBJECT_KEYWORDS, self._compile_object),
+            (self._ARRAY_KEYWORDS, self._compile_array),
+            (self._STRING_KEYWORDS, self._compile_string),
+            (self._NUMBER_KEYWORDS, self._compile_number)
+        ]:
+            if keywords.intersection(schema.keys()):
+                checks.append(compiler(schema))
+
+        return _all_of(checks)
+
+    def _resolve(self, reference: str) -> Optional[Dict]:
+        # only local JSON pointers are compiled
+        if not reference.startswith("#/"):
+            return None
+        schema = self.validator.schema
+        for part in reference[2:].split("/"):
+            part = part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(schema, dict) or part not in schema:
+                return None
+            schema = schema[part]
+        return schema
+
+    def _compile_ref(self, reference: str) -> Optional[ValidationFunction]:
+        if reference not in self.references:
+            schema = self._resolve(reference)
+            if schema is None:
+                return None
+            # indirection allowing for recursive references
+            compiled: List[ValidationFunction] = list()
+            self.references[reference] = lambda instance: compiled[0](instance)
+            compiled.append(self.compile(schema))
+        return self.references[reference]
+
+    @staticmethod
+    def _compile_type(types) -> Optional[ValidationFunction]:
+        if isinstance(types, str):
+            return _TYPE_CHECKS.get(types, None)
+        checks: List[ValidationFunction] = [_TYPE_CHECKS[each] for each in types if each in _TYPE_CHECKS]
+        if len(checks) != len(types):
+            return None
+        return lambda instance: any(check(instance) for check in checks)
+
+    @staticmethod
+    def _compile_enum(values) -> Optional[ValidationFunction]:
+        # enumerations of other values than strings (i.e. with
+        # more subtle JSON equality semantics) are delegated
+        if not all(isinstance(value, str) for value in values):
+            return None
+        strings = frozenset(values)
+        return lambda instance: isinstance(instance, str) and instance in strings
+
+    def _compile_one_of(self, schemata) -> ValidationFunction:
+        checks: List[ValidationFunction] = [self.compile(schema) for schema in schemata]
+
+        def one_of(instance) -> bool:
+            matched: bool = False
+            for check in checks:
+                if check(instance):
+                    if matched:
+                        return False
+                    matched = True
+            return matched
+
+        return one_of
+
+    def _compile_any_of(self, schemata) -> ValidationFunction:
+        checks: List[ValidationFunction] = [self.compile(schema) for schema in schemata]
+        return lambda instance: any(check(instance) for check in checks)
+
+    def _compile_all_of(self, schemata) -> ValidationFunction:
+        return _all_of([self.compile(schema) for schema in schemata])
+
+    def _compile_not(self, schema) -> ValidationFunction:
+        check: ValidationFunction = self.compile(schema)
+        return lambda instance: not check(instance)
+
+    _OBJECT_KEYWORDS = {"properties", "required", "additionalProperties", "minProperties", "maxProperties"}
+
+    def _compile_object(self, schema: Dict) -> ValidationFunction:
+        properties: Dict[str, ValidationFunction] = {
+            name: self.compile(subschema) for name, subschema in schema.get("properties", dict()).items()
+        }
+        required: List[str] = schema.get("required", list())
+        additional: Optional[ValidationFunction] = None
+        if "additionalProperties" in schema:
+            additional = self.compile(schema["additionalProperties"])
+        min_properties: int = schema.get("minProperties", 0)
+        max_properties: Optional[int] = schema.get("maxProperties", None)
+
+        def check_object(instance) -> bool:
+            if not isinstance(instance, dict):
+                return True
+            if len(instance) < min_properties or (max_properties is not None and len(instance) > max_properties):
+                return False
+            for name in required:
+                if name not in instance:
+                    return False
+            for name, value in instance.items():
+                check = properties.get(name, additional)
+                if check is not None and not check(value):
+                    return False
+            return True
+
+        return check_object
+
+    _ARRAY_KEYWORDS = {"items", "minItems", "maxItems"}
+
+    def _compile_array(self, schema: Dict) -> ValidationFunction:
+        items: Optional[ValidationFunction] = self.compile(schema["items"]) if "items" in schema else None
+        min_items: int = schema.get("minItems", 0)
+        max_items: Optional[int] = schema.get("maxItems", None)
+
+        def check_array(instance) -> bool:
+            if not isinstance(instance, list):
+                return True
+            if len(instance) < min_items or (max_items is not None and len(instance) > max_items):
+                return False
+            if items is not None:
+                for item in instance:
+                    if not items(item):
+                        return False
+            return True
+
+        return check_array
+
+    _STRING_KEYWORDS = {"minLength", "maxLength", "pattern"}
+
+    @staticmethod
+    def _compile_string(schema: Dict) -> ValidationFunction:
+        min_length: int = schema.get("minLength", 0)
+        max_length: Optional[int] = schema.get("maxLength", None)
+        pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+
+        def check_string(instance) -> bool:
+            if not isinstance(instance, str):
+                return True
+            if len(instance) < min_length or (max_length is not None and len(instance) > max_length):
+                return False
+            return pattern is None or pattern.search(instance) is not None
+
+        return check_string
+
+    _NUMBER_KEYWORDS = {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"}
+
+    @staticmethod
+    def _compile_number(schema: Dict) -> ValidationFunction:
+        minimum = schema.get("minimum", None)
+        maximum = schema.get("maximum", None)
+        exclusive_minimum = schema.get("exclusiveMinimum", None)
+        exclusive_maximum = schema.get("exclusiveMaximum", None)
+
+        def check_number(instance) -> bool:
+            if not _is_number(instance):
+                return True
+            return not (
+                (minimum is not None and instance < minimum) or
+                (maximum is not None and instance > maximum) or
+                (exclusive_minimum is not None and instance <= exclusive_minimum) or
+                (exclusive_maximum is not None and instance >= exclusive_maximum)
+            )
+
+        return check_number
+
+    _TYPE_SPECIFIC_KEYWORDS = _OBJECT_KEYWORDS | _ARRAY_KEYWORDS | _STRING_KEYWORDS | _NUMBER_KEYWORDS
+
+
+def compile_validator(validator) -> ValidationFunction:
+    """
+    Compile the schema of a jsonschema validator into a (fast) validation function.
+    :param validator: jsonschema validator instance
+    :return: ValidationFunction, returning True if a given instance is valid, with
+             the same outcome as validator.is_valid(instance)
+    """
+    if not isinstance(validator, (Draft201909Validator, Draft202012Validator)):
+        # the keyword semantics compiled here (e.g. of '$ref' with sibling keywords) are those
+        # of the JSON Schema drafts against which the (converted) TRAPI schemata are validated
+        return validator.is_valid
+    return SchemaCompiler(validator).compile()
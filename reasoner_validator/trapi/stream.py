@@ -0,0 +1,273 @@
+"""
+Incremental reader of (possibly multi-gigabyte) TRAPI JSON documents.
+
+The JSONStreamReader parses a JSON text file a chunk at a time, holding in memory only
+the unread remainder of the current chunk and the value currently being decoded, such
+that large JSON objects and arrays (e.g. the nodes and edges catalogs of a TRAPI
+Knowledge Graph, or the list of Results of a TRAPI Message) may be traversed
+member by member, in constant memory per member, using the iter_object()
+and iter_array() generators, or skipped over, using skip_value().
+
+The reader only relies on the 'json' module of the Python standard library.
+Note that the contents of skipped JSON values are only loosely checked.
+"""
+from typing import Optional, Any, Dict, Tuple, Iterator, TextIO
+from json import JSONDecoder
+from contextlib import contextmanager
+import re
+
+DEFAULT_CHUNK_SIZE: int = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# characters which may continue a JSON number
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+
+# JSON strings, unterminated (within the buffer) strings and brackets
+_SKIPPED_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|["{}\[\]]')
+
+
+class Deferred:
+    """
+    Stand-in, within the outline of a JSON document (see JSONStreamReader.read_outline()),
+    of a non-empty JSON object or array which was skipped by the reader, to be streamed later.
+    """
+    def __init__(self, container: type):
+        """
+        :param container: type, 'dict' for a JSON object, 'list' for a JSON array
+        """
+        self.container: type = container
+
+    def __repr__(self) -> str:
+        return f"Deferred({self.container.__name__})"
+
+
+class JSONStreamReader:
+    """
+    Incremental (pull) parser of the JSON text of a file.
+    """
+    def __init__(self, source: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        :param source: TextIO, JSON text file, opened for reading
+        :param chunk_size: int, number of characters read from the file at a time (Default: 64k)
+        """
+        self.source: TextIO = source
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ""
+        self.position: int = 0
+        # number of characters of the file consumed before the current buffer
+        self.offset: int = 0
+        self.eof: bool = False
+        self._decoder = JSONDecoder()
+
+    def _fill(self) -> bool:
+        """
+        Read more of the file, dropping the consumed text from the buffer. The number of characters
+        read grows with the unconsumed text, such that decoding large values doesn't take quadratic time.
+
+        :return: bool, False if the end of the file was already reached
+        """
+        if self.eof:
+            return False
+        remainder: str = self.buffer[self.position:]
+        chunk: str = self.source.read(max(self.chunk_size, len(remainder)))
+        if not chunk:
+            self.eof = True
+        self.offset += self.position
+        self.buffer = remainder + chunk
+        self.position = 0
+        return not self.eof
+
+    def _error(self, reason: str) -> ValueError:
+        return ValueError(f"Invalid JSON text: {reason} at character {self.offset + self.position}")
+
+    def _skip_whitespace(self):
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """
+        :return: str, next (non-whitespace) character of the JSON text; empty string at the end of the file
+        """
+        self._skip_whitespace()
+        return self.buffer[self.position] if self.position < len(self.buffer) else ""
+
+    def _expect(self, character: str):
+        if self.peek() != character:
+            raise self._error(f"expecting '{character}'")
+        self.position += 1
+
+    def read_value(self) -> Any:
+        """
+        Decode the next JSON value, in full.
+
+        :return: Any, Python equivalent of the JSON value
+        :raises: ValueError, if the JSON text is invalid
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.position)
+                # a number may be cut short at the end of the buffer
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in _NUMBER_CHARACTERS):
+                    self.position = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the members of the next JSON value, which must be a JSON object, yielding each
+        member name in turn, with the reader positioned at the member value. The member value must be
+        consumed, i.e. read, iterated over or skipped, before the iteration is resumed.
+
+        :return: Iterator[str], names of the members of the JSON object
+        :raises: ValueError, if the JSON text is invalid
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("expecting an object member name")
+            name: str = self.read_value()
+            self._expect(":")
+            yield name
+            separator: str = self.peek()
+            self.position += 1
+            if separator == "}":
+                return
+            elif separator != ",":
+                raise self._error("expecting ',' or '}'")
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Iterate over the items of the next JSON value, which must be a JSON array, yielding the
+        index of each item in turn, with the reader positioned at the item. The item must be
+        consumed, i.e. read, iterated over or skipped, before the iteration is resumed.
+
+        :return: Iterator[int], indices of the items of the JSON array
+        :raises: ValueError, if the JSON text is invalid
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        index: int = 0
+        while True:
+            yield index
+            index += 1
+            separator: str = self.peek()
+            self.position += 1
+            if separator == "]":
+                return
+            elif separator != ",":
+                raise self._error("expecting ',' or ']'")
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        :return: Iterator[Tuple[str, Any]], (name, value) of the members of the next JSON value, a JSON object
+        """
+        for name in self.iter_object():
+            yield name, self.read_value()
+
+    def iter_values(self) -> Iterator[Any]:
+        """
+        :return: Iterator[Any], items of the next JSON value, a JSON array
+        """
+        for _ in self.iter_array():
+            yield self.read_value()
+
+    def skip_value(self):
+        """
+        Skip over the next JSON value, without decoding its contents, if a JSON object or array.
+        """
+        if self.peek() not in ("{", "["):
+            self.read_value()
+            return
+        self.position += 1
+        self._skip_contents()
+
+    def _skip_contents(self):
+        # skip over the rest of a JSON object or array, up to its closing bracket
+        depth: int = 1
+        while depth:
+            match = _SKIPPED_TOKEN.search(self.buffer, self.position)
+            if match is None or match.group() == '"':
+                # the rest of the buffer is skipped, but for any string cut short
+                self.position = match.start() if match else len(self.buffer)
+                if not self._fill():
+                    raise self._error("unexpected end of file")
+                continue
+            self.position = match.end()
+            token: str = match.group()
+            if token in ("{", "["):
+                depth += 1
+            elif token in ("}", "]"):
+                depth -= 1
+
+    def find(self, *path: str) -> bool:
+        """
+        Position the reader at the value of a (nested) member of the next JSON value,
+        skipping over all other members along the path.
+
+        :param path: str, names of the nested JSON object members leading to the target value
+        :return: bool, True if the value was found; False otherwise (the reader is then left at an undefined position)
+        """
+        for name in path:
+            if self.peek() != "{":
+                return False
+            for member in self.iter_object():
+                if member == name:
+                    break
+                self.skip_value()
+            else:
+                return False
+        return True
+
+    def read_outline(self, deferred: Dict[Tuple[str, ...], type], path: Tuple[str, ...] = ()) -> Any:
+        """
+        Decode the next JSON value in full, but for the non-empty JSON objects or arrays found at the given
+        (nested member) paths, which are skipped and replaced by a Deferred stand-in in the decoded value.
+
+        :param deferred: Dict[Tuple[str, ...], type], paths of the JSON values to be deferred, with the type
+                         ('dict' for a JSON object, 'list' for a JSON array) of the values to be deferred
+        :param path: Tuple[str, ...], path of the next JSON value (Default: empty, the whole document)
+        :return: Any, Python equivalent of the JSON value, with deferred values
+        """
+        character: str = self.peek()
+        if path in deferred and character == ("{" if deferred[path] is dict else "["):
+            self.position += 1
+            if self.peek() == ("}" if character == "{" else "]"):
+                self.position += 1
+                return deferred[path]()
+            self._skip_contents()
+            return Deferred(deferred[path])
+        if character == "{" and any(len(target) > len(path) and target[:len(path)] == path for target in deferred):
+            return {name: self.read_outline(deferred, path + (name,)) for name in self.iter_object()}
+        return self.read_value()
+
+
+@contextmanager
+def open_stream(
+        file_path: str,
+        *path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Optional[JSONStreamReader]]:
+    """
+    Open a JSON text file for incremental reading, from the value of a given (nested) member of the JSON document.
+
+    :param file_path: str, path of a JSON text file
+    :param path: str, names of the nested JSON object members leading to the target value (Default: whole document)
+    :param chunk_size: int, number of characters read from the file at a time (Default: 64k)
+    :return: Iterator[Optional[JSONStreamReader]], reader positioned at the target value (None if not found)
+    """
+    # JSON text is UTF-8 encoded (RFC 8259), whatever the locale
+    with open(file_path, "r", encoding="utf-8") as source:
+        reader = JSONStreamReader(source, chunk_size=chunk_size)
+        yield reader if reader.find(*path) else None
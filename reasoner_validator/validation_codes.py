@@ -1,6 +1,8 @@
 import copy
 from os.path import join, abspath, dirname
-from typing import Optional, Any, Dict, List, Tuple, Union, NamedTuple
+from typing import Optional, Any, Dict, List, Tuple, Union, NamedTuple, Mapping
+from types import MappingProxyType
+from threading import Lock
 
 try:
     from yaml import load, CLoader as Loader
@@ -16,6 +18,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_CODES_DOCUMENTATION_FILE = abspath(join(dirname(__file__), "..", "docs", "validation_codes_dictionary.md"))
 
 
+class CodeEntry(NamedTuple):
+    """
+    Validation code (leaf) entry of the codes.yaml file.
+    """
+    message_type: str
+    template: str
+    context: Optional[Tuple[str, ...]]
+    description: Optional[str]
+
+
+_code_table_lock = Lock()
+
+
 class CodeDictionary:
 
     CODE_DICTIONARY_FILE: str = abspath(join(dirname(__file__), "codes.yaml"))
@@ -26,6 +41,9 @@ class CodeDictionary:
 
     code_dictionary: Optional[Dict] = None
 
+    # flat, read-only, catalog of the code entries, by (dot delimited) validation code
+    code_table: Optional[Mapping[str, CodeEntry]] = None
+
     @classmethod
     def _get_code_dictionary(cls) -> Dict:
         if not cls.code_dictionary:
@@ -34,6 +52,47 @@ class CodeDictionary:
                 cls.code_dictionary = load(f, Loader=Loader)
         return cls.code_dictionary
 
+    @classmethod
+    def _add_code_table_entries(cls, root: str, code_subtree: Dict, table: Dict[str, CodeEntry]):
+        for tag, value in code_subtree.items():
+            if not isinstance(value, Dict) or not value:
+                continue
+            code: str = f"{root}.{tag}"
+            if cls.MESSAGE not in value:
+                # Recurse down to leaf of tree
+                cls._add_code_table_entries(code, value, table)
+            else:
+                context: Optional[List[str]] = value.get(cls.CONTEXT, None)
+                table[code] = CodeEntry(
+                    message_type=cls.get_message_type(code),
+                    template=value[cls.MESSAGE],
+                    context=tuple(context) if context is not None else None,
+                    description=value.get(cls.DESCRIPTION, None)
+                )
+
+    @classmethod
+    def get_code_table(cls) -> Mapping[str, CodeEntry]:
+        """
+        :return: Mapping[str, CodeEntry], read-only catalog of all the (leaf) code entries, by validation code,
+                 built once from the code dictionary
+        """
+        if cls.code_table is None:
+            with _code_table_lock:
+                if cls.code_table is None:
+                    table: Dict[str, CodeEntry] = dict()
+                    for message_type, code_subtree in cls._get_code_dictionary().items():
+                        cls._add_code_table_entries(message_type, code_subtree, table)
+                    cls.code_table = MappingProxyType(table)
+        return cls.code_table
+
+    @classmethod
+    def get_code_table_entry(cls, code: Optional[str]) -> Optional[CodeEntry]:
+        """
+        :param code: Optional[str], dot delimited validation message code identifier (None is ok, but returns None)
+        :return: Optional[CodeEntry], entry of the code, if it is a (leaf) code of the code dictionary; None otherwise
+        """
+        return cls.get_code_table().get(code, None) if code else None
+
     @classmethod
     def filter_copy_by_facet(cls, tree: Dict, facet: str) -> Dict:
         """
@@ -157,27 +216,33 @@ class CodeDictionary:
 
         :return: Dict, single terminal leaf code entry (complete with indicated or all facets); None, if not available
         """
-        value: Optional[Tuple[str, Dict[str, str]]] = cls.get_code_subtree(code, facet=facet, is_leaf=True)
-        if not value:
+        code_entry: Optional[CodeEntry] = cls.get_code_table_entry(code)
+        if code_entry is None:
             return None
-        entry: Optional[Dict[str, str]]
-        message_type, entry = value
+        # a fresh copy of the code entry, which callers may modify
+        entry: Dict[str, Any] = {cls.MESSAGE: code_entry.template}
+        if code_entry.context is not None:
+            entry[cls.CONTEXT] = list(code_entry.context)
+        if code_entry.description is not None:
+            entry[cls.DESCRIPTION] = code_entry.description
+        if facet:
+            entry = {key: value for key, value in entry.items() if key == f"${facet.lower()}"}
         return entry
 
     @classmethod
     def get_message_template(cls, code: Optional[str]) -> Optional[str]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.MESSAGE] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code_table_entry(code)
+        return entry.template if entry else None
 
     @classmethod
     def get_message_context(cls, code: Optional[str]) -> Optional[List[str]]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.CONTEXT] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code_table_entry(code)
+        return list(entry.context) if entry and entry.context is not None else None
 
     @classmethod
     def get_description(cls, code: Optional[str]) -> Optional[str]:
-        entry: Optional[Dict[str, str]] = cls.get_code_entry(code)
-        return entry[cls.DESCRIPTION] if entry else None
+        entry: Optional[CodeEntry] = cls.get_code_table_entry(code)
+        return entry.description if entry else None
 
     @staticmethod
     def validation_code_tag(code: str) -> str:
@@ -211,14 +276,14 @@ class CodeDictionary:
         if messages is None:
             messages = {"global": None}
 
-        value: Optional[Tuple[str, Dict[str, str]]] = cls.get_code_subtree(code, is_leaf=True)
-        assert value, f"CodeDictionary.display(): unknown message code {code}"
+        entry: Optional[CodeEntry] = cls.get_code_table_entry(code)
+        assert entry, f"CodeDictionary.display(): unknown message code {code}"
 
-        message_type = cls.get_message_type(code)
+        message_type = entry.message_type
         message_type_prefix: str = f"{message_type.upper()} - " if add_prefix else ""
         context: str = cls.validation_code_tag(code) + ": " if add_prefix else ""
 
-        template: str = cls.get_message_template(code)
+        template: str = entry.template
         message_set: Dict = dict()
 
         # 'messages' is an instance of 'SCOPED_MESSAGES' that is a Dict[<scope>, Optional[IDENTIFIED_MESSAGES]]
@@ -1,5 +1,9 @@
-from typing import Optional, List, Dict, Set, Tuple
+from typing import Optional, Any, List, Dict, Set, Tuple, Collection, Sequence, Union, Iterator, Iterable
+from collections.abc import Mapping
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from random import Random
 from reasoner_validator.biolink import (
     BiolinkValidator,
     get_biolink_model_toolkit
@@ -9,12 +13,23 @@ from reasoner_validator import post_query, NODE_NORMALIZER_SERVER
 from reasoner_validator.biolink import is_curie
 from reasoner_validator.biolink.ontology import get_parent_concept
 from reasoner_validator.report import TRAPIGraphType
+from reasoner_validator.sampling import (
+    SAMPLING_STRATEGIES,
+    Sampler,
+    edge_stratum,
+    result_stratum,
+    sample_indices
+)
 from reasoner_validator.trapi import (
     LATEST_TRAPI_RELEASE,
     TRAPI_1_4_0_SEMVER,
-    check_node_edge_mappings
+    DEFAULT_MAX_SCHEMA_ERRORS,
+    check_node_edge_mappings,
+    get_validator
 )
 from reasoner_validator.trapi.mapping import MappingValidator
+from reasoner_validator.trapi.stream import Deferred, open_stream
+from reasoner_validator.trapi.lazy import LazyElements
 from reasoner_validator.versioning import SemVer, SemVerError, get_latest_version
 
 import logging
@@ -25,6 +40,14 @@ logger = logging.getLogger(__name__)
 # Biolink Model release compliance only needs to be superficial
 RESULT_TEST_DATA_SAMPLE_SIZE = 10
 
+# The (potentially huge) components of a TRAPI Response which are streamed,
+# rather than loaded in memory, by the validation of a TRAPI Response file
+STREAMED_RESPONSE_COMPONENTS: Dict[Tuple[str, ...], type] = {
+    ("message", "knowledge_graph", "nodes"): dict,
+    ("message", "knowledge_graph", "edges"): dict,
+    ("message", "results"): list
+}
+
 
 class TRAPIResponseValidator(BiolinkValidator):
     """
@@ -39,7 +62,18 @@ class TRAPIResponseValidator(BiolinkValidator):
             biolink_version: Optional[str] = None,
             target_provenance: Optional[Dict[str, str]] = None,
             strict_validation: Optional[bool] = None,
-            suppress_empty_data_warnings: bool = False
+            suppress_empty_data_warnings: bool = False,
+            all_schema_errors: bool = False,
+            max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS,
+            schema_backend: str = "jsonschema",
+            incremental_kg_validation: bool = False,
+            biolink_workers: int = 0,
+            sampling: str = "first",
+            sampling_seed: Optional[int] = None,
+            message_store: str = "nested",
+            max_code_messages: int = 0,
+            max_identifier_messages: int = 0,
+            counts_only: bool = False
     ):
         """
         :param default_test: Optional[str] =  None, initial default test context of the TRAPIResponseValidator messages
@@ -53,7 +87,36 @@ class TRAPIResponseValidator(BiolinkValidator):
         :param suppress_empty_data_warnings: bool = False, validation normally reports empty Message query graph,
                                 knowledge graph and results as warnings. This flag suppresses the reporting
                                 of such warnings (default: False).
+        :param all_schema_errors: bool = False, if True, report all the TRAPI schema validation errors of a
+                                  TRAPI component, grouped by schema path, rather than only the most relevant one.
+        :param max_schema_errors: int = DEFAULT_MAX_SCHEMA_ERRORS, maximum number of schema validation errors
+                                  traversed per TRAPI component when 'all_schema_errors' is True (zero: no limit).
+        :param schema_backend: str = "jsonschema", TRAPI schema validation backend, "jsonschema" or "compiled"
+                               (faster validation functions compiled from the TRAPI schemata).
+        :param incremental_kg_validation: bool = False, if True, each Knowledge Graph node and edge is
+                               individually validated against the TRAPI schema, in the same pass as its
+                               Biolink Model validation, rather than validating the whole Knowledge Graph
+                               as one TRAPI schema component; schema errors are thus reported for every
+                               invalid node and edge, at their JSON path in the Knowledge Graph.
+        :param biolink_workers: int = 0, if greater than one, the number of worker processes sharing the
+                                Biolink Model validation of the nodes and edges of large Knowledge Graphs,
+                                with the same outcome as their (default) serial validation.
+        :param sampling: str = "first", strategy of the sampling of the Knowledge Graph edges and Results validated,
+                         when their number is capped, one of SAMPLING_STRATEGIES (see reasoner_validator.sampling):
+                         "first" (Default), "random", "stratified" (by edge predicate and primary knowledge source)
+                         or "reservoir" (single pass uniform random sampling).
+        :param sampling_seed: Optional[int] = None, seed of the random sampling strategies, for reproducible
+                              samples (Default: None, i.e. samples differ from one validation to the next).
+        :param message_store: str = "nested", storage of the validation messages, "nested" or "columnar"
+                              (compact storage of very large numbers of messages, see ValidationReporter).
+        :param max_code_messages: int = 0, maximum number of identified messages recorded per code, beyond which
+                                  they are only counted (Default: 0, no limit; see ValidationReporter).
+        :param max_identifier_messages: int = 0, maximum number of parameterized messages recorded per identifier,
+                                        beyond which they are only counted (Default: 0, no limit).
+        :param counts_only: bool = False, if True, identified messages are only counted, by code.
         """
+        if sampling not in SAMPLING_STRATEGIES:
+            raise ValueError(f"Unknown sampling strategy '{sampling}'")
         BiolinkValidator.__init__(
             self,
             default_test=default_test,
@@ -61,10 +124,21 @@ class TRAPIResponseValidator(BiolinkValidator):
             trapi_version=trapi_version,
             biolink_version=biolink_version,
             target_provenance=target_provenance,
-            strict_validation=strict_validation
+            strict_validation=strict_validation,
+            all_schema_errors=all_schema_errors,
+            max_schema_errors=max_schema_errors,
+            schema_backend=schema_backend,
+            biolink_workers=biolink_workers,
+            message_store=message_store,
+            max_code_messages=max_code_messages,
+            max_identifier_messages=max_identifier_messages,
+            counts_only=counts_only
         )
         self._is_trapi_1_4_or_later: Optional[bool] = None
         self.suppress_empty_data_warnings: bool = suppress_empty_data_warnings
+        self.incremental_kg_validation: bool = incremental_kg_validation
+        self.sampling: str = sampling
+        self.sampling_seed: Optional[int] = sampling_seed
 
     def is_trapi_1_4_or_later(self) -> bool:
         assert self.trapi_version
@@ -74,7 +148,7 @@ class TRAPIResponseValidator(BiolinkValidator):
             self._is_trapi_1_4_or_later = target_major_version >= TRAPI_1_4_0_SEMVER
         except SemVerError as sve:
             logger.error(f"Current TRAPI release '{self.trapi_version}' seems invalid: {str(sve)}. Reset to latest?")
-            self.trapi_version = LATEST_TRAPI_RELEASE
+            self.reset_trapi_version(LATEST_TRAPI_RELEASE)
             self._is_trapi_1_4_or_later = True
         return self._is_trapi_1_4_or_later
 
@@ -106,7 +180,8 @@ class TRAPIResponseValidator(BiolinkValidator):
             self,
             response: Optional[Dict],
             max_kg_edges: int = 0,
-            max_results: int = 0
+            max_results: int = 0,
+            max_invalid_results: int = 0
     ):
         """
         One stop validation of all components of a TRAPI-schema compliant
@@ -127,6 +202,8 @@ class TRAPIResponseValidator(BiolinkValidator):
                                   knowledge graph of the response. A value of zero triggers validation
                                   of all edges in the knowledge graph (Default: 0 - use all edges)
         :param max_results: int, target sample number of results to validate (default: 0 for 'use all results').
+        :param max_invalid_results: int, fail-fast threshold: stop the validation of results after this number
+                                    of schema-invalid results (default: 0 for 'validate all sampled results').
 
         """
         if not (response and "message" in response):
@@ -136,35 +213,7 @@ class TRAPIResponseValidator(BiolinkValidator):
             # nothing more to validate?
             return
 
-        # Note the 'trapi_version' and 'biolink_version' recorded
-        # in the 'response_json' (if the tags are provided; issue warning otherwise)
-        if 'schema_version' not in response:
-            self.report(code="warning.trapi.response.schema_version.missing")
-        else:
-            # TODO: this section feels a bit confusing:  What's the *real*
-            #       TRAPI versioning precedence needed here?
-            # TRAPI JSON specified versions override default versions
-            if self.default_trapi:
-                self.trapi_version = get_latest_version(response["schema_version"])
-            trapi_version: str = response['schema_version'] \
-                if not self.trapi_version else self.trapi_version
-            logger.debug(
-                f"TRAPI Response reported TRAPI version is: '{trapi_version}'"
-            )
-
-        if 'biolink_version' not in response:
-            self.report(code="warning.trapi.response.biolink_version.missing")
-        else:
-            # TODO: this section feels a bit confusing:  What's the *real*
-            #       Biolink Model versioning precedence needed here?
-            if self.default_biolink:
-                self.bmt = get_biolink_model_toolkit(biolink_version=response["biolink_version"])
-                self.biolink_version = self.bmt.get_model_version()
-            biolink_version = response['biolink_version'] \
-                if not self.get_biolink_version() else self.get_biolink_version()
-            logger.debug(
-                f"TRAPI Response reported Biolink Model version is: '{biolink_version}'"
-            )
+        self.check_response_versions(response)
 
         # Here, we split the TRAPI Response.Message out from the other
         # Response components, to allow for independent TRAPI Schema
@@ -178,18 +227,13 @@ class TRAPIResponseValidator(BiolinkValidator):
         if message:
             response = self.sanitize_workflow(response)
 
-            self.is_valid_trapi_query(instance=response, component="Response")
-            if not self.has_critical():
-
-                status: Optional[str] = response['status'] if 'status' in response else None
-                if status and status not in ["OK", "Success", "QueryNotTraversable", "KPsNotAvailable"]:
-                    self.report("warning.trapi.response.status.unknown", identifier=status)
+            if self.has_valid_response_header(response):
 
                 # Sequentially validate the Query Graph, Knowledge Graph then validate
                 # the Results (which rely on the validity of the other two components)
-                elif self.has_valid_query_graph(message) and \
+                if self.has_valid_query_graph(message) and \
                         self.has_valid_knowledge_graph(message, max_kg_edges):
-                    self.has_valid_results(message, max_results)
+                    self.has_valid_results(message, max_results, max_invalid_results)
 
             # else:
             #     we don't validate further if it has
@@ -205,32 +249,125 @@ class TRAPIResponseValidator(BiolinkValidator):
         # to the Response before returning
         response['message'] = message
 
+    def check_response_versions(self, response: Dict):
+        """
+        Note the 'trapi_version' and 'biolink_version' recorded in a
+        TRAPI Response (if the tags are provided; issue warnings otherwise).
+
+        :param response: Dict, Query.Response being validated
+        """
+        if 'schema_version' not in response:
+            self.report(code="warning.trapi.response.schema_version.missing")
+        else:
+            # TODO: this section feels a bit confusing:  What's the *real*
+            #       TRAPI versioning precedence needed here?
+            # TRAPI JSON specified versions override default versions
+            if self.default_trapi:
+                self.reset_trapi_version(get_latest_version(response["schema_version"]))
+            trapi_version: str = response['schema_version'] \
+                if not self.trapi_version else self.trapi_version
+            logger.debug(
+                f"TRAPI Response reported TRAPI version is: '{trapi_version}'"
+            )
+
+        if 'biolink_version' not in response:
+            self.report(code="warning.trapi.response.biolink_version.missing")
+        else:
+            # TODO: this section feels a bit confusing:  What's the *real*
+            #       Biolink Model versioning precedence needed here?
+            if self.default_biolink:
+                self.bmt = get_biolink_model_toolkit(biolink_version=response["biolink_version"])
+                self.biolink_version = self.bmt.get_model_version()
+                self.bmi = None
+                self._resolve_biolink_features()
+            biolink_version = response['biolink_version'] \
+                if not self.get_biolink_version() else self.get_biolink_version()
+            logger.debug(
+                f"TRAPI Response reported Biolink Model version is: '{biolink_version}'"
+            )
+
+    def has_valid_response_header(self, response: Dict) -> bool:
+        """
+        Validate the components of a TRAPI Response other than its Message.
+
+        :param response: Dict, Query.Response, with its Message replaced by an empty stub
+        :return: bool, True if the Message of the Response is worth validating further
+        """
+        self.is_valid_trapi_query(instance=response, component="Response")
+        if self.has_critical():
+            return False
+
+        status: Optional[str] = response['status'] if 'status' in response else None
+        if status and status not in ["OK", "Success", "QueryNotTraversable", "KPsNotAvailable"]:
+            self.report("warning.trapi.response.status.unknown", identifier=status)
+            return False
+
+        return True
+
     @staticmethod
-    def sample_results(results: List, sample_size: int = 0) -> List:
+    def sample_result_indices(
+            results: List,
+            sample_size: int,
+            strategy: str = "first",
+            seed: Optional[int] = None
+    ) -> List[int]:
+        """
+        :param results: List, original list of Results
+        :param sample_size: int, (positive) target sample size
+        :param strategy: str = "first", sampling strategy, one of SAMPLING_STRATEGIES
+        :param seed: Optional[int] = None, seed of the random sampling strategies (Default: None, unseeded)
+
+        :return: List[int], list indices of the 'sample_size' sized sample of Results, in increasing order
+        """
+        if strategy == "stratified":
+            sampler = Sampler(size=sample_size, strategy=strategy, seed=seed)
+            for index, result in enumerate(results):
+                sampler.add(index, stratum=result_stratum(result))
+            return sampler.sample()
+        return sample_indices(len(results), sample_size, strategy=strategy, seed=seed)
+
+    @classmethod
+    def sample_results(
+            cls,
+            results: List,
+            sample_size: int = 0,
+            strategy: str = "first",
+            seed: Optional[int] = None
+    ) -> List:
         """
         Subsample the results to a maximum size of 'sample_size'
 
         :param results: List, original list of Results
         :param sample_size: int, target sample size (default: 0 for 'use all results').
+        :param strategy: str = "first", sampling strategy, one of SAMPLING_STRATEGIES (Default: the first Results)
+        :param seed: Optional[int] = None, seed of the random sampling strategies (Default: None, unseeded)
 
         :return: List, 'sample_size' sized subset of Results
         """
         if sample_size > 0:
-            sample_size = min(sample_size, len(results))
-            return results[0:sample_size]
+            if strategy == "first":
+                sample_size = min(sample_size, len(results))
+                return results[0:sample_size]
+            return [results[index] for index in cls.sample_result_indices(results, sample_size, strategy, seed)]
         else:
             return results
 
     @staticmethod
-    def sample_graph(graph: Dict, edges_limit: int = 0) -> Dict:
+    def sample_graph(graph: Dict, edges_limit: int = 0, strategy: str = "first", seed: Optional[int] = None) -> Dict:
         """
-        Only process a strict subsample of the TRAPI Response Message knowledge graph.
+        Only process a strict subsample of the TRAPI Response Message knowledge graph. If the nodes and edges
+        of the knowledge graph are lazily decoded (e.g. LazyElements of a MappedResponse), only the sampled
+        edges and their nodes are decoded (but for the "stratified" strategy, which reads all the edges).
 
         :param graph: original knowledge graph
         :type graph: Dict
         :param edges_limit: integer maximum number of edges to be validated in the knowledge graph. A value of zero
                             triggers validation of all edges in the knowledge graph (Default: 0 - use all edges)
         :type edges_limit: int
+        :param strategy: sampling strategy of the edges, one of SAMPLING_STRATEGIES (Default: the first edges)
+        :type strategy: str
+        :param seed: seed of the random sampling strategies (Default: None, unseeded)
+        :type seed: Optional[int]
 
         :return: Dict, 'edges_limit' sized subset of knowledge graph
         """
@@ -247,8 +384,19 @@ class TRAPIResponseValidator(BiolinkValidator):
             # of graph edges is smaller or some subject or
             # object ids are missing in the nodes list.
             sample_size = min(edges_limit, len(graph["edges"]))
-            n = 0
-            for key, edge in graph['edges'].items():
+            if strategy == "first":
+                edge_ids = islice(graph['edges'], sample_size)
+            elif strategy == "stratified":
+                sampler = Sampler(size=sample_size, strategy=strategy, seed=seed)
+                for key, edge in graph['edges'].items():
+                    sampler.add(key, stratum=edge_stratum(edge))
+                edge_ids = sampler.sample()
+            else:
+                keys: List[str] = list(graph['edges'])
+                edge_ids = [keys[index] for index in sample_indices(len(keys), sample_size, strategy, seed)]
+
+            for key in edge_ids:
+                edge = graph['edges'][key]
 
                 kg_sample['edges'][key] = edge
 
@@ -262,10 +410,6 @@ class TRAPIResponseValidator(BiolinkValidator):
                         edge['object'] not in kg_sample['nodes']:
                     kg_sample['nodes'][edge['object']] = graph['nodes'][edge['object']]
 
-                n += 1
-                if n == sample_size:
-                    break
-
             return kg_sample
 
         else:
@@ -338,35 +482,78 @@ class TRAPIResponseValidator(BiolinkValidator):
                 if not self.suppress_empty_data_warnings:
                     self.report(code="warning.trapi.response.message.knowledge_graph.empty")
             else:
-                mapping_validator: MappingValidator = check_node_edge_mappings(knowledge_graph)
+                mapping_validator: MappingValidator = check_node_edge_mappings(
+                    knowledge_graph,
+                    max_code_messages=self.max_code_messages,
+                    max_identifier_messages=self.max_identifier_messages,
+                    counts_only=self.counts_only
+                )
                 if mapping_validator.has_messages():
                     self.merge(mapping_validator)
 
                 # ...then if not empty, validate a subgraph sample of the associated
                 # Knowledge Graph (since some TRAPI response kg's may be huge!)
-                kg_sample = self.sample_graph(graph=knowledge_graph, edges_limit=edges_limit)
-
-                # Verify that the sample of the knowledge graph is TRAPI compliant
-                self.is_valid_trapi_query(instance=kg_sample, component="KnowledgeGraph")
+                kg_sample = self.sample_graph(
+                    graph=knowledge_graph,
+                    edges_limit=edges_limit,
+                    strategy=self.sampling,
+                    seed=self.sampling_seed
+                )
 
-                if self.validate_biolink():
-                    # Conduct validation of Biolink Model compliance of the
-                    # Knowledge Graph, if Biolink validation not suppressed...
-                    self.check_biolink_model_compliance(
-                        graph=kg_sample,
-                        graph_type=TRAPIGraphType.Knowledge_Graph
-                    )
+                if self.incremental_kg_validation:
+                    self.validate_knowledge_graph_elements(kg_sample)
+                else:
+                    # TRAPI schema validation of the whole sample needs
+                    # any lazily decoded nodes and edges to be decoded
+                    kg_sample = {
+                        tag: dict(elements) if isinstance(elements, LazyElements) else elements
+                        for tag, elements in kg_sample.items()
+                    }
+
+                    # Verify that the sample of the knowledge graph is TRAPI compliant
+                    self.is_valid_trapi_query(instance=kg_sample, component="KnowledgeGraph")
+
+                    if self.validate_biolink():
+                        # Conduct validation of Biolink Model compliance of the
+                        # Knowledge Graph, if Biolink validation not suppressed...
+                        self.check_biolink_model_compliance(
+                            graph=kg_sample,
+                            graph_type=TRAPIGraphType.Knowledge_Graph
+                        )
 
         # Only 'error' but not 'info' nor 'warning'
         # messages invalidate the overall Message
         return False if self.has_errors() else True
 
-    def has_valid_results(self, message: Dict, sample_size: int = 0) -> bool:
+    def validate_knowledge_graph_elements(self, kg_sample: Dict):
+        """
+        TRAPI schema validation of each of the nodes and edges of a (sample of a)
+        Knowledge Graph, in a single pass over them with their Biolink Model validation.
+
+        :param kg_sample: Dict, (sample of a) Knowledge Graph
+        """
+        if self.validate_biolink():
+            self.check_biolink_model_compliance(
+                graph=kg_sample,
+                graph_type=TRAPIGraphType.Knowledge_Graph,
+                validate_schema=True
+            )
+        else:
+            self.is_valid_trapi_graph_skeleton(graph=kg_sample, component="KnowledgeGraph")
+            for element_type in ["Node", "Edge"]:
+                elements = kg_sample.get(f"{element_type.lower()}s", None)
+                if isinstance(elements, Mapping):
+                    for element_id, element in elements.items():
+                        self.is_valid_trapi_graph_element(element_id, element, element_type)
+
+    def has_valid_results(self, message: Dict, sample_size: int = 0, max_invalid_results: int = 0) -> bool:
         """
         Validate a TRAPI Results.
 
         :param message: input message expected to contain the 'results'
         :param sample_size: int, sample number of results to validate (default: 0 for 'use all results').
+        :param max_invalid_results: int, fail-fast threshold: stop the validation of results after this number
+                                    of schema-invalid results (default: 0 for 'validate all sampled results').
 
         :return: bool, False, if validation errors
         """
@@ -395,11 +582,31 @@ class TRAPIResponseValidator(BiolinkValidator):
 
             else:
                 # Validate a subsample of a non-empty Message.results component.
-                results_sample = self.sample_results(results, sample_size=sample_size)
-                for result in results_sample:
+                if sample_size > 0 and self.sampling != "first":
+                    # Results sampled across the list are validated one at a time,
+                    # for errors to be reported at their index in the Message.results
+                    results_sample = [
+                        result for _, result in self._validate_results(
+                            (
+                                (index, results[index])
+                                for index in self.sample_result_indices(
+                                    results, sample_size, strategy=self.sampling, seed=self.sampling_seed
+                                )
+                            ),
+                            max_invalid_results=max_invalid_results
+                        )
+                    ]
+                else:
+                    results_sample = self.sample_results(results, sample_size=sample_size)
 
-                    # generally validate against the pertinent schema
-                    self.is_valid_trapi_query(instance=result, component="Result")
+                    # generally validate against the pertinent schema, all the sampled results at once
+                    self.is_valid_trapi_array(
+                        instances=results_sample,
+                        component="Result",
+                        max_invalid=max_invalid_results
+                    )
+
+                for result in results_sample:
 
                     # Maybe some additional TRAPI-release specific non-schematic validation here?
                     if self.is_trapi_1_4_or_later():
@@ -439,6 +646,371 @@ class TRAPIResponseValidator(BiolinkValidator):
         # Only 'error' but not 'info' nor 'warning' messages invalidate the overall Message
         return False if self.has_errors() else True
 
+    def check_compliance_of_trapi_response_file(
+            self,
+            response_file: str,
+            max_kg_edges: int = 0,
+            max_results: int = 0,
+            max_invalid_results: int = 0,
+            reservoir_size: int = RESULT_TEST_DATA_SAMPLE_SIZE
+    ) -> Optional[Dict]:
+        """
+        Streaming variant of check_compliance_of_trapi_response(), for TRAPI Response JSON files too large
+        to be loaded in memory. The nodes and edges of the Knowledge Graph and the Results of the Message are
+        parsed incrementally from the file, and validated one at a time, in successive passes over the file
+        (the rest of the Response is loaded in memory). Only the index of the nodes needed for the validation
+        of the edges (thus, for the detection of dangling nodes) grows with the size of the Knowledge Graph.
+
+        Knowledge Graph nodes and edges are always individually validated against the TRAPI schema (as with
+        'incremental_kg_validation'), while TRAPI schema errors of the Results are grouped by Result.
+
+        :param response_file: str, path of the JSON text file of the Query.Response to be validated.
+        :param max_kg_edges: int, maximum number of edges to be validated from the
+                                  knowledge graph of the response. A value of zero triggers validation
+                                  of all edges in the knowledge graph (Default: 0 - use all edges)
+        :param max_results: int, target sample number of results to validate (default: 0 for 'use all results').
+        :param max_invalid_results: int, fail-fast threshold: stop the validation of results after this number
+                                    of schema-invalid results (default: 0 for 'validate all sampled results').
+        :param reservoir_size: int, maximum number of validated Results retained, as a uniform random sample,
+                               for further checks of Results against the Knowledge Graph (Default: 10).
+        :return: Optional[Dict], Message made of the Query Graph, the random sample of Results and the subgraph
+                 of the Knowledge Graph bound to these Results; None, if the Results were not validated.
+        :raises: ValueError, if the file is not valid JSON text
+        """
+        with open_stream(response_file) as reader:
+            response = reader.read_outline(deferred=STREAMED_RESPONSE_COMPONENTS)
+
+        if not (response and "message" in response):
+            if not self.suppress_empty_data_warnings:
+                self.report("error.trapi.response.empty")
+            return None
+
+        self.check_response_versions(response)
+
+        message: Optional[Dict] = response.pop('message')
+        response['message'] = {}
+        if not message:
+            if not self.suppress_empty_data_warnings:
+                self.report("error.trapi.response.message.empty")
+            return None
+
+        response = self.sanitize_workflow(response)
+        if not (
+            self.has_valid_response_header(response) and
+            self.has_valid_query_graph(message) and
+            self.has_valid_knowledge_graph_file(response_file, message, max_kg_edges)
+        ):
+            return None
+
+        results_sample: List = self.stream_results(
+            response_file,
+            message,
+            sample_size=max_results,
+            max_invalid_results=max_invalid_results,
+            reservoir_size=reservoir_size
+        )
+        sample: Dict = {
+            "query_graph": message.get("query_graph", None),
+            "knowledge_graph": self.get_bound_subgraph_file(response_file, results_sample),
+            "results": results_sample
+        }
+        if "auxiliary_graphs" in message:
+            sample["auxiliary_graphs"] = message["auxiliary_graphs"]
+        return sample
+
+    def has_valid_knowledge_graph_file(self, response_file: str, message: Dict, edges_limit: int = 0) -> bool:
+        """
+        Validate the TRAPI Knowledge Graph of a TRAPI Response JSON file, streaming its nodes and edges.
+
+        :param response_file: str, path of the JSON text file of the Query.Response
+        :param message: Dict, outline of the Message of the Response (see STREAMED_RESPONSE_COMPONENTS)
+        :param edges_limit: int, integer maximum number of edges to be validated in the knowledge graph. A value of zero
+                            triggers validation of all edges in the knowledge graph (Default: 0 - use all edges)
+
+        :return: bool, False, if validation errors
+        """
+        assert edges_limit >= 0, "The 'edges_limit' must be zero or a positive integer!"
+
+        if 'knowledge_graph' not in message:
+            if not self.suppress_empty_data_warnings:
+                self.report(code="error.trapi.response.message.knowledge_graph.missing")
+        else:
+            knowledge_graph = message['knowledge_graph']
+            if not (
+                    knowledge_graph and len(knowledge_graph) > 0 and
+                    "nodes" in knowledge_graph and knowledge_graph["nodes"] and
+                    "edges" in knowledge_graph and knowledge_graph["edges"]
+            ):
+                if not self.suppress_empty_data_warnings:
+                    self.report(code="warning.trapi.response.message.knowledge_graph.empty")
+            else:
+                mapping_validator: MappingValidator = check_node_edge_mappings(
+                    knowledge_graph,
+                    max_code_messages=self.max_code_messages,
+                    max_identifier_messages=self.max_identifier_messages,
+                    counts_only=self.counts_only
+                )
+                if mapping_validator.has_messages():
+                    self.merge(mapping_validator)
+
+                if edges_limit > 0:
+                    # a subgraph sample is small enough to be validated in memory
+                    self.validate_knowledge_graph_elements(
+                        self.sample_graph_file(
+                            response_file,
+                            knowledge_graph,
+                            edges_limit,
+                            strategy=self.sampling,
+                            seed=self.sampling_seed
+                        )
+                    )
+                else:
+                    self.stream_knowledge_graph_elements(response_file, knowledge_graph)
+
+        return False if self.has_errors() else True
+
+    @staticmethod
+    def _stream_graph_elements(response_file: str, elements, tag: str) -> Iterator[Tuple[str, Any]]:
+        # (identifier, details) of the (deferred) 'nodes' or 'edges' of the Knowledge Graph of a Response file
+        if isinstance(elements, Deferred):
+            with open_stream(response_file, "message", "knowledge_graph", tag) as reader:
+                yield from reader.iter_items()
+
+    @classmethod
+    def sample_graph_file(
+            cls,
+            response_file: str,
+            graph: Dict,
+            edges_limit: int,
+            strategy: str = "first",
+            seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Same as sample_graph(), for the Knowledge Graph of a TRAPI Response JSON file,
+        loading only the sampled edges, and the nodes they refer to, into memory.
+
+        :param response_file: str, path of the JSON text file of the Query.Response
+        :param graph: Dict, outline of the Knowledge Graph of the Response (see STREAMED_RESPONSE_COMPONENTS)
+        :param edges_limit: int, (positive) maximum number of edges to be sampled from the knowledge graph
+        :param strategy: str = "first", sampling strategy, one of SAMPLING_STRATEGIES (Default: the first edges);
+                         as the number of edges isn't known beforehand, the "random" sample is a reservoir sample.
+        :param seed: Optional[int] = None, seed of the random sampling strategies (Default: None, unseeded)
+
+        :return: Dict, 'edges_limit' sized subset of knowledge graph
+        """
+        edges: Dict = dict()
+        if strategy == "first":
+            for edge_id, edge in cls._stream_graph_elements(response_file, graph["edges"], "edges"):
+                edges[edge_id] = edge
+                if len(edges) == edges_limit:
+                    break
+        else:
+            # only the identifiers of the sampled edges are retained, for the edges to be read in a second pass
+            sampler = Sampler(size=edges_limit, strategy=strategy, seed=seed)
+            for edge_id, edge in cls._stream_graph_elements(response_file, graph["edges"], "edges"):
+                sampler.add(edge_id, stratum=edge_stratum(edge))
+            edge_ids: Set[str] = set(sampler.sample())
+            for edge_id, edge in cls._stream_graph_elements(response_file, graph["edges"], "edges"):
+                if edge_id in edge_ids:
+                    edges[edge_id] = edge
+
+        # node identifiers, in sample_graph() order
+        node_ids: Dict[str, Optional[Dict]] = dict()
+        for edge in edges.values():
+            if isinstance(edge, Dict):
+                for tag in ["subject", "object"]:
+                    if tag in edge and isinstance(edge[tag], str):
+                        node_ids[edge[tag]] = None
+
+        for node_id, node in cls._stream_graph_elements(response_file, graph["nodes"], "nodes"):
+            if node_id in node_ids:
+                node_ids[node_id] = node
+
+        return {
+            "nodes": {node_id: node for node_id, node in node_ids.items() if node is not None},
+            "edges": edges
+        }
+
+    def stream_knowledge_graph_elements(self, response_file: str, graph: Dict):
+        """
+        Same as validate_knowledge_graph_elements(), for the whole Knowledge Graph of a
+        TRAPI Response JSON file, with its nodes, then its edges, validated as they are read.
+
+        :param response_file: str, path of the JSON text file of the Query.Response
+        :param graph: Dict, outline of the Knowledge Graph of the Response (see STREAMED_RESPONSE_COMPONENTS)
+        """
+        graph_type: TRAPIGraphType = TRAPIGraphType.Knowledge_Graph
+        nodes = graph["nodes"]
+        edges = graph["edges"]
+        self.is_valid_trapi_graph_skeleton(
+            graph={
+                "nodes": dict() if isinstance(nodes, Deferred) else nodes,
+                "edges": dict() if isinstance(edges, Deferred) else edges
+            },
+            component="KnowledgeGraph"
+        )
+
+        validate_biolink: bool = self.validate_biolink()
+        if validate_biolink:
+            self._edge_memo.clear()
+            self.reset_node_info(graph_type=graph_type)
+
+        for node_id, node in self._stream_graph_elements(response_file, nodes, "nodes"):
+            self.is_valid_trapi_graph_element(node_id, node, element_type="Node")
+            if validate_biolink and isinstance(node, Dict):
+                self.validate_graph_node(node_id, node, graph_type=graph_type)
+                # only the node categories are retained, for edge validation
+                self.set_nodes({node_id: node})
+
+        for edge_id, edge in self._stream_graph_elements(response_file, edges, "edges"):
+            self.is_valid_trapi_graph_element(edge_id, edge, element_type="Edge")
+            if validate_biolink and isinstance(edge, Dict):
+                self.validate_graph_edge(edge, graph_type=graph_type)
+
+        if validate_biolink:
+            self.report_node_usage(graph_type=graph_type)
+
+    def stream_results(
+            self,
+            response_file: str,
+            message: Dict,
+            sample_size: int = 0,
+            max_invalid_results: int = 0,
+            reservoir_size: int = RESULT_TEST_DATA_SAMPLE_SIZE
+    ) -> List:
+        """
+        Validate the TRAPI Results of a TRAPI Response JSON file, streaming them one Result at a time.
+
+        :param response_file: str, path of the JSON text file of the Query.Response
+        :param message: Dict, outline of the Message of the Response (see STREAMED_RESPONSE_COMPONENTS)
+        :param sample_size: int, sample number of results to validate, sampled by the 'sampling' strategy
+                            of the validator (default: 0 for 'use all results').
+        :param max_invalid_results: int, fail-fast threshold: stop the validation of results after this number
+                                    of schema-invalid results (default: 0 for 'validate all sampled results').
+        :param reservoir_size: int, maximum number of validated Results retained, as a uniform random sample
+                               (Default: 10).
+
+        :return: List, random sample of the validated Results (in no particular order)
+        """
+        reservoir: List = list()
+        if 'results' not in message:
+            if not self.suppress_empty_data_warnings:
+                self.report(code="error.trapi.response.message.results.missing")
+        else:
+            results = message['results']
+
+            if not results:
+                if not self.suppress_empty_data_warnings:
+                    self.report(code="warning.trapi.response.message.results.empty")
+
+            elif not isinstance(results, Deferred):
+                # The Message.results should be an array of Result objects
+                self.report(code="error.trapi.response.message.results.not_array")
+
+            else:
+                retained = Random(self.sampling_seed)
+                with open_stream(response_file, "message", "results") as reader:
+                    indexed_results: Iterator[Tuple[int, Any]] = (
+                        (index, reader.read_value()) for index in reader.iter_array()
+                    )
+                    if sample_size and self.sampling != "first":
+                        # as the number of Results isn't known beforehand, the "random" sample is a reservoir sample
+                        sampler = Sampler(size=sample_size, strategy=self.sampling, seed=self.sampling_seed)
+                        for index, result in indexed_results:
+                            sampler.add((index, result), stratum=result_stratum(result))
+                        indexed_results = iter(sampler.sample())
+                    elif sample_size:
+                        indexed_results = islice(indexed_results, sample_size)
+
+                    validated = self._validate_results(indexed_results, max_invalid_results=max_invalid_results)
+                    for count, (_, result) in enumerate(validated):
+                        # 'reservoir sampling' of the Results
+                        if count < reservoir_size:
+                            reservoir.append(result)
+                        else:
+                            slot: int = retained.randrange(count + 1)
+                            if slot < reservoir_size:
+                                reservoir[slot] = result
+
+        return reservoir
+
+    def _validate_results(
+            self,
+            results: Iterable[Tuple[int, Any]],
+            max_invalid_results: int = 0
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Validate TRAPI Results one at a time, reporting their TRAPI schema errors
+        at their JSON path within the 'results' of the Message.
+
+        :param results: Iterable[Tuple[int, Any]], (index in the Message 'results', Result) of the Results to validate
+        :param max_invalid_results: int, fail-fast threshold: stop the validation of results after this number
+                                    of schema-invalid results (default: 0 for 'validate all results').
+
+        :return: Iterator[Tuple[int, Any]], (index, Result) of the Results, as they are validated
+        """
+        number_of_invalid_results: int = 0
+        truncated: bool = False
+        for index, result in results:
+            if not (
+                truncated or
+                self._is_valid_compiled(result, "Result") or
+                get_validator(self.trapi_version, "Result").is_valid(result)
+            ):
+                if max_invalid_results and number_of_invalid_results >= max_invalid_results:
+                    self.report(
+                        code="warning.trapi.validation.truncated",
+                        identifier=self.trapi_version,
+                        component="Result",
+                        max_errors=str(max_invalid_results)
+                    )
+                    truncated = True
+                else:
+                    number_of_invalid_results += 1
+                    self.is_valid_trapi_query(instance=result, component="Result", json_path=f"$[{index}]")
+            yield index, result
+
+    @staticmethod
+    def get_bound_subgraph_file(response_file: str, results: List) -> Dict:
+        """
+        :param response_file: str, path of the JSON text file of the Query.Response
+        :param results: List, (sample of the) Results of the Response
+        :return: Dict, subgraph of the Knowledge Graph of the Response, with the nodes and edges bound in the Results
+        """
+        bound: Dict[str, Set[str]] = {"nodes": set(), "edges": set()}
+        for result in results:
+            if not isinstance(result, Dict):
+                continue
+            bindings: List[Tuple[str, Dict]] = [("nodes", result.get("node_bindings", None))]
+            # Results of TRAPI releases before 1.4 directly have 'edge_bindings'
+            bindings.append(("edges", result.get("edge_bindings", None)))
+            analyses = result.get("analyses", None)
+            if isinstance(analyses, List):
+                bindings.extend(
+                    ("edges", analysis.get("edge_bindings", None))
+                    for analysis in analyses if isinstance(analysis, Dict)
+                )
+            for tag, binding in bindings:
+                if isinstance(binding, Dict):
+                    bound[tag].update(
+                        entry["id"]
+                        for entries in binding.values() if isinstance(entries, List)
+                        for entry in entries if isinstance(entry, Dict) and isinstance(entry.get("id", None), str)
+                    )
+
+        subgraph: Dict = {"nodes": dict(), "edges": dict()}
+        for tag in subgraph:
+            if not bound[tag]:
+                continue
+            with open_stream(response_file, "message", "knowledge_graph", tag) as reader:
+                if reader is not None and reader.peek() == "{":
+                    for identifier in reader.iter_object():
+                        if identifier in bound[tag]:
+                            subgraph[tag][identifier] = reader.read_value()
+                        else:
+                            reader.skip_value()
+        return subgraph
+
     def category_matched(self, source_categories: List[str], target_categories: List[str]) -> Optional[str]:
         """
         For each 'source' Biolink Model category given (list of CURIEs as strings?),
@@ -454,7 +1026,7 @@ class TRAPIResponseValidator(BiolinkValidator):
         # gather all the possible exact and ancestor (parent)
         # categories of source_categories to match...
         for source_category in source_categories:
-            source_category_set.update(self.bmt.get_ancestors(source_category, formatted=True, mixin=False))
+            source_category_set.update(self.get_bmi().get_ancestors(source_category, mixin=False))
 
         # ...then check all the target categories against that source category set
         for category in source_category_set:
@@ -1186,13 +1758,13 @@ class TRAPIResponseValidator(BiolinkValidator):
         edges: Dict = knowledge_graph["edges"]
 
         predicate = testcase["predicate"] if "predicate" in testcase else testcase["predicate_id"]
-        predicate_descendants: List[str]
-        inverse_predicate_descendants: List[str] = list()  # may sometimes remain empty...
+        predicate_descendants: Collection[str]
+        inverse_predicate_descendants: Collection[str] = list()  # may sometimes remain empty...
         if self.validate_biolink():
-            predicate_descendants = self.bmt.get_descendants(predicate, formatted=True)
+            predicate_descendants = self.get_bmi().get_descendants(predicate)
             inverse_predicate = self.get_inverse_predicate(predicate)
             if inverse_predicate:
-                inverse_predicate_descendants = self.bmt.get_descendants(inverse_predicate, formatted=True)
+                inverse_predicate_descendants = self.get_bmi().get_descendants(inverse_predicate)
         else:
             # simpler testcase in which we are
             # ignoring deep Biolink Model validation
@@ -1261,3 +1833,69 @@ class TRAPIResponseValidator(BiolinkValidator):
         # By this point, the testcase data assumed to be
         # successfully validated in the TRAPI Response?
         return True
+
+
+def validate_many(
+        responses: Sequence[Optional[Dict]],
+        workers: int = 1,
+        targets: Optional[Sequence[str]] = None,
+        merge: bool = False,
+        max_kg_edges: int = 0,
+        max_results: int = 0,
+        max_invalid_results: int = 0,
+        **kwargs
+) -> Union[List[TRAPIResponseValidator], TRAPIResponseValidator]:
+    """
+    Validation of a batch of TRAPI Responses, by a pool of threads. Each response is validated
+    by its own TRAPIResponseValidator, but the TRAPI schema validators, Biolink Model Toolkits
+    and Biolink Model indices are shared by the validators of all the responses (the Toolkit
+    of a Biolink Model release being only queried through the lock of its index, see BiolinkIndex).
+
+    :param responses: Sequence[Optional[Dict]], the TRAPI Query.Responses to be validated.
+    :param workers: int = 1, number of threads validating responses concurrently.
+    :param targets: Optional[Sequence[str]] = None, default target of the validation messages of each response,
+                    e.g. the ARA or KP which returned the response (Default: 'default_target' keyword argument).
+    :param merge: bool = False, if True, return one TRAPIResponseValidator with the validation messages
+                  of all the responses, by target, rather than one TRAPIResponseValidator per response.
+    :param max_kg_edges: int, maximum number of knowledge graph edges validated per response (Default: 0 - all edges)
+    :param max_results: int, target sample number of results validated per response (default: 0 for 'all results').
+    :param max_invalid_results: int, fail-fast threshold of schema-invalid results per response (default: 0, none).
+    :param kwargs: any other TRAPIResponseValidator constructor arguments, common to the validators of all responses.
+    :return: Union[List[TRAPIResponseValidator], TRAPIResponseValidator], one validator per response,
+             in the order of the responses, or one validator merging all of them (if 'merge' is True).
+    """
+    if targets is not None and len(targets) != len(responses):
+        raise ValueError(f"validate_many(): {len(targets)} targets given for {len(responses)} responses")
+    default_target: Optional[str] = kwargs.pop("default_target", None)
+
+    def validate(index: int) -> TRAPIResponseValidator:
+        validator = TRAPIResponseValidator(
+            default_target=targets[index] if targets is not None else default_target,
+            **kwargs
+        )
+        response: Optional[Dict] = responses[index]
+        validator.check_compliance_of_trapi_response(
+            # the validation temporarily detaches the 'message' of the
+            # response, from a copy, in case a response is given twice
+            dict(response) if response else response,
+            max_kg_edges=max_kg_edges,
+            max_results=max_results,
+            max_invalid_results=max_invalid_results
+        )
+        return validator
+
+    validators: List[TRAPIResponseValidator] = list()
+    if responses:
+        # The first response is validated on its own, loading the
+        # TRAPI schema and the Biolink Model (index) for all others
+        validators.append(validate(0))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            validators.extend(executor.map(validate, range(1, len(responses))))
+
+    if not merge:
+        return validators
+
+    merged = TRAPIResponseValidator(default_target=default_target, **kwargs)
+    for validator in validators:
+        merged.merge(validator)
+    return merged
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+"""
+Simple (wall clock) benchmarks of some reasoner-validator hot spots.
+
+Usage:
+    poetry shell
+    cd scripts
+    ./benchmarks.py --help
+    ./benchmarks.py results --trapi_version 1.5 --number 5000
+    ./benchmarks.py edge_scaling --number 1000000
+    ./benchmarks.py version_checks --number 100000
+    ./benchmarks.py report --number 100000
+    ./benchmarks.py message_store --number 300000
+    ./benchmarks.py merge --number 1000
+
+Note that the TRAPI version may also be the file path of a local
+TRAPI schema YAML file (i.e. for benchmarks run without network access).
+"""
+from typing import Dict, List, Callable
+from time import perf_counter
+import argparse
+import tracemalloc
+
+import jsonschema
+
+from reasoner_validator.trapi import TRAPISchemaValidator, load_schema, LATEST_TRAPI_RELEASE, SCHEMA_BACKENDS
+from reasoner_validator.biolink import BiolinkValidator
+from reasoner_validator.report import TRAPIGraphType, ValidationReporter
+from reasoner_validator.validation_codes import CodeDictionary
+from reasoner_validator.message import MessageType
+from reasoner_validator.message_store import MESSAGE_STORES
+
+
+def timed(method: Callable, *args, **kwargs) -> float:
+    """
+    :param method: Callable, method to be timed
+    :return: float, elapsed (wall clock) time in seconds of one call to the method
+    """
+    start: float = perf_counter()
+    method(*args, **kwargs)
+    return perf_counter() - start
+
+
+def report_timing(label: str, elapsed: float, number: int, unit: str):
+    print(f"{label:<40} {elapsed:10.3f} s total {1000000.0 * elapsed / number:12.2f} µs/{unit}")
+
+
+def sample_result(index: int) -> Dict:
+    return {
+        "node_bindings": {
+            "n0": [{"id": f"NCBIGene:{index}", "attributes": []}],
+            "n1": [{"id": f"MONDO:{index}", "attributes": []}]
+        },
+        "analyses": [
+            {
+                "resource_id": "infores:molepro",
+                "edge_bindings": {"e01": [{"id": f"edge_{index}", "attributes": []}]}
+            }
+        ]
+    }
+
+
+def sample_knowledge_graph(number_of_edges: int) -> Dict:
+    nodes: Dict = dict()
+    edges: Dict = dict()
+    for index in range(number_of_edges):
+        nodes[f"NCBIGene:{index}"] = {"categories": ["biolink:Gene"], "attributes": []}
+        nodes[f"MONDO:{index}"] = {"categories": ["biolink:Disease"], "attributes": []}
+        edges[f"edge_{index}"] = {
+            "subject": f"NCBIGene:{index}",
+            "predicate": "biolink:gene_associated_with_condition",
+            "object": f"MONDO:{index}",
+            "sources": [
+                {
+                    "resource_id": "infores:molepro",
+                    "resource_role": "primary_knowledge_source"
+                }
+            ],
+            "attributes": [
+                {
+                    "attribute_type_id": "biolink:p_value",
+                    "value": 0.001,
+                    "attributes": [{"attribute_type_id": "biolink:publications", "value": [f"PMID:{index}"]}]
+                }
+            ]
+        }
+    return {"nodes": nodes, "edges": edges}
+
+
+def benchmark_results(args):
+    """
+    Per-Result TRAPI schema validation cost, of one-off jsonschema.validate()
+    calls versus validation with the cached TRAPISchemaValidator validators.
+    """
+    results: List[Dict] = [sample_result(i) for i in range(args.number)]
+
+    schema: Dict = load_schema(args.trapi_version)["Result"]
+
+    def one_off_validation():
+        for result in results:
+            jsonschema.validate(result, schema)
+
+    validator = TRAPISchemaValidator(trapi_version=args.trapi_version)
+
+    def cached_validation():
+        for result in results:
+            validator.is_valid_trapi_query(instance=result, component="Result")
+
+    report_timing("Result: jsonschema.validate()", timed(one_off_validation), args.number, "Result")
+    report_timing("Result: cached validator", timed(cached_validation), args.number, "Result")
+    assert not validator.has_messages(), validator.dumps()
+
+
+def benchmark_results_batch(args):
+    """
+    Schema validation cost of a 'results' list, validated one Result at a time
+    versus in one traversal of the whole list, with a sprinkling of invalid Results.
+    """
+    results: List[Dict] = [sample_result(i) for i in range(args.number)]
+    for i in range(0, args.number, 100):
+        results[i]["node_bindings"]["n0"] = "not-an-array"
+
+    per_result = TRAPISchemaValidator(trapi_version=args.trapi_version)
+
+    def per_result_validation():
+        for result in results:
+            per_result.is_valid_trapi_query(instance=result, component="Result")
+
+    batch = TRAPISchemaValidator(trapi_version=args.trapi_version)
+
+    def batch_validation():
+        batch.is_valid_trapi_array(instances=results, component="Result")
+
+    report_timing("Results: per Result", timed(per_result_validation), args.number, "Result")
+    report_timing("Results: array batch", timed(batch_validation), args.number, "Result")
+
+    fail_fast = TRAPISchemaValidator(trapi_version=args.trapi_version)
+
+    def fail_fast_validation():
+        fail_fast.is_valid_trapi_array(instances=results, component="Result", max_invalid=5)
+
+    report_timing("Results: array batch, fail fast (5)", timed(fail_fast_validation), args.number, "Result")
+
+
+def benchmark_knowledge_graph(args):
+    """
+    KnowledgeGraph TRAPI schema validation throughput, with
+    the "jsonschema" versus the "compiled" schema backend.
+    """
+    knowledge_graph: Dict = sample_knowledge_graph(args.number)
+    elapsed: Dict[str, float] = dict()
+    for backend in SCHEMA_BACKENDS:
+        validator = TRAPISchemaValidator(trapi_version=args.trapi_version, schema_backend=backend)
+        # first call compiles the validation function
+        validator.is_valid_trapi_query(instance=sample_knowledge_graph(1), component="KnowledgeGraph")
+        elapsed[backend] = timed(validator.is_valid_trapi_query, instance=knowledge_graph, component="KnowledgeGraph")
+        report_timing(f"KnowledgeGraph: {backend} backend", elapsed[backend], args.number, "Edge")
+        assert not validator.has_messages(), validator.dumps()
+    print(f"Speedup of compiled backend: {elapsed['jsonschema'] / elapsed['compiled']:.1f}x")
+
+
+def benchmark_edge_scaling(args):
+    """
+    Scaling of knowledge graph edge validation (with Biolink Model validation suppressed,
+    to isolate graph bookkeeping like subject and object node lookups), from 1000 nodes
+    up to (the nearest power of ten below) the given number of nodes, which should be
+    linear in the size of the knowledge graph, i.e. at a constant cost per edge.
+    """
+    number_of_nodes: int = 1000
+    while number_of_nodes <= max(args.number, 1000):
+        knowledge_graph: Dict = sample_knowledge_graph(number_of_nodes // 2)
+        validator = BiolinkValidator(trapi_version=args.trapi_version, biolink_version="suppress")
+        validator.set_nodes(knowledge_graph["nodes"])
+
+        def edge_validation():
+            for edge in knowledge_graph["edges"].values():
+                validator.validate_graph_edge(edge=edge, graph_type=TRAPIGraphType.Knowledge_Graph)
+
+        report_timing(f"Edges: {number_of_nodes} nodes", timed(edge_validation), len(knowledge_graph["edges"]), "Edge")
+        assert not validator.has_dangling_nodes()
+        number_of_nodes *= 10
+
+
+def benchmark_version_checks(args):
+    """
+    Per-edge cost of the TRAPI and Biolink Model version dependent feature checks of edge validation,
+    comparing SemVers parsed at each check versus the feature flags resolved once per version.
+    """
+    validator = BiolinkValidator(trapi_version=args.trapi_version)
+
+    def semver_checks():
+        for _ in range(args.number):
+            validator.minimum_required_trapi_version("1.3.0-beta")
+            validator.minimum_required_trapi_version("1.4.0-beta")
+            validator.minimum_required_trapi_version("1.6.0")
+            validator.minimum_required_biolink_version("2.2.0")
+            validator.minimum_required_biolink_version("4.2.0")
+            validator.minimum_required_biolink_version("4.2.1")
+
+    def feature_flags():
+        for _ in range(args.number):
+            _ = validator.trapi_has_qualifiers
+            _ = validator.trapi_has_sources
+            _ = validator.trapi_requires_knowledge_level
+            _ = validator.biolink_has_canonical_predicates
+            _ = validator.biolink_requires_knowledge_level
+            _ = validator.biolink_predicate_inclusions_active
+
+    report_timing("Version checks: SemVer comparisons", timed(semver_checks), args.number, "Edge")
+    report_timing("Version checks: feature flags", timed(feature_flags), args.number, "Edge")
+
+
+def benchmark_report(args):
+    """
+    Throughput of ValidationReporter.report(), of (distinctly identified) warnings, compared with
+    the lookup of their code, as the (copied) code entry of the nested code dictionary tree.
+    """
+    code: str = "warning.knowledge_graph.node.category.abstract_or_mixin"
+    reporter = ValidationReporter()
+
+    def code_tree_lookups():
+        for _ in range(args.number):
+            CodeDictionary.get_code_subtree(code, is_leaf=True)
+
+    def reports():
+        for index in range(args.number):
+            reporter.report(code=code, identifier=f"biolink:Category{index}")
+
+    report_timing("Report: code dictionary tree lookups", timed(code_tree_lookups), args.number, "code")
+    report_timing("Report: report()", timed(reports), args.number, "message")
+    assert len(reporter.get_messages_of_type(MessageType.warning)[code]["global"]) == args.number
+
+
+def benchmark_message_store(args):
+    """
+    Memory footprint and throughput of the ValidationReporter message stores, with a knowledge
+    graph worth of node warnings (identifier only) and of edge errors (with parameters).
+    """
+    node_ids: List[str] = [f"NCBIGene:{index}" for index in range(args.number)]
+    CodeDictionary.get_code_table()
+    for message_store in MESSAGE_STORES:
+        tracemalloc.start()
+        reporter = ValidationReporter(message_store=message_store)
+
+        def reports():
+            for node_id in node_ids:
+                reporter.report(code="warning.knowledge_graph.node.name.missing", identifier=node_id)
+                reporter.report(
+                    code="error.knowledge_graph.edge.predicate.abstract",
+                    identifier="biolink:contributor",
+                    edge_id=f"{node_id}--biolink:contributor->MONDO:0005148",
+                    source_trail="infores:molepro"
+                )
+
+        elapsed: float = timed(reports)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report_timing(f"Message store: {message_store} report()", elapsed, 2 * args.number, "message")
+        report_timing(f"Message store: {message_store} to_dict()", timed(reporter.to_dict), 2 * args.number, "message")
+        print(f"{f'Message store: {message_store} memory':<40} {memory / 1000000.0:10.1f} MB")
+
+
+def benchmark_merge(args):
+    """
+    Merge of a number of ValidationReporters (e.g. of parallel validation workers) of 10,000 messages each,
+    i.e. warnings about the same nodes, and errors about the edges of a distinct source (per reporter), into
+    a single reporter. The time per message merged should not depend upon the number of reporters merged.
+    """
+    node_ids: List[str] = [f"NCBIGene:{index}" for index in range(5000)]
+    edge_ids: List[str] = [f"{node_id}--biolink:contributor->MONDO:0005148" for node_id in node_ids]
+    CodeDictionary.get_code_table()
+
+    def worker_reporter(index: int) -> ValidationReporter:
+        reporter = ValidationReporter()
+        message_catalog: Dict = {name: dict() for name in MessageType.__members__}
+        message_catalog["warning"]["warning.knowledge_graph.node.name.missing"] = {"global": dict.fromkeys(node_ids)}
+        message_catalog["error"]["error.knowledge_graph.edge.attribute.missing"] = {
+            f"infores:source_{index}": dict.fromkeys(edge_ids)
+        }
+        reporter.messages = {"Target": {"Test": message_catalog}}
+        return reporter
+
+    for number in (args.number // 8, args.number // 4, args.number // 2, args.number):
+        if not number:
+            continue
+        reporter = ValidationReporter()
+        elapsed: float = sum(timed(reporter.merge, worker_reporter(index)) for index in range(number))
+        report_timing(f"Merge of {number} reporters", elapsed, 10000 * number, "message")
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "results": benchmark_results,
+    "results_batch": benchmark_results_batch,
+    "knowledge_graph": benchmark_knowledge_graph,
+    "edge_scaling": benchmark_edge_scaling,
+    "version_checks": benchmark_version_checks,
+    "report": benchmark_report,
+    "message_store": benchmark_message_store,
+    "merge": benchmark_merge
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmarks of reasoner-validator hot spots.')
+    arg_parser.add_argument(
+        'benchmark', type=str, choices=list(BENCHMARKS.keys()),
+        help='Name of the benchmark to be run.'
+    )
+    arg_parser.add_argument(
+        '--trapi_version', type=str, nargs='?', default=LATEST_TRAPI_RELEASE,
+        help='TRAPI release, Git branch name or file path (with file extension .yaml) of the TRAPI schema ' +
+             'against which to validate (default: latest TRAPI release).'
+    )
+    arg_parser.add_argument(
+        '-n', '--number', type=int, nargs='?', default=5000,
+        help='Number of data items (e.g. Results) to be validated in the benchmark (default: 5000).'
+    )
+    args = arg_parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Pre-warms the on-disk cache of converted TRAPI schemata (see reasoner_validator.trapi.schema_cache),
+such that later processes (i.e. web service workers or test runners) can start without network access.
+
+Usage:
+    poetry shell
+    cd scripts
+    ./trapi_schema_cache.py --help
+    ./trapi_schema_cache.py                  # all known TRAPI releases
+    ./trapi_schema_cache.py v1.5.0 master --refresh
+
+The cache directory may be set by the TRAPI_SCHEMA_CACHE_DIR environment variable.
+
+Cached TRAPI release schemata never expire, whereas cached TRAPI Git branch schemata are retrieved again
+once older than their time to live (TRAPI_SCHEMA_BRANCH_TTL environment variable, in seconds; default: one
+hour). The --refresh flag retrieves and converts the given schemata again right away, e.g. after an update
+of a TRAPI Git branch, or to replace a cached release schema.
+"""
+from typing import List
+import argparse
+
+from reasoner_validator.github import get_versions
+from reasoner_validator.versioning import get_latest_version
+from reasoner_validator.trapi import get_schema_components
+from reasoner_validator.trapi.schema_cache import get_schema_cache_dir
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Pre-warm the on-disk cache of converted TRAPI schemata.')
+    arg_parser.add_argument(
+        'versions', type=str, nargs='*',
+        help='TRAPI release tags or Git branch names of the schemata to be cached ' +
+             '(default: all known TRAPI releases).'
+    )
+    arg_parser.add_argument(
+        '-b', '--branches', action='store_true',
+        help='Also cache the schemata of all known TRAPI Git branches.'
+    )
+    arg_parser.add_argument(
+        '-r', '--refresh', action='store_true',
+        help='Retrieve and convert the schemata again, even if they are already cached.'
+    )
+    args = arg_parser.parse_args()
+
+    cache_dir = get_schema_cache_dir()
+    if not cache_dir:
+        print("The TRAPI schema cache is disabled (empty TRAPI_SCHEMA_CACHE_DIR environment variable)?")
+        return
+
+    versions: List[str] = args.versions
+    if not versions:
+        versions = list(get_versions()["releases"])
+        if args.branches:
+            versions.extend(get_versions()["branches"])
+
+    print(f"Caching TRAPI schemata in '{cache_dir}':")
+    for version in versions:
+        try:
+            # resolve SemVer specifications like '1.5' into the matching release tag
+            get_schema_components(get_latest_version(version) or version, refresh=args.refresh)
+            print(f"\t{version}")
+        except Exception as error:
+            # some older releases or work-in-progress branches may simply not be convertible
+            print(f"\t{version} - skipped: {str(error)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,10 @@ import argparse
 
 from bmt import Toolkit
 from reasoner_validator.validator import TRAPIResponseValidator
-from reasoner_validator.trapi import call_trapi
+from reasoner_validator.trapi import call_trapi, DEFAULT_MAX_SCHEMA_ERRORS, SCHEMA_BACKENDS
+from reasoner_validator.sampling import SAMPLING_STRATEGIES
+from reasoner_validator.message_store import MESSAGE_STORES
+from reasoner_validator.trapi.lazy import MappedResponse
 from reasoner_validator.versioning import get_latest_version
 from reasoner_validator.biolink import get_biolink_model_toolkit
 
@@ -111,6 +114,72 @@ def get_cli_arguments():
         help='If given, compress human readable text output by suppressing blank lines '
              '(default: False; ignored when "--json" flag is given).'
     )
+    arg_parser.add_argument(
+        '--all_schema_errors', action='store_true',
+        help='If given, report all TRAPI schema validation errors, grouped by schema path, ' +
+             'rather than only the most relevant schema validation error (default: False).'
+    )
+    arg_parser.add_argument(
+        '--max_schema_errors',
+        metavar='N', type=int, nargs='?', default=DEFAULT_MAX_SCHEMA_ERRORS,
+        help='Maximum integer N number of TRAPI schema validation errors reported per TRAPI component ' +
+             'when the "--all_schema_errors" flag is given; set to zero for no limit ' +
+             f'(default: {DEFAULT_MAX_SCHEMA_ERRORS}).'
+    )
+    arg_parser.add_argument(
+        '--schema_backend', type=str, choices=SCHEMA_BACKENDS, default="jsonschema",
+        help='TRAPI schema validation backend: "jsonschema" or "compiled" ' +
+             '(faster validation functions compiled from the TRAPI schemata; default: "jsonschema").'
+    )
+    arg_parser.add_argument(
+        '--incremental_kg_validation', action='store_true',
+        help='If given, validate the TRAPI schema compliance of each knowledge graph node and edge ' +
+             'individually, in the same pass as their Biolink Model validation (default: False).'
+    )
+    arg_parser.add_argument(
+        '--biolink_workers', metavar='N', type=int, nargs='?', default=0,
+        help='Number N of worker processes sharing the Biolink Model validation of large ' +
+             'knowledge graphs (default: 0, i.e. serial validation).'
+    )
+    arg_parser.add_argument(
+        '--max_kg_edges', metavar='N', type=int, nargs='?', default=0,
+        help='Maximum number N of knowledge graph edges to be validated, sampled with the nodes they refer to ' +
+             '(default: 0, i.e. validate the whole knowledge graph).'
+    )
+    arg_parser.add_argument(
+        '--sampling', type=str, choices=SAMPLING_STRATEGIES, default="first",
+        help='Sampling strategy of the knowledge graph edges validated, when capped by "--max_kg_edges": ' +
+             '"first", "random", "stratified" (by edge predicate and primary knowledge source) ' +
+             'or "reservoir" (default: "first").'
+    )
+    arg_parser.add_argument(
+        '--sampling_seed', metavar='SEED', type=int, nargs='?', default=None,
+        help='Integer seed of the random sampling strategies, for reproducible samples (default: None).'
+    )
+    arg_parser.add_argument(
+        '--stream', action='store_true',
+        help='If given, validate a local TRAPI Response JSON file (given by --ars_response_id) by parsing ' +
+             'it incrementally, rather than loading it in memory, e.g. for multi-gigabyte files (default: False).'
+    )
+    arg_parser.add_argument(
+        '--message_store', type=str, choices=MESSAGE_STORES, default="nested",
+        help='Storage of the validation messages: "nested" (dictionaries) or "columnar" (compact, for very ' +
+             'large numbers of messages, e.g. of multi-gigabyte knowledge graphs) (default: "nested").'
+    )
+    arg_parser.add_argument(
+        '--max_code_messages', metavar='N', type=int, nargs='?', default=0,
+        help='Maximum number N of identified validation messages recorded per code, beyond which ' +
+             'they are only counted (default: 0, i.e. no limit).'
+    )
+    arg_parser.add_argument(
+        '--max_identifier_messages', metavar='N', type=int, nargs='?', default=0,
+        help='Maximum number N of parameterized validation messages recorded per identifier, beyond which ' +
+             'they are only counted (default: 0, i.e. no limit).'
+    )
+    arg_parser.add_argument(
+        '--counts_only', action='store_true',
+        help='If given, identified validation messages are only counted, by code, e.g. for bulk screening runs.'
+    )
 
     return arg_parser.parse_args()
 
@@ -298,7 +367,18 @@ def main():
     # Perform a validation on it
     validator = TRAPIResponseValidator(
         trapi_version=resolved_trapi_version,
-        biolink_version=resolved_biolink_version
+        biolink_version=resolved_biolink_version,
+        all_schema_errors=args.all_schema_errors,
+        max_schema_errors=args.max_schema_errors,
+        schema_backend=args.schema_backend,
+        incremental_kg_validation=args.incremental_kg_validation,
+        biolink_workers=args.biolink_workers,
+        sampling=args.sampling,
+        sampling_seed=args.sampling_seed,
+        message_store=args.message_store,
+        max_code_messages=args.max_code_messages,
+        max_identifier_messages=args.max_identifier_messages,
+        counts_only=args.counts_only
     )
     if args.verbose:
         print(
@@ -332,8 +412,21 @@ def main():
     elif args.ars_response_id:
         if isfile(args.ars_response_id):
             # The response identifier can just be a local file...
-            with open(args.ars_response_id) as infile:
-                trapi_response = json.load(infile)
+            if args.stream:
+                # ... possibly too large to be loaded in memory
+                validator.check_compliance_of_trapi_response_file(
+                    response_file=args.ars_response_id,
+                    max_kg_edges=args.max_kg_edges
+                )
+            else:
+                # ... memory-mapped, with its knowledge graph nodes and edges only decoded as needed
+                with MappedResponse(args.ars_response_id) as mapped_response:
+                    validator.check_compliance_of_trapi_response(
+                        response=mapped_response,
+                        max_kg_edges=args.max_kg_edges
+                    )
+            validation_report(validator, args)
+            return
         else:
             # ... unless, it is an ARS PK
             retrieve_ars_result(response_id=args.ars_response_id, verbose=args.verbose)
@@ -346,7 +439,7 @@ def main():
         return
 
     # OK, we have something to validate here...
-    validator.check_compliance_of_trapi_response(response=trapi_response)
+    validator.check_compliance_of_trapi_response(response=trapi_response, max_kg_edges=args.max_kg_edges)
 
     # Print out the outcome of the main validation of the TRAPI Response
     validation_report(validator, args)
@@ -3,6 +3,7 @@ Unit tests for the generic (shared) components of the SRI Testing Framework
 """
 from typing import Optional, Dict, List
 from sys import stderr
+from json import dumps
 from copy import deepcopy
 from pprint import PrettyPrinter
 import logging
@@ -107,6 +108,28 @@ def test_minimum_required_biolink_version():
     assert not validator.minimum_required_biolink_version("2.4.8")
 
 
+def test_version_features_resolved_on_version_reset():
+    validator = BiolinkValidator(trapi_version="1.3.0", biolink_version="suppress")
+    assert validator.trapi_has_qualifiers
+    assert not validator.trapi_has_sources
+    assert not validator.trapi_requires_knowledge_level
+    # Biolink Model features are all unset when Biolink Model validation is suppressed
+    assert not validator.biolink_has_canonical_predicates
+    assert not validator.biolink_requires_knowledge_level
+    assert validator.biolink_predicate_inclusions_active
+    assert validator.get_attribute_type_exclusions() == ["biolink:knowledge_level", "biolink:agent_type"]
+
+    validator.reset_trapi_version("1.4.0")
+    assert validator.trapi_has_sources
+
+    # latest Biolink Model release
+    validator = BiolinkValidator()
+    assert validator.biolink_has_canonical_predicates
+    assert validator.biolink_requires_knowledge_level
+    assert not validator.biolink_predicate_inclusions_active
+    assert validator.get_attribute_type_exclusions() == []
+
+
 def test_message():
     reporter = BiolinkValidator(
         default_test="Test Message",
@@ -4084,3 +4107,117 @@ def test_get_inverse_predicate(predicate, inverse):
     # we assume the default is a late version which has proper inverse
     validator: BiolinkValidator = BiolinkValidator(biolink_version=None)
     assert validator.get_inverse_predicate(predicate) == inverse
+
+
+def _edge_with_unknown_terms(subject_id: str, object_id: str, primary_knowledge_source: str) -> Dict:
+    return {
+        "subject": subject_id,
+        "predicate": "biolink:not_a_predicate",
+        "object": object_id,
+        "sources": [
+            {
+                "resource_id": primary_knowledge_source,
+                "resource_role": "primary_knowledge_source"
+            }
+        ],
+        "attributes": [{"attribute_type_id": "biolink:not_an_attribute_type", "value": "some value"}],
+        "qualifiers": [{"qualifier_type_id": "biolink:not_a_qualifier", "qualifier_value": "some value"}]
+    }
+
+
+def test_memoized_edge_validation():
+    # both edges share the same signature, hence the validation of the
+    # second edge is replayed from the (memoized) validation of the first one
+    graph: Dict = {
+        "nodes": {
+            node_id: {"categories": ["biolink:Gene"], "name": node_id}
+            for node_id in ["NCBIGene:1", "NCBIGene:2", "NCBIGene:3"]
+        },
+        "edges": {
+            "edge_1": _edge_with_unknown_terms("NCBIGene:1", "NCBIGene:2", "infores:molepro"),
+            "edge_2": _edge_with_unknown_terms("NCBIGene:2", "NCBIGene:3", "infores:text-mining-provider-targeted")
+        }
+    }
+    validator = BiolinkValidator()
+    validator.check_biolink_model_compliance(graph=graph, graph_type=TRAPIGraphType.Knowledge_Graph)
+    errors = validator.get_errors()
+    for code, identifier in [
+        ("error.knowledge_graph.edge.predicate.unknown", "biolink:not_a_predicate"),
+        ("error.knowledge_graph.edge.attribute.type_id.unknown", "biolink:not_an_attribute_type"),
+        ("error.knowledge_graph.edge.qualifiers.qualifier.type_id.unknown", "biolink:not_a_qualifier")
+    ]:
+        assert code in errors
+        # ...each reported with the edge identifier within the source trail of its own edge
+        edge_ids: Dict[str, str] = {
+            source_trail: messages[identifier][0]["edge_id"] for source_trail, messages in errors[code].items()
+        }
+        assert len(edge_ids) == 2
+        assert edge_ids == {
+            "infores:molepro":
+                "NCBIGene:1[biolink:Gene]--biolink:not_a_predicate->NCBIGene:2[biolink:Gene]",
+            "infores:text-mining-provider-targeted":
+                "NCBIGene:2[biolink:Gene]--biolink:not_a_predicate->NCBIGene:3[biolink:Gene]"
+        }
+
+
+def test_memoized_edge_validation_of_edges_without_source_trail():
+    # the first edge, lacking any 'sources' hence any source trail, fills in the memoized
+    # validation shared with the second edge, which nonetheless has its own source trail
+    edge_without_sources: Dict = _edge_with_unknown_terms("NCBIGene:1", "NCBIGene:2", "infores:molepro")
+    del edge_without_sources["sources"]
+    graph: Dict = {
+        "nodes": {
+            node_id: {"categories": ["biolink:Gene"], "name": node_id}
+            for node_id in ["NCBIGene:1", "NCBIGene:2", "NCBIGene:3"]
+        },
+        "edges": {
+            "edge_1": edge_without_sources,
+            "edge_2": _edge_with_unknown_terms("NCBIGene:2", "NCBIGene:3", "infores:molepro")
+        }
+    }
+    validator = BiolinkValidator()
+    validator.check_biolink_model_compliance(graph=graph, graph_type=TRAPIGraphType.Knowledge_Graph)
+    errors = validator.get_errors()
+    assert "error.knowledge_graph.edge.sources.missing" in errors
+    for code, identifier in [
+        ("error.knowledge_graph.edge.predicate.unknown", "biolink:not_a_predicate"),
+        ("error.knowledge_graph.edge.attribute.type_id.unknown", "biolink:not_an_attribute_type"),
+        ("error.knowledge_graph.edge.qualifiers.qualifier.type_id.unknown", "biolink:not_a_qualifier")
+    ]:
+        assert code in errors
+        edge_ids: Dict[str, str] = {
+            source_trail: messages[identifier][0]["edge_id"] for source_trail, messages in errors[code].items()
+        }
+        assert edge_ids == {
+            "global": "NCBIGene:1[biolink:Gene]--biolink:not_a_predicate->NCBIGene:2[biolink:Gene]",
+            "infores:molepro": "NCBIGene:2[biolink:Gene]--biolink:not_a_predicate->NCBIGene:3[biolink:Gene]"
+        }
+
+
+def test_parallel_knowledge_graph_validation(monkeypatch):
+    graph: Dict = {
+        "nodes": {
+            f"NCBIGene:{i}": {"categories": ["biolink:Gene" if i % 7 else "biolink:NotACategory"]} for i in range(40)
+        },
+        "edges": {
+            f"edge_{i}": _edge_with_unknown_terms(
+                f"NCBIGene:{i}",
+                # some edges have an object missing from the nodes,
+                # and a few nodes are left dangling (unused by any edge)
+                f"NCBIGene:{i + 1 if i % 5 else 100 + i}",
+                "infores:molepro" if i % 3 else "infores:text-mining-provider-targeted"
+            ) for i in range(30)
+        }
+    }
+    serial = BiolinkValidator()
+    serial.check_biolink_model_compliance(graph=graph, graph_type=TRAPIGraphType.Knowledge_Graph)
+
+    # small shards, to exercise the merging of many shards
+    monkeypatch.setattr(BiolinkValidator, "MIN_SHARD_SIZE", 4)
+    parallel = BiolinkValidator(biolink_workers=2)
+    parallel.check_biolink_model_compliance(graph=graph, graph_type=TRAPIGraphType.Knowledge_Graph)
+
+    assert parallel.has_warnings() and parallel.has_errors()
+    # same messages, in the same (reporting) order
+    assert dumps(parallel.get_all_messages()) == dumps(serial.get_all_messages())
+    assert parallel.has_dangling_nodes() == serial.has_dangling_nodes()
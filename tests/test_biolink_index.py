@@ -0,0 +1,131 @@
+"""
+Unit tests of the precomputed Biolink Model lookup index, against the Biolink Model Toolkit
+"""
+from typing import List
+
+import pytest
+from bmt import Toolkit
+
+from reasoner_validator.biolink import BiolinkValidator, get_biolink_model_toolkit
+from reasoner_validator.biolink.index import BiolinkIndex, QualifierVerdict, get_biolink_index
+
+
+@pytest.fixture(scope="module")
+def bmt() -> Toolkit:
+    return get_biolink_model_toolkit()
+
+
+def test_biolink_index_is_built_once_per_biolink_version(bmt: Toolkit):
+    bmi: BiolinkIndex = get_biolink_index(bmt)
+    assert bmi is get_biolink_index(bmt)
+    assert bmi.biolink_version == bmt.get_model_version()
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "biolink:Gene",
+        "gene",
+        "biolink:gene",
+        "biolink:NamedThing",
+        "biolink:GeneOrGeneProduct",
+        "biolink:related_to",
+        "related to",
+        "biolink:treats",
+        "biolink:interacts_with",
+        "biolink:p_value",
+        "biolink:has_attribute",
+        "biolink:knowledge_level",
+        "not_a_biolink_element"
+    ]
+)
+def test_biolink_index_agrees_with_toolkit(bmt: Toolkit, name: str):
+    bmi: BiolinkIndex = get_biolink_index(bmt)
+    # the index may have been built from another Toolkit instance of the same Biolink Model version
+    element = bmt.get_element(name)
+    assert (bmi.get_element(name).name if bmi.get_element(name) else None) == (element.name if element else None)
+    if element is None:
+        assert bmi.get_info(name) is None
+        with pytest.raises(ValueError):
+            bmi.get_descendants(name)
+    else:
+        assert bmi.is_mixin(name) == bool(bmt.is_mixin(name))
+        assert bmi.get_descendants(name) == set(bmt.get_descendants(name, formatted=True))
+    assert bmi.is_category(name) == bmt.is_category(name)
+    assert bmi.is_predicate(name) == bmt.is_predicate(name)
+    assert bmi.is_translator_canonical_predicate(name) == bmt.is_translator_canonical_predicate(name)
+    assert bmi.is_association_slot(name) == bmt.is_association_slot(name)
+    assert bmi.get_ancestors(name) == set(bmt.get_ancestors(name, formatted=True))
+    assert bmi.get_ancestors(name, mixin=False) == set(bmt.get_ancestors(name, formatted=True, mixin=False))
+
+
+@pytest.mark.parametrize("identifier", ["NCBIGene:1017", "MONDO:0005148", "CHEBI:15365", "foo:bar", "not_a_curie"])
+def test_biolink_index_element_by_prefix(bmt: Toolkit, identifier: str):
+    assert list(get_biolink_index(bmt).get_element_by_prefix(identifier)) == bmt.get_element_by_prefix(identifier)
+
+
+def test_biolink_index_enum_permissible_values(bmt: Toolkit):
+    bmi: BiolinkIndex = get_biolink_index(bmt)
+    permissible_values = bmi.get_permissible_values("KnowledgeLevelEnum")
+    assert permissible_values is not None and "knowledge_assertion" in permissible_values
+    assert bmi.get_permissible_values("biolink:KnowledgeLevelEnum") == permissible_values
+    assert bmi.get_permissible_values("gene") is None
+
+
+def test_biolink_index_associations_are_cached(bmt: Toolkit):
+    bmi: BiolinkIndex = get_biolink_index(bmt)
+    arguments = {
+        "subject_categories": ["biolink:Gene"],
+        "predicates": ["biolink:gene_associated_with_condition"],
+        "object_categories": ["biolink:Disease"]
+    }
+    associations = bmi.get_associations(**arguments)
+    assert associations == bmt.get_associations(**arguments, formatted=True)
+    hits: int = bmi.get_associations_cache_info().hits
+    misses: int = bmi.get_associations_cache_info().misses
+    # shared by all validators of a given Biolink Model release
+    assert BiolinkValidator(biolink_version=bmt.get_model_version()).get_bmi() is bmi
+    assert bmi.get_associations(**arguments) == associations
+    assert bmi.get_associations_cache_info().hits == hits + 1
+    assert bmi.get_associations_cache_info().misses == misses
+
+
+@pytest.mark.parametrize(
+    "qualifier_type_id,qualifier_value,outcome",
+    [
+        ("biolink:object_aspect_qualifier", "activity", None),
+        ("biolink:qualified_predicate", "biolink:causes", None),
+        ("biolink:qualified_predicate", "biolink:not_a_predicate", "value.not_a_predicate"),
+        ("biolink:object_aspect_qualifier", "not_an_aspect", "value.unresolved"),
+        ("biolink:not_a_qualifier", "activity", "type_id.unknown")
+    ]
+)
+def test_biolink_index_qualifier_verdicts_are_cached(
+        bmt: Toolkit,
+        qualifier_type_id: str,
+        qualifier_value: str,
+        outcome: str
+):
+    bmi: BiolinkIndex = get_biolink_index(bmt)
+    associations = ["biolink:ChemicalAffectsGeneAssociation"]
+    assert bmi.get_qualifier_verdict(qualifier_type_id, qualifier_value, associations).outcome == outcome
+    hits: int = bmi.get_qualifier_cache_info().hits
+    assert bmi.get_qualifier_verdict(qualifier_type_id, qualifier_value, associations).outcome == outcome
+    assert bmi.get_qualifier_cache_info().hits == hits + 1
+
+
+def test_biolink_index_qualifier_exceptions_are_cached(bmt: Toolkit, monkeypatch):
+    calls: List[str] = list()
+
+    def failing_validate_qualifier(**kwargs):
+        calls.append(kwargs["qualifier_value"])
+        raise RuntimeError("unexpected qualifier failure")
+
+    bmi: BiolinkIndex = BiolinkIndex(bmt)
+    monkeypatch.setattr(bmi.bmt, "validate_qualifier", failing_validate_qualifier)
+    for _ in range(3):
+        verdict: QualifierVerdict = bmi.get_qualifier_verdict("biolink:object_aspect_qualifier", "activity")
+        assert verdict.outcome == "invalid"
+        assert verdict.reason == "unexpected qualifier failure"
+    # the Toolkit is not retried for a failing qualifier
+    assert calls == ["activity"]
@@ -3,6 +3,7 @@ Unit tests for the generic (shared) components of the SRI Testing Framework
 """
 from typing import List, Dict, Optional
 from sys import stderr
+from json import dumps
 
 import logging
 
@@ -16,7 +17,11 @@ from reasoner_validator.trapi import (
     TRAPI_1_3_0,
     TRAPI_1_4_2
 )
-from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator.trapi.lazy import MappedResponse, LazyElements
+from reasoner_validator.trapi.stream import Deferred
+from reasoner_validator.biolink import index as biolink_index
+from reasoner_validator.message import MessageType
+from reasoner_validator.validator import TRAPIResponseValidator, validate_many
 
 from tests import (
     LATEST_TRAPI_RELEASE,
@@ -458,6 +463,117 @@ def test_conservation_of_response_object():
     assert not list(diff(input_response, reference_response))
 
 
+def test_incremental_kg_validation():
+    knowledge_graph: Dict = {
+        "nodes": {
+            node_id: {"categories": ["biolink:Gene"], "attributes": []}
+            for node_id in ["NCBIGene:1", "NCBIGene:2"]
+        },
+        "edges": {
+            edge_id: {
+                "subject": "NCBIGene:1",
+                "predicate": "biolink:related_to",
+                "object": "NCBIGene:2",
+                "sources": [{"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"}],
+                "attributes": []
+            } for edge_id in ["e1", "e2", "e3"]
+        }
+    }
+    knowledge_graph["edges"]["e1"].pop("predicate")
+    knowledge_graph["edges"]["e3"].pop("object")
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(biolink_version="suppress")
+    validator.has_valid_knowledge_graph(message={"knowledge_graph": knowledge_graph})
+    messages = validator.get_all_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    assert len(messages[validator.get_trapi_version()]) == 1
+
+    # each invalid edge is reported, at its JSON path in the knowledge graph
+    validator = TRAPIResponseValidator(biolink_version="suppress", incremental_kg_validation=True)
+    validator.has_valid_knowledge_graph(message={"knowledge_graph": knowledge_graph})
+    messages = validator.get_all_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    json_paths: List[str] = [message["json_path"] for message in messages[validator.get_trapi_version()]]
+    assert json_paths == ["$.edges.e1", "$.edges.e3"]
+
+
+def test_validate_many():
+    responses: List[Dict] = [
+        _TEST_TRAPI_1_4_2_FULL_SAMPLE,
+        _TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS,
+        {"message": {}},
+        # the same response may be validated more than once
+        _TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS
+    ]
+    targets: List[str] = [f"ARA {index}" for index in range(len(responses))]
+    validators: List[TRAPIResponseValidator] = validate_many(
+        responses, workers=3, targets=targets, trapi_version=PATCHED_140_SCHEMA_FILEPATH
+    )
+    assert [validator.get_default_target() for validator in validators] == targets
+    for response, validator in zip(responses, validators):
+        expected = TRAPIResponseValidator(
+            default_target=validator.get_default_target(),
+            trapi_version=PATCHED_140_SCHEMA_FILEPATH
+        )
+        expected.check_compliance_of_trapi_response(response=deepcopy(response))
+        assert validator.get_all_messages() == expected.get_all_messages()
+    assert validators[1].has_messages()
+
+    merged: TRAPIResponseValidator = validate_many(
+        responses, workers=3, targets=targets, merge=True, trapi_version=PATCHED_140_SCHEMA_FILEPATH
+    )
+    expected = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    for validator in validators:
+        expected.merge(validator)
+    assert list(merged.get_all_messages().keys()) == targets
+    assert merged.get_all_messages() == expected.get_all_messages()
+
+
+def test_validate_many_threads_share_biolink_index(monkeypatch):
+    # various edges, whose predicates, qualifiers and associations are looked up
+    # (and memoized) by the Biolink Model index shared by the concurrent validators
+    predicates: List[str] = [
+        "biolink:ameliorates_condition",
+        "biolink:treats",
+        "related to",
+        "interacts with",
+        "biolink:affects",
+        "biolink:contributor",
+        "biolink:not_a_predicate"
+    ]
+    aspects: List[str] = ["activity", "abundance", "not_an_aspect"]
+    responses: List[Optional[Dict]] = [{"message": {}}]
+    for index in range(21):
+        response: Dict = deepcopy(_TEST_TRAPI_1_4_2_FULL_SAMPLE)
+        edge: Dict = response["message"]["knowledge_graph"]["edges"]["df87ff82"]
+        edge["predicate"] = predicates[index % len(predicates)]
+        edge["qualifiers"] = [
+            {"qualifier_type_id": "biolink:object_aspect_qualifier", "qualifier_value": aspects[index % len(aspects)]}
+        ]
+        responses.append(response)
+
+    # each run starts from a new (empty) Biolink Model index
+    monkeypatch.setattr(biolink_index, "_biolink_indices", dict())
+    serial: List[TRAPIResponseValidator] = validate_many(responses, trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    monkeypatch.setattr(biolink_index, "_biolink_indices", dict())
+    threaded: List[TRAPIResponseValidator] = validate_many(
+        responses, workers=8, trapi_version=PATCHED_140_SCHEMA_FILEPATH
+    )
+    assert any(validator.has_errors() for validator in serial)
+    assert [dumps(validator.get_all_messages()) for validator in threaded] == \
+        [dumps(validator.get_all_messages()) for validator in serial]
+
+
+def test_columnar_message_store():
+    nested = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    nested.check_compliance_of_trapi_response(response=deepcopy(_TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS))
+    columnar = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH, message_store="columnar")
+    columnar.check_compliance_of_trapi_response(
+        response=deepcopy(_TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS)
+    )
+    assert columnar.has_messages()
+    assert columnar.has_errors() == nested.has_errors()
+    assert columnar.get_all_messages() == nested.get_all_messages()
+
+
 @pytest.mark.parametrize(
     "trapi_version,outcome",
     [
@@ -1257,6 +1373,256 @@ def test_dump_report_of_biolink_model_compliance_of_trapi_response_with_errors(r
     print("\n"+"="*80+"\n", file=stderr)
 
 
+@pytest.mark.parametrize(
+    "response,max_kg_edges",
+    [
+        (_TEST_TRAPI_1_4_2_FULL_SAMPLE, 0),
+        (_TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS, 0),
+        (_TEST_TRAPI_1_4_2_FULL_SAMPLE_WITH_REPORTABLE_ERRORS, 1),
+        ({"message": {}}, 0)
+    ]
+)
+def test_check_compliance_of_trapi_response_file(tmp_path, response: Dict, max_kg_edges: int):
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(response))
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    sample: Optional[Dict] = validator.check_compliance_of_trapi_response_file(
+        response_file=str(response_file),
+        max_kg_edges=max_kg_edges
+    )
+
+    # same outcome as the validation of the Response loaded in memory
+    expected: TRAPIResponseValidator = TRAPIResponseValidator(
+        trapi_version=PATCHED_140_SCHEMA_FILEPATH,
+        incremental_kg_validation=True
+    )
+    expected.check_compliance_of_trapi_response(response=deepcopy(response), max_kg_edges=max_kg_edges)
+    assert validator.get_all_messages() == expected.get_all_messages()
+
+    if sample is not None:
+        assert sample["results"] == response["message"]["results"]
+        assert sample["knowledge_graph"] == response["message"]["knowledge_graph"]
+
+
+def test_check_compliance_of_trapi_response_file_results_reservoir(tmp_path):
+    response: Dict = {
+        "schema_version": "1.5.0",
+        "message": {
+            "query_graph": deepcopy(_TEST_QG_1),
+            "knowledge_graph": {
+                "nodes": {
+                    TYPE_2_DIABETES_CURIE: {"name": "type-2 diabetes", "categories": ["biolink:Disease"]},
+                    METFORMIN_CURIE: {"name": "metformin", "categories": ["biolink:Drug"]}
+                },
+                "edges": {
+                    "df87ff82": {
+                        "subject": METFORMIN_CURIE,
+                        "predicate": "biolink:ameliorates_condition",
+                        "object": TYPE_2_DIABETES_CURIE,
+                        "sources": _TEST_KG_EDGE_SOURCES
+                    }
+                }
+            }
+        }
+    }
+    response["message"]["results"] = [
+        {
+            "node_bindings": {
+                "type-2 diabetes": [{"id": TYPE_2_DIABETES_CURIE}],
+                "drug": [{"id": METFORMIN_CURIE}]
+            },
+            "analyses": [
+                {
+                    "resource_id": "infores:ara0",
+                    "edge_bindings": {"treats": [{"id": "df87ff82"}]},
+                    "score": index
+                }
+            ]
+        } for index in range(25)
+    ]
+    # a schema-invalid Result
+    response["message"]["results"][17]["node_bindings"] = "not-an-object"
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(response))
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    sample: Optional[Dict] = validator.check_compliance_of_trapi_response_file(
+        response_file=str(response_file),
+        max_results=20,
+        reservoir_size=5
+    )
+    assert sample is not None
+    assert len(sample["results"]) == 5
+    assert all(result["analyses"][0]["score"] < 20 for result in sample["results"])
+    messages = validator.get_all_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    json_paths: List[str] = [message["json_path"] for message in messages[validator.get_trapi_version()]]
+    assert json_paths == ["$[17].node_bindings"]
+
+
+@pytest.mark.parametrize("max_kg_edges", [0, 2])
+def test_check_compliance_of_mapped_trapi_response(tmp_path, max_kg_edges: int):
+    response: Dict = {
+        "schema_version": "1.5.0",
+        "message": {
+            "query_graph": deepcopy(_TEST_QG_1),
+            "knowledge_graph": {
+                "nodes": {
+                    TYPE_2_DIABETES_CURIE: {"name": "type-2 diabetes", "categories": ["biolink:Disease"]},
+                    METFORMIN_CURIE: {"name": "metformin", "categories": ["biolink:Drug"]},
+                    "CHEBI:0000001": {"name": "unused", "categories": ["biolink:Drug"]}
+                },
+                "edges": {
+                    f"e{index}": {
+                        "subject": METFORMIN_CURIE,
+                        # the last edge has an invalid predicate
+                        "predicate": "biolink:ameliorates_condition" if index < 3 else "biolink:not_a_predicate",
+                        "object": TYPE_2_DIABETES_CURIE,
+                        "sources": _TEST_KG_EDGE_SOURCES
+                    } for index in range(4)
+                }
+            },
+            "results": []
+        }
+    }
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(response))
+
+    validator: TRAPIResponseValidator = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+    validator.check_compliance_of_trapi_response(response=deepcopy(response), max_kg_edges=max_kg_edges)
+
+    with MappedResponse(str(response_file)) as mapped_response:
+        graph: Dict = mapped_response["message"]["knowledge_graph"]
+        assert isinstance(graph["edges"], LazyElements)
+        if max_kg_edges:
+            kg_sample: Dict = TRAPIResponseValidator.sample_graph(graph, edges_limit=max_kg_edges)
+            assert list(kg_sample["edges"]) == ["e0", "e1"]
+            assert list(kg_sample["nodes"]) == [METFORMIN_CURIE, TYPE_2_DIABETES_CURIE]
+            assert kg_sample["edges"]["e0"] == response["message"]["knowledge_graph"]["edges"]["e0"]
+
+        mapped_validator: TRAPIResponseValidator = TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH)
+        mapped_validator.check_compliance_of_trapi_response(response=mapped_response, max_kg_edges=max_kg_edges)
+
+    assert mapped_validator.get_all_messages() == validator.get_all_messages()
+    assert mapped_validator.has_errors() == (not max_kg_edges)
+
+
+def _sampled_response() -> Dict:
+    # edges mostly of one predicate, then a few of another predicate, as KPs tend to group edges
+    return {
+        "schema_version": "1.5.0",
+        "message": {
+            "query_graph": deepcopy(_TEST_QG_1),
+            "knowledge_graph": {
+                "nodes": {
+                    TYPE_2_DIABETES_CURIE: {"name": "type-2 diabetes", "categories": ["biolink:Disease"]},
+                    METFORMIN_CURIE: {"name": "metformin", "categories": ["biolink:Drug"]}
+                },
+                "edges": {
+                    f"e{index}": {
+                        "subject": METFORMIN_CURIE,
+                        "predicate": "biolink:ameliorates_condition" if index < 45 else "biolink:treats",
+                        "object": TYPE_2_DIABETES_CURIE,
+                        "sources": _TEST_KG_EDGE_SOURCES
+                    } for index in range(50)
+                }
+            },
+            "results": [
+                {
+                    "node_bindings": {
+                        "type-2 diabetes": [{"id": TYPE_2_DIABETES_CURIE}],
+                        "drug": [{"id": METFORMIN_CURIE}]
+                    },
+                    "analyses": [
+                        {
+                            "resource_id": "infores:ara0" if index < 45 else "infores:ara1",
+                            "edge_bindings": {"treats": [{"id": f"e{index}"}]}
+                        }
+                    ]
+                } for index in range(50)
+            ]
+        }
+    }
+
+
+@pytest.mark.parametrize("mode", ["memory", "mapped", "stream"])
+@pytest.mark.parametrize("sampling", ["first", "random", "stratified", "reservoir"])
+def test_sampling_of_trapi_response(tmp_path, mode: str, sampling: str):
+    response: Dict = _sampled_response()
+    # a schema-invalid Result, among the last (rarer) kind of Results
+    response["message"]["results"][47]["node_bindings"] = "not-an-object"
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(response))
+
+    messages: List[Dict] = list()
+    for _ in range(2):
+        validator = TRAPIResponseValidator(
+            trapi_version=PATCHED_140_SCHEMA_FILEPATH,
+            sampling=sampling,
+            sampling_seed=12345
+        )
+        if mode == "memory":
+            validator.check_compliance_of_trapi_response(response=deepcopy(response), max_kg_edges=5, max_results=5)
+        elif mode == "mapped":
+            with MappedResponse(str(response_file)) as mapped_response:
+                validator.check_compliance_of_trapi_response(response=mapped_response, max_kg_edges=5, max_results=5)
+        else:
+            validator.check_compliance_of_trapi_response_file(
+                response_file=str(response_file), max_kg_edges=5, max_results=5
+            )
+        messages.append(validator.get_all_messages())
+
+    # seeded samples are reproducible
+    assert messages[0] == messages[1]
+    if sampling == "first":
+        # only the first Results are validated
+        assert not validator.has_critical()
+    elif sampling == "stratified":
+        # strata take turns, hence all the Results of the rarer kind are validated, reported at their index
+        critical = validator.get_all_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+        json_paths: List[str] = [message["json_path"] for message in critical[validator.get_trapi_version()]]
+        assert json_paths == ["$[47].node_bindings"]
+
+
+@pytest.mark.parametrize("sampling", ["first", "random", "stratified", "reservoir"])
+def test_sample_graph_strategies(tmp_path, sampling: str):
+    response: Dict = _sampled_response()
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(response))
+    graph: Dict = response["message"]["knowledge_graph"]
+
+    samples: List[Dict] = [
+        TRAPIResponseValidator.sample_graph(graph, edges_limit=6, strategy=sampling, seed=7),
+        TRAPIResponseValidator.sample_graph_file(
+            str(response_file), {"nodes": Deferred(dict), "edges": Deferred(dict)},
+            edges_limit=6, strategy=sampling, seed=7
+        )
+    ]
+    with MappedResponse(str(response_file)) as mapped_response:
+        samples.append(
+            TRAPIResponseValidator.sample_graph(
+                mapped_response["message"]["knowledge_graph"], edges_limit=6, strategy=sampling, seed=7
+            )
+        )
+    edge_ids: List[str] = list(samples[0]["edges"])
+    assert len(edge_ids) == 6
+    assert len(samples[0]["nodes"]) == 2
+    if sampling != "random":
+        # but for the random sampling of edges of unknown number (a reservoir sampling),
+        # the same edges are sampled from a Knowledge Graph in memory or in a file
+        assert all(sample == samples[0] for sample in samples)
+    if sampling == "first":
+        assert edge_ids == [f"e{index}" for index in range(6)]
+    elif sampling == "stratified":
+        # both predicates take turns
+        assert sum(graph["edges"][edge_id]["predicate"] == "biolink:treats" for edge_id in edge_ids) == 3
+
+
+def test_unknown_sampling_strategy():
+    with pytest.raises(ValueError):
+        TRAPIResponseValidator(trapi_version=PATCHED_140_SCHEMA_FILEPATH, sampling="last")
+
+
 @pytest.mark.parametrize(
     "source_categories,target_categories,category_matched",
     [
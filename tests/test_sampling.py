@@ -0,0 +1,74 @@
+"""
+Unit tests of the sampling strategies of Knowledge Graph edges and Results
+"""
+from typing import List
+
+import pytest
+
+from reasoner_validator.sampling import SAMPLING_STRATEGIES, Sampler, sample_indices, edge_stratum, result_stratum
+
+
+@pytest.mark.parametrize("strategy", SAMPLING_STRATEGIES)
+def test_sampler(strategy: str):
+    samples: List[List[int]] = list()
+    for _ in range(2):
+        sampler = Sampler(size=10, strategy=strategy, seed=42)
+        for item in range(1000):
+            sampler.add(item, stratum="rare" if item >= 995 else "common")
+        samples.append(sampler.sample())
+    # seeded samples are reproducible
+    assert samples[0] == samples[1]
+    sample: List[int] = samples[0]
+    assert len(sample) == 10
+    assert sample == sorted(set(sample))
+    if strategy == "first":
+        assert sample == list(range(10))
+    elif strategy == "stratified":
+        # strata take turns, hence all the items of the rare stratum are sampled
+        assert sample[-5:] == [995, 996, 997, 998, 999]
+    else:
+        assert sample != list(range(10))
+
+
+def test_sampler_of_few_items():
+    sampler = Sampler(size=10, strategy="stratified", seed=1)
+    for item in range(3):
+        sampler.add(item, stratum=item % 2)
+    assert sampler.sample() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("strategy", SAMPLING_STRATEGIES)
+def test_sample_indices(strategy: str):
+    assert sample_indices(5, 10, strategy=strategy, seed=1) == [0, 1, 2, 3, 4]
+    indices: List[int] = sample_indices(1000, 10, strategy=strategy, seed=1)
+    assert indices == sample_indices(1000, 10, strategy=strategy, seed=1)
+    assert len(indices) == 10 and indices == sorted(set(indices))
+
+
+def test_unknown_sampling_strategy():
+    with pytest.raises(ValueError):
+        Sampler(size=10, strategy="last")
+
+
+def test_strata():
+    assert edge_stratum(
+        {
+            "predicate": "biolink:treats",
+            "sources": [
+                {"resource_id": "infores:aggregator", "resource_role": "aggregator_knowledge_source"},
+                {"resource_id": "infores:primary", "resource_role": "primary_knowledge_source"}
+            ]
+        }
+    ) == ("biolink:treats", "infores:primary")
+    assert edge_stratum(
+        {
+            "predicate": "biolink:treats",
+            "attributes": [{"attribute_type_id": "biolink:primary_knowledge_source", "value": "infores:primary"}]
+        }
+    ) == ("biolink:treats", "infores:primary")
+    assert edge_stratum({"predicate": ["biolink:treats"]}) == (None, None)
+    assert edge_stratum("not-an-edge") == (None, None)
+    assert result_stratum(
+        {"analyses": [{"resource_id": "infores:b"}, {"resource_id": "infores:a"}, {"resource_id": "infores:b"}]}
+    ) == ("infores:a", "infores:b")
+    assert result_stratum({"node_bindings": {}}) == ()
@@ -0,0 +1,101 @@
+"""Test the on-disk cache of converted TRAPI schemata."""
+from typing import Dict
+from os import listdir, utime
+from time import time
+
+import pytest
+
+from reasoner_validator.trapi import get_schema_components, TRAPIAccessError
+from reasoner_validator import trapi
+from reasoner_validator.trapi.schema_cache import (
+    get_schema_cache_dir,
+    MAX_CACHED_LOCAL_SCHEMATA,
+    schema_hash,
+    read_cached_schema,
+    write_cached_schema
+)
+from tests import PATCHED_140_SCHEMA_FILEPATH
+
+
+@pytest.fixture
+def schema_cache_dir(tmp_path, monkeypatch) -> str:
+    monkeypatch.setenv("TRAPI_SCHEMA_CACHE_DIR", str(tmp_path))
+    return get_schema_cache_dir()
+
+
+def test_schema_cache_disabled(monkeypatch):
+    monkeypatch.setenv("TRAPI_SCHEMA_CACHE_DIR", "")
+    assert get_schema_cache_dir() is None
+    assert read_cached_schema("v1.5.0") is None
+    assert write_cached_schema("v1.5.0", schema_hash("some schema"), {"Query": {}}) is None
+
+
+def test_write_then_read_cached_schema(schema_cache_dir):
+    assert read_cached_schema("v1.5.0") is None
+    old_hash: str = schema_hash("old schema")
+    write_cached_schema("v1.5.0", old_hash, {"Query": {"type": "object"}})
+    assert read_cached_schema("v1.5.0") == {"Query": {"type": "object"}}
+    assert read_cached_schema("v1.5.0", content_hash=old_hash) == {"Query": {"type": "object"}}
+
+    # a new schema content for the same version replaces the old one
+    new_hash: str = schema_hash("new schema")
+    write_cached_schema("v1.5.0", new_hash, {"Query": {"type": "array"}})
+    assert read_cached_schema("v1.5.0") == {"Query": {"type": "array"}}
+    assert read_cached_schema("v1.5.0", content_hash=old_hash) is None
+    assert listdir(schema_cache_dir) == [f"v1.5.0.{new_hash}.json"]
+
+
+def test_schema_file_conversion_is_cached(schema_cache_dir):
+    components: Dict = get_schema_components(PATCHED_140_SCHEMA_FILEPATH)
+    assert "Query" in components
+    assert len(listdir(schema_cache_dir)) == 1
+    # second time around, the converted schema is read back from the cache
+    assert get_schema_components(PATCHED_140_SCHEMA_FILEPATH) == components
+
+
+def test_cached_local_schema_conversions_are_purged(schema_cache_dir):
+    for index in range(MAX_CACHED_LOCAL_SCHEMATA + 2):
+        write_cached_schema(
+            "local_file", schema_hash(f"local schema {index}"), {"Query": {}}, keep=MAX_CACHED_LOCAL_SCHEMATA
+        )
+    assert len(listdir(schema_cache_dir)) == MAX_CACHED_LOCAL_SCHEMATA
+    assert read_cached_schema("local_file", content_hash=schema_hash("local schema 0")) is None
+    assert read_cached_schema("local_file", content_hash=schema_hash(f"local schema {MAX_CACHED_LOCAL_SCHEMATA}"))
+
+
+def test_offline_schema_mode(schema_cache_dir, monkeypatch):
+    monkeypatch.setenv("TRAPI_SCHEMA_OFFLINE", "true")
+    with pytest.raises(TRAPIAccessError):
+        get_schema_components("v1.5.0")
+    # local schema files remain accessible
+    assert get_schema_components(PATCHED_140_SCHEMA_FILEPATH)
+
+
+def test_cached_branch_schema_expiry(schema_cache_dir, monkeypatch):
+    with open(PATCHED_140_SCHEMA_FILEPATH, "r") as schema_file:
+        schema_text: str = schema_file.read()
+    monkeypatch.setattr(trapi, "_fetch_schema_text", lambda schema_version: schema_text)
+    monkeypatch.setenv("TRAPI_SCHEMA_BRANCH_TTL", "60")
+    an_hour_ago: float = time() - 3600
+    for version in ["v1.5.0", "master"]:
+        utime(
+            write_cached_schema(version, schema_hash(f"old {version} schema"), {"Query": {"type": "object"}}),
+            (an_hour_ago, an_hour_ago)
+        )
+
+    # release schemata never expire...
+    assert get_schema_components("v1.5.0") == {"Query": {"type": "object"}}
+    assert read_cached_schema("master") == {"Query": {"type": "object"}}
+    assert read_cached_schema("master", max_age=60) is None
+
+    # ...but expired branch schemata are used offline only
+    monkeypatch.setenv("TRAPI_SCHEMA_OFFLINE", "true")
+    assert get_schema_components("master") == {"Query": {"type": "object"}}
+    monkeypatch.delenv("TRAPI_SCHEMA_OFFLINE")
+    components: Dict = get_schema_components("master")
+    assert "Response" in components
+    assert read_cached_schema("master", max_age=60) == components
+    assert sorted(listdir(schema_cache_dir)) == [
+        f"master.{schema_hash(schema_text)}.json",
+        f"v1.5.0.{schema_hash('old v1.5.0 schema')}.json"
+    ]
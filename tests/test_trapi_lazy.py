@@ -0,0 +1,69 @@
+"""
+Unit tests of the memory-mapped TRAPI Response JSON files, with lazily decoded Knowledge Graph nodes and edges
+"""
+from typing import Dict
+from json import dumps
+
+import pytest
+
+from reasoner_validator.trapi.lazy import MappedResponse, LazyElements
+
+SAMPLE_RESPONSE: Dict = {
+    "schema_version": "1.5.0",
+    "message": {
+        "query_graph": {"nodes": {"n0": {"ids": ["MONDO:0005148"]}}, "edges": {}},
+        "knowledge_graph": {
+            "nodes": {
+                "MONDO:0005148": {"name": "type-2 \"diabetes\" {[", "categories": ["biolink:Disease"]},
+                "CHEBI:6801": {"name": "metformine à été", "categories": ["biolink:Drug"]},
+                "ESCAPED:\"id\"": {"categories": [[[[[[[[[[[[[[[[[["biolink:NamedThing"]]]]]]]]]]]]]]]]]]}
+            },
+            "edges": {
+                "e0": {
+                    "subject": "CHEBI:6801",
+                    "predicate": "biolink:treats",
+                    "object": "MONDO:0005148",
+                    "attributes": [{"attribute_type_id": "biolink:p_value", "value": 1.5e-07}]
+                }
+            }
+        },
+        "results": [{"score": 1.5e-07, "note": "à" * 70000}, {"score": -12345678901234}, {"score": None}]
+    },
+    "status": "Success"
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_mapped_response(tmp_path, indent):
+    response_file = tmp_path / "response.json"
+    response_file.write_text(dumps(SAMPLE_RESPONSE, indent=indent, ensure_ascii=indent is None), encoding="utf-8")
+    with MappedResponse(str(response_file)) as response:
+        knowledge_graph = response["message"]["knowledge_graph"]
+        assert isinstance(knowledge_graph["nodes"], LazyElements)
+        assert isinstance(knowledge_graph["edges"], LazyElements)
+        assert list(knowledge_graph["nodes"]) == list(SAMPLE_RESPONSE["message"]["knowledge_graph"]["nodes"])
+        assert "ESCAPED:\"id\"" in knowledge_graph["nodes"]
+        assert "CHEBI:0000000" not in knowledge_graph["nodes"]
+        assert len(knowledge_graph["edges"]) == 1
+        assert knowledge_graph["edges"]["e0"] == SAMPLE_RESPONSE["message"]["knowledge_graph"]["edges"]["e0"]
+        for tag in ["nodes", "edges"]:
+            knowledge_graph[tag] = dict(knowledge_graph[tag])
+        assert response == SAMPLE_RESPONSE
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        '{"message": {"knowledge_graph": {"nodes": {"a": {"name": "x"}, "b"}}}}',
+        '{"message": {"knowledge_graph": {"nodes": {"a": 1}}} "status": 1}',
+        '{"message": {"results": [1, 2}}',
+        '{"message": {}} []'
+    ]
+)
+def test_mapped_response_invalid_json(tmp_path, text: str):
+    response_file = tmp_path / "response.json"
+    response_file.write_text(text)
+    with pytest.raises(ValueError):
+        with MappedResponse(str(response_file)):
+            pass
@@ -0,0 +1,98 @@
+"""
+Unit tests of the incremental reader of TRAPI JSON documents
+"""
+from typing import Dict
+from io import StringIO
+import builtins
+from json import dumps
+
+import pytest
+
+from reasoner_validator.trapi import stream
+from reasoner_validator.trapi.stream import JSONStreamReader, Deferred, open_stream
+
+SAMPLE_DOCUMENT: Dict = {
+    "schema_version": "1.5.0",
+    "message": {
+        "query_graph": {"nodes": {"n0": {"ids": ["MONDO:0005148"]}}, "edges": {}},
+        "knowledge_graph": {
+            "nodes": {
+                "MONDO:0005148": {"name": "type-2 \"diabetes\" {[", "categories": ["biolink:Disease"]},
+                "CHEBI:6801": {"name": "metformin", "categories": ["biolink:Drug"]}
+            },
+            "edges": {}
+        },
+        "results": [{"score": 1.5e-07}, {"score": -12345678901234}, {"score": None}]
+    },
+    "status": "Success"
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 65536])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_stream_reader(chunk_size: int, indent):
+    text: str = dumps(SAMPLE_DOCUMENT, indent=indent)
+
+    reader = JSONStreamReader(StringIO(text), chunk_size=chunk_size)
+    assert reader.read_value() == SAMPLE_DOCUMENT
+    assert reader.peek() == ""
+
+    reader = JSONStreamReader(StringIO(text), chunk_size=chunk_size)
+    assert reader.find("message", "knowledge_graph", "nodes")
+    assert dict(reader.iter_items()) == SAMPLE_DOCUMENT["message"]["knowledge_graph"]["nodes"]
+
+    reader = JSONStreamReader(StringIO(text), chunk_size=chunk_size)
+    assert reader.find("message", "results")
+    assert list(reader.iter_values()) == SAMPLE_DOCUMENT["message"]["results"]
+
+    reader = JSONStreamReader(StringIO(text), chunk_size=chunk_size)
+    assert reader.find("status")
+    assert reader.read_value() == "Success"
+
+    reader = JSONStreamReader(StringIO(text), chunk_size=chunk_size)
+    assert not reader.find("message", "auxiliary_graphs")
+
+
+def test_json_stream_reader_outline():
+    reader = JSONStreamReader(StringIO(dumps(SAMPLE_DOCUMENT)), chunk_size=3)
+    outline = reader.read_outline(
+        deferred={
+            ("message", "knowledge_graph", "nodes"): dict,
+            ("message", "knowledge_graph", "edges"): dict,
+            # not an array, hence not deferred
+            ("message", "query_graph"): list,
+            ("message", "results"): list
+        }
+    )
+    assert reader.peek() == ""
+    assert isinstance(outline["message"]["knowledge_graph"]["nodes"], Deferred)
+    # empty JSON objects or arrays are not deferred
+    assert outline["message"]["knowledge_graph"]["edges"] == {}
+    assert outline["message"]["query_graph"] == SAMPLE_DOCUMENT["message"]["query_graph"]
+    assert outline["message"]["results"].container is list
+    assert outline["status"] == "Success"
+
+
+@pytest.mark.parametrize("text", ['{"a": [1, 2', '{"a" 1}', '{"a": 1 "b": 2}', '[1, 2'])
+def test_json_stream_reader_invalid_json(text: str):
+    with pytest.raises(ValueError):
+        JSONStreamReader(StringIO(text), chunk_size=2).read_value()
+    with pytest.raises(ValueError):
+        list(JSONStreamReader(StringIO(text), chunk_size=2).iter_items())
+
+
+def test_open_stream_is_utf8(tmp_path, monkeypatch):
+    response_file = tmp_path / "response.json"
+    nodes: Dict = {"CHEBI:6801": {"name": "metformine (β-biguanide)"}}
+    response_file.write_text(
+        dumps({"message": {"knowledge_graph": {"nodes": nodes}}}, ensure_ascii=False),
+        encoding="utf-8"
+    )
+
+    # as if opening text files in a non UTF-8 (e.g. Latin-1) locale
+    def latin_1_open(file, mode="r", *args, encoding="latin-1", **kwargs):
+        return builtins.open(file, mode, *args, encoding=encoding, **kwargs)
+
+    monkeypatch.setattr(stream, "open", latin_1_open, raising=False)
+    with open_stream(str(response_file), "message", "knowledge_graph", "nodes") as reader:
+        assert dict(reader.iter_items()) == nodes
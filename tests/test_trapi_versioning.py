@@ -1,10 +1,11 @@
 """Test TRAPI version handling."""
 from typing import Dict, Optional
+import logging
 
 import pytest
 
 from reasoner_validator.versioning import get_latest_version
-from reasoner_validator.trapi import load_schema, TRAPIAccessError, LATEST_TRAPI_RELEASE
+from reasoner_validator.trapi import load_schema, TRAPIAccessError, TRAPISchemaValidator, LATEST_TRAPI_RELEASE
 from tests import PATCHED_140_SCHEMA_FILEPATH
 
 
@@ -66,3 +67,20 @@ def test_load_schema_with_schema_file_spec_trapi_version():
     assert schema
     with pytest.raises(TRAPIAccessError):
         load_schema(target="not-a-trapi-schema.yaml")
+
+
+def test_load_schema_components_share_one_catalog():
+    schema: Dict = load_schema(PATCHED_140_SCHEMA_FILEPATH)
+    assert schema["Query"]["$ref"] == "#/components/schemas/Query"
+    # all component schemas refer to the same (not copied) catalog of components
+    assert schema["Query"]["components"] is schema["Result"]["components"]
+
+
+def test_branch_name_trapi_version_features(caplog):
+    # a Git branch resolves to the TRAPI features of the latest release, without any (SemVer) error
+    with caplog.at_level(logging.ERROR):
+        validator = TRAPISchemaValidator(trapi_version="master")
+    assert validator.get_trapi_version() == "master"
+    assert not caplog.records
+    assert validator.trapi_has_qualifiers
+    assert validator.trapi_has_sources
@@ -7,10 +7,13 @@ import pytest
 
 from jsonschema.exceptions import ValidationError
 
+from reasoner_validator.message import MessageType
 from reasoner_validator.trapi import (
     TRAPISchemaValidator,
     openapi_to_jsonschema,
     load_schema,
+    get_validator,
+    get_compiled_validator,
     LATEST_TRAPI_RELEASE
 )
 from tests import (
@@ -101,6 +104,101 @@ def test_load_master_schema():
     assert schema, "TRAPI Schema for ('master') branch is not available?"
 
 
+@pytest.mark.parametrize("trapi_version", LATEST_TEST_RELEASES)
+def test_get_validator_is_cached(trapi_version: str):
+    """Test that a single validator is built per TRAPI version and component."""
+    validator = get_validator(trapi_version, "Result")
+    assert validator is get_validator(trapi_version, "Result")
+    assert validator is not get_validator(trapi_version, "Query")
+
+
+def test_is_valid_trapi_query_with_cached_validator():
+    validator = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE)
+    for _ in range(3):
+        validator.is_valid_trapi_query({"message": {}}, component="Query")
+    assert not validator.has_messages()
+    validator.is_valid_trapi_query({"foo": {}}, component="Query")
+    assert validator.has_critical()
+
+
+_FLAWED_RESULT: Dict = {
+    "node_bindings": {
+        "n0": [{"id": 1, "attributes": []}, {"id": 2, "attributes": []}],
+        "n1": "not-an-array"
+    },
+    "analyses": [{"edge_bindings": {}}]
+}
+
+
+def test_report_all_schema_errors():
+    validator = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE)
+    validator.is_valid_trapi_query(_FLAWED_RESULT, component="Result")
+    messages = validator.get_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    assert len(messages[LATEST_TRAPI_RELEASE]) == 1
+
+    validator = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE, all_schema_errors=True)
+    validator.is_valid_trapi_query(_FLAWED_RESULT, component="Result")
+    messages = validator.get_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    json_paths = {message["json_path"]: message for message in messages[LATEST_TRAPI_RELEASE]}
+    # the two invalid node binding identifiers are grouped by schema path
+    assert json_paths["$.node_bindings.n0[0].id"]["occurrences"] == "2"
+    assert "$.node_bindings.n1" in json_paths
+    assert "$.analyses[0]" in json_paths
+    assert not validator.has_warnings()
+
+
+def test_report_all_schema_errors_is_capped():
+    validator = TRAPISchemaValidator(
+        trapi_version=LATEST_TRAPI_RELEASE,
+        all_schema_errors=True,
+        max_schema_errors=1
+    )
+    validator.is_valid_trapi_query(_FLAWED_RESULT, component="Result")
+    messages = validator.get_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    assert len(messages[LATEST_TRAPI_RELEASE]) == 1
+    assert "warning.trapi.validation.truncated" in validator.get_messages_of_type(MessageType.warning)
+
+
+def test_is_valid_trapi_array():
+    results = [deepcopy(_FLAWED_RESULT) for _ in range(3)]
+    results[1] = {"node_bindings": {}, "analyses": []}
+    validator = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE)
+    assert validator.is_valid_trapi_array(results, component="Result") == [0, 2]
+    messages = validator.get_messages_of_type(MessageType.critical)["critical.trapi.validation"]["global"]
+    assert [message["json_path"][0:4] for message in messages[LATEST_TRAPI_RELEASE]] == ["$[0]", "$[2]"]
+
+
+def test_is_valid_trapi_array_fail_fast():
+    results = [deepcopy(_FLAWED_RESULT) for _ in range(3)]
+    validator = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE)
+    assert validator.is_valid_trapi_array(results, component="Result", max_invalid=1) == [0]
+    assert "warning.trapi.validation.truncated" in validator.get_messages_of_type(MessageType.warning)
+
+
+@pytest.mark.parametrize("trapi_version", LATEST_TEST_RELEASES)
+def test_compiled_validator_agrees_with_jsonschema(trapi_version: str):
+    validator = get_validator(trapi_version, "Result")
+    is_valid = get_compiled_validator(trapi_version, "Result")
+    valid_result: Dict = {
+        "node_bindings": {"n0": [{"id": "NCBIGene:1", "attributes": []}]},
+        "analyses": [{"resource_id": "infores:molepro", "edge_bindings": {"e0": [{"id": "e0", "attributes": []}]}}]
+    }
+    for instance in [valid_result, _FLAWED_RESULT, {}, [], None, "Result"]:
+        assert is_valid(instance) == validator.is_valid(instance)
+
+
+def test_compiled_schema_backend():
+    reference = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE)
+    compiled = TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE, schema_backend="compiled")
+    for validator in [reference, compiled]:
+        validator.is_valid_trapi_query({"message": {}}, component="Query")
+        validator.is_valid_trapi_query(_FLAWED_RESULT, component="Result")
+        validator.is_valid_trapi_array([_FLAWED_RESULT], component="Result")
+    assert compiled.get_all_messages() == reference.get_all_messages()
+    with pytest.raises(ValueError):
+        TRAPISchemaValidator(trapi_version=LATEST_TRAPI_RELEASE, schema_backend="not-a-backend")
+
+
 def test_message():
     reporter = TRAPISchemaValidator(
         default_test="test_message",
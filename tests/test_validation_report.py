@@ -1,8 +1,10 @@
 """Testing Validation Report methods"""
 import copy
 import sys
+from json import dumps
 from typing import Optional, Dict, List
 from sys import stderr
+from io import StringIO
 
 import pytest
 
@@ -13,9 +15,11 @@ from reasoner_validator.message import (
     MESSAGE_PARTITION,
     MESSAGE_CATALOG,
     MESSAGES_BY_TEST,
-    MESSAGES_BY_TARGET
+    MESSAGES_BY_TARGET,
+    MessageRecord
 )
 from reasoner_validator.report import ValidationReporter, TRAPIGraphType
+from reasoner_validator.message_store import MESSAGE_STORES
 from reasoner_validator.validation_codes import CodeDictionary
 from reasoner_validator.versioning import get_latest_version
 
@@ -157,6 +161,28 @@ def test_get_entry():
     # Unknown code?
     assert CodeDictionary.get_code_entry("foo.bar") is None
 
+    # code entries are copies
+    code_entry[CodeDictionary.MESSAGE] = "Modified"
+    assert CodeDictionary.get_message_template("info.compliant") == "Biolink Model-compliant TRAPI Message"
+
+
+def test_get_code_table():
+    code_table = CodeDictionary.get_code_table()
+    assert code_table is CodeDictionary.get_code_table()
+    # all and only the leaf entries of the code dictionary tree
+    for code, entry in code_table.items():
+        message_type, leaf = CodeDictionary.get_code_subtree(code, is_leaf=True)
+        assert entry.message_type == message_type
+        assert entry.template == leaf[CodeDictionary.MESSAGE]
+        assert entry.context == (tuple(leaf[CodeDictionary.CONTEXT]) if CodeDictionary.CONTEXT in leaf else None)
+        assert entry.description == leaf.get(CodeDictionary.DESCRIPTION, None)
+    assert "info.compliant" in code_table
+    assert "info.query_graph" not in code_table
+    assert CodeDictionary.get_code_table_entry("info.query_graph") is None
+    assert CodeDictionary.get_code_table_entry(None) is None
+    with pytest.raises(TypeError):
+        code_table["foo.bar"] = code_table["info.compliant"]
+
 
 def test_get_message_template():
     assert CodeDictionary.get_message_template("") is None
@@ -512,8 +538,9 @@ full_test_messages_by_target: MESSAGES_BY_TARGET = {
 }
 
 
-def test_get_all_messages_of_type():
-    reporter = ValidationReporter()
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_get_all_messages_of_type(message_store: str):
+    reporter = ValidationReporter(message_store=message_store)
     # Load the reporter with several messages
     # across multiple test and target contexts
     reporter.add_messages(new_messages=full_test_messages_by_target)
@@ -538,6 +565,318 @@ def test_get_all_messages_of_type():
     _check_humpty_dumpty(messages[code_for_testing])
 
 
+def test_message_snapshots():
+    reporter = ValidationReporter()
+    reporter.add_messages(new_messages=full_test_messages_by_target)
+    reporter.report("info.excluded", target=critical_target, test=critical_test, identifier="Irene Molloy")
+    snapshot: MESSAGES_BY_TARGET = reporter.get_all_messages()
+    expected: MESSAGES_BY_TARGET = copy.deepcopy(snapshot)
+    assert reporter.to_dict()["messages"] is snapshot
+    warnings: MESSAGE_PARTITION = \
+        reporter.get_messages_of_type(MessageType.warning, test="new_test_1", target=critical_target)
+
+    # further messages are reported in copies of the message containers shared with the snapshots...
+    reporter.report("info.excluded", target=critical_target, test=critical_test, identifier="Barnaby Tucker")
+    reporter.report(
+        "warning.knowledge_graph.node.id.unmapped_prefix",
+        target=critical_target,
+        test="new_test_1",
+        source_trail="infores:earth -> infores:spaceship",
+        identifier="Will Robinson",
+        categories="Danger"
+    )
+    # (but for the message containers which were not modified)
+    assert reporter.get_all_messages()["new_target_2"] is snapshot["new_target_2"]
+    reporter.add_messages(new_messages=full_test_messages_by_target)
+    reporter.merge(reporter)
+
+    # ...hence, the snapshots are unchanged
+    assert snapshot == expected
+    assert warnings == expected[critical_target]["new_test_1"]["warning"]
+
+    messages: MESSAGES_BY_TARGET = reporter.get_all_messages()
+    assert messages is not snapshot
+    assert "Barnaby Tucker" in messages[critical_target][critical_test]["info"]["info.excluded"]["global"]
+    assert len(
+        messages[critical_target]["new_test_1"]["warning"]["warning.knowledge_graph.node.id.unmapped_prefix"][
+            "infores:earth -> infores:spaceship"]["Will Robinson"]
+    ) == 6
+
+    # a copy of the messages is not shared (and may be modified)
+    other = ValidationReporter()
+    other.add_messages(copy.deepcopy(messages))
+    assert other.get_all_messages() == messages
+
+
+def test_merge_shares_new_messages():
+    worker = ValidationReporter()
+    worker.report("info.excluded", source_trail="infores:earth", identifier="Will Robinson")
+    worker.report(
+        "warning.knowledge_graph.node.id.unmapped_prefix",
+        identifier="Will Robinson",
+        categories="Danger"
+    )
+    expected: MESSAGES_BY_TARGET = copy.deepcopy(worker.get_all_messages())
+
+    reporter = ValidationReporter()
+    reporter.report("info.excluded", identifier="Barnaby Tucker")
+    reporter.merge(worker)
+
+    # identified messages new to the reporter are shared with the worker, rather than copied...
+    worker_messages: MESSAGE_CATALOG = worker.get_messages_by_test()
+    messages: MESSAGE_CATALOG = reporter.get_messages_by_test()
+    assert messages["info"]["info.excluded"]["infores:earth"] is \
+        worker_messages["info"]["info.excluded"]["infores:earth"]
+    assert messages["info"]["info.excluded"]["global"] == {"Barnaby Tucker": None}
+
+    # ...until further messages are added to them, on either side
+    reporter.report("info.excluded", source_trail="infores:earth", identifier="Irene Molloy")
+    reporter.merge(worker)
+    worker.report(
+        "warning.knowledge_graph.node.id.unmapped_prefix",
+        identifier="Will Robinson",
+        categories="Aliens"
+    )
+    assert reporter.get_messages_by_test()["info"]["info.excluded"]["infores:earth"] == {
+        "Will Robinson": None,
+        "Irene Molloy": None
+    }
+    assert reporter.get_messages_by_test()["warning"]["warning.knowledge_graph.node.id.unmapped_prefix"] == {
+        "global": {"Will Robinson": [{"categories": "Danger"}, {"categories": "Danger"}]}
+    }
+    expected["Target"]["Test"]["warning"]["warning.knowledge_graph.node.id.unmapped_prefix"]["global"][
+        "Will Robinson"].append({"categories": "Aliens"})
+    assert worker.get_all_messages() == expected
+
+
+def test_columnar_message_store():
+    nested = ValidationReporter()
+    columnar = ValidationReporter(message_store="columnar")
+    for reporter in [nested, columnar]:
+        assert not reporter.has_messages()
+        reporter.report("info.compliant")
+        reporter.report("info.excluded", identifier="Irene Molloy")
+        reporter.report("info.excluded", identifier="Irene Molloy", reason="Fiancée", extra=["of", "Horace"])
+        reporter.report("warning.graph.empty", test="new_test_1", source_trail="infores:hello -> infores:dolly")
+        reporter.add_messages(new_messages=full_test_messages_by_target)
+        reporter.merge(reporter)
+        # the 'Irene Molloy' identifier is no longer parameterized
+        reporter.report("info.excluded", identifier="Irene Molloy")
+        reporter.report("error.trapi.response.empty", target=critical_target, test="new_test_3")
+
+    # the messages materialized from the columnar message store are identical, in the same order
+    assert dumps(columnar.get_all_messages()) == dumps(nested.get_all_messages())
+    assert columnar.get_all_messages() is columnar.to_dict()["messages"]
+    assert columnar.has_information() and not columnar.has_errors()
+    assert columnar.has_errors(target=critical_target, test="new_test_3")
+    assert columnar.dump_all_messages(test="new_test_1") == nested.dump_all_messages(test="new_test_1")
+    assert columnar.get_all_messages_of_type(MessageType.warning) == \
+        nested.get_all_messages_of_type(MessageType.warning)
+
+    columnar.messages = dict()
+    assert not columnar.get_all_messages()
+    assert len(columnar._store) == 0
+
+    with pytest.raises(ValueError):
+        ValidationReporter(message_store="flat")
+
+
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_message_caps(message_store: str):
+    reporter = ValidationReporter(message_store=message_store, max_code_messages=3, max_identifier_messages=2)
+    for index in range(10):
+        reporter.report("warning.knowledge_graph.node.name.missing", identifier=f"NCBIGene:{index}")
+        reporter.report(
+            "error.knowledge_graph.edge.predicate.abstract",
+            identifier="biolink:contributor",
+            edge_id=f"edge_{index}",
+            source_trail="infores:molepro" if index % 2 else "infores:arax"
+        )
+    reporter.report("info.compliant")
+    assert reporter.has_warnings() and reporter.has_errors()
+
+    warnings: MESSAGE_PARTITION = reporter.get_warnings()
+    assert list(warnings["warning.knowledge_graph.node.name.missing"]["global"]) == \
+        ["NCBIGene:0", "NCBIGene:1", "NCBIGene:2"]
+    # the scopes of the messages beyond the caps are still recorded
+    errors: SCOPED_MESSAGES = reporter.get_errors()["error.knowledge_graph.edge.predicate.abstract"]
+    assert len(errors["infores:arax"]["biolink:contributor"]) == 2
+    assert len(errors["infores:molepro"]["biolink:contributor"]) == 1
+    truncated = {
+        "Target": {
+            "Test": {
+                "warning.knowledge_graph.node.name.missing": 7,
+                "error.knowledge_graph.edge.predicate.abstract": 7
+            }
+        }
+    }
+    assert reporter.get_truncated_counts() == truncated
+    assert reporter.to_dict()["truncated"] == truncated
+    assert "truncated" not in ValidationReporter().to_dict()
+
+    # the numbers of messages only counted are also merged (with the merged parameterized messages, all beyond
+    # the caps of the reporter, now counted, whereas the merged messages only identified are already recorded)
+    reporter.merge(reporter)
+    assert reporter.get_truncated_counts()["Target"]["Test"] == {
+        "warning.knowledge_graph.node.name.missing": 14,
+        "error.knowledge_graph.edge.predicate.abstract": 17
+    }
+
+    # only the codes and scopes of identified messages are recorded
+    counter = ValidationReporter(message_store=message_store, counts_only=True)
+    counter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:0")
+    counter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:1", source_trail="infores:arax")
+    assert counter.has_warnings()
+    assert counter.get_warnings() == {"warning.knowledge_graph.node.name.missing": {"global": {}, "infores:arax": {}}}
+    assert counter.get_truncated_counts() == {"Target": {"Test": {"warning.knowledge_graph.node.name.missing": 2}}}
+
+
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_repeated_identifier_message_caps(message_store: str):
+    # a message only identified, reported again, is neither counted again against the caps nor as truncated
+    reporter = ValidationReporter(message_store=message_store, max_code_messages=2)
+    for identifier in ["NCBIGene:0", "NCBIGene:0", "NCBIGene:1", "NCBIGene:1", "NCBIGene:2", "NCBIGene:2"]:
+        reporter.report("warning.knowledge_graph.node.name.missing", identifier=identifier)
+    reporter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:0", source_trail="infores:arax")
+    assert reporter.get_warnings() == {
+        "warning.knowledge_graph.node.name.missing": {
+            "global": {"NCBIGene:0": None, "NCBIGene:1": None},
+            "infores:arax": {}
+        }
+    }
+    assert reporter.get_truncated_counts() == {"Target": {"Test": {"warning.knowledge_graph.node.name.missing": 2}}}
+
+    counter = ValidationReporter(message_store=message_store, counts_only=True)
+    counter.add_messages(reporter.get_all_messages())
+    counter.add_messages(reporter.get_all_messages())
+    counter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:1")
+    assert counter.get_truncated_counts() == {"Target": {"Test": {"warning.knowledge_graph.node.name.missing": 2}}}
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_merge_into_capped_reporter(message_store: str):
+    worker = ValidationReporter()
+    for index in range(100):
+        worker.report("warning.knowledge_graph.node.name.missing", identifier=f"NCBIGene:{index}")
+        worker.report(
+            "error.knowledge_graph.edge.predicate.abstract",
+            identifier="biolink:contributor",
+            edge_id=f"edge_{index}",
+            source_trail="infores:molepro"
+        )
+
+    # merged (or added) messages are capped as if reported one at a time
+    reporter = ValidationReporter(message_store=message_store, max_code_messages=3, max_identifier_messages=2)
+    reporter.report("warning.knowledge_graph.node.name.missing", identifier="MONDO:0005148")
+    reporter.merge(worker)
+    assert list(reporter.get_warnings()["warning.knowledge_graph.node.name.missing"]["global"]) == \
+        ["MONDO:0005148", "NCBIGene:0", "NCBIGene:1"]
+    assert reporter.get_errors()["error.knowledge_graph.edge.predicate.abstract"]["infores:molepro"] == {
+        "biolink:contributor": [{"edge_id": "edge_0"}, {"edge_id": "edge_1"}]
+    }
+    assert reporter.get_truncated_counts() == {
+        "Target": {
+            "Test": {
+                "warning.knowledge_graph.node.name.missing": 98,
+                "error.knowledge_graph.edge.predicate.abstract": 98
+            }
+        }
+    }
+
+    # only the codes and scopes of the messages are recorded
+    counter = ValidationReporter(message_store=message_store, counts_only=True)
+    counter.merge(worker)
+    assert counter.get_warnings() == {"warning.knowledge_graph.node.name.missing": {"global": None}}
+    assert counter.get_errors() == {"error.knowledge_graph.edge.predicate.abstract": {"infores:molepro": None}}
+    assert counter.get_truncated_counts() == {
+        "Target": {
+            "Test": {
+                "warning.knowledge_graph.node.name.missing": 100,
+                "error.knowledge_graph.edge.predicate.abstract": 100
+            }
+        }
+    }
+
+    # as are the messages imported from NDJSON
+    records = StringIO()
+    worker.export_ndjson(records)
+    records.seek(0)
+    importer = ValidationReporter(message_store=message_store, max_code_messages=10)
+    importer.import_ndjson(records)
+    assert len(importer.get_warnings()["warning.knowledge_graph.node.name.missing"]["global"]) == 10
+    assert importer.get_truncated_counts()["Target"]["Test"]["warning.knowledge_graph.node.name.missing"] == 90
+
+
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_ndjson_export(message_store: str):
+    reporter = ValidationReporter(message_store=message_store)
+    reporter.add_messages(new_messages=full_test_messages_by_target)
+    reporter.report("info.compliant")
+    reporter.report("info.excluded", identifier="Irene Molloy", reason="Fiancée", extra=["of", "Horace"])
+
+    records: List[MessageRecord] = list(reporter.iter_messages())
+    assert MessageRecord("Target", "Test", "info", "info.compliant", "global", None, None) in records
+    assert MessageRecord(
+        "Target", "Test", "info", "info.excluded", "global", "Irene Molloy",
+        {"reason": "Fiancée", "extra": ["of", "Horace"]}
+    ) in records
+
+    # messages reported during the iteration are not iterated over
+    for _ in reporter.iter_messages():
+        reporter.report("info.excluded", identifier="Barnaby Tucker")
+    assert MessageRecord("Target", "Test", "info", "info.excluded", "global", "Barnaby Tucker", None) \
+        not in records
+    assert len(list(reporter.iter_messages())) > len(records)
+
+    ndjson = StringIO()
+    count: int = reporter.export_ndjson(ndjson)
+    assert count == len(ndjson.getvalue().splitlines())
+
+    # the reporter rebuilt from the NDJSON records is the reporter merging the original one
+    for rebuilt_message_store in MESSAGE_STORES:
+        rebuilt = ValidationReporter(message_store=rebuilt_message_store)
+        assert rebuilt.import_ndjson(StringIO(ndjson.getvalue())) == count
+        expected = ValidationReporter()
+        expected.merge(reporter)
+        assert dumps(rebuilt.get_all_messages()) == dumps(expected.get_all_messages())
+
+    with pytest.raises(ValueError):
+        ValidationReporter().import_ndjson(['{"target": "Target", "test": "Test"}'])
+
+
+def test_message_store_records():
+    # both message stores iterate over (and export) the same records, in the same order,
+    # whichever identified messages are reported more than once, or superseded
+    reporters: List[ValidationReporter] = [
+        ValidationReporter(message_store=message_store) for message_store in MESSAGE_STORES
+    ]
+    for reporter in reporters:
+        reporter.report("info.compliant")
+        for _ in range(3):
+            reporter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:0")
+            reporter.report("info.excluded", identifier="Irene Molloy", reason="Fiancée")
+        reporter.report("info.compliant", identifier="Cornelius Hackl")
+        reporter.report("info.excluded", identifier="Irene Molloy")
+        reporter.report("warning.knowledge_graph.node.name.missing", identifier="NCBIGene:0", source_trail="infores:arax")
+
+        # the snapshots of the messages are not updated by further messages, whereas the
+        # messages materialized from the reported messages are (rather than rebuilt)
+        snapshot: MESSAGES_BY_TARGET = reporter.get_all_messages()
+        reporter.report("info.excluded", identifier="Barnaby Tucker", reason="Clerk")
+        assert "Barnaby Tucker" not in snapshot["Target"]["Test"]["info"]["info.excluded"]["global"]
+        catalog: MESSAGE_CATALOG = reporter.get_messages_by_test()
+        reporter.report("info.excluded", identifier="Horace Vandergelder")
+        assert reporter.get_messages_by_test() is catalog
+        assert list(catalog["info"]["info.excluded"]["global"]) == \
+            ["Irene Molloy", "Barnaby Tucker", "Horace Vandergelder"]
+
+    nested, columnar = reporters
+    records: List[MessageRecord] = list(nested.iter_messages())
+    assert list(columnar.iter_messages()) == records
+    assert len(records) == 6
+    nested_ndjson, columnar_ndjson = StringIO(), StringIO()
+    assert nested.export_ndjson(nested_ndjson) == columnar.export_ndjson(columnar_ndjson) == 6
+    assert columnar_ndjson.getvalue() == nested_ndjson.getvalue()
+
+
 def test_prefix_accessors():
     reporter = ValidationReporter()
     assert reporter.report_header().startswith("Validation Report\n")
@@ -558,10 +897,12 @@ def test_get_message_type():
         reporter.get_message_type(code="foo.bar")
 
 
-def test_global_sourced_validation_message_report():
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_global_sourced_validation_message_report(message_store: str):
     reporter1 = ValidationReporter(
         default_test="test_global_sourced_validation_message_report",
-        default_target="First Validation Report"
+        default_target="First Validation Report",
+        message_store=message_store
     )
     reporter1.report(code="info.compliant")
     reporter1.report(
@@ -580,10 +921,12 @@ def test_global_sourced_validation_message_report():
     assert "INFO - Input Edge Predicate: Edge has an 'abstract' predicate" in displayed
 
 
-def test_source_trail_scoped_validation_message_report():
+@pytest.mark.parametrize("message_store", MESSAGE_STORES)
+def test_source_trail_scoped_validation_message_report(message_store: str):
     reporter2 = ValidationReporter(
         default_test="test_source_trail_scoped_validation_message_report",
-        default_target="Second Validation Report"
+        default_target="Second Validation Report",
+        message_store=message_store
     )
     reporter2.report(
         code="error.knowledge_graph.edge.predicate.abstract",